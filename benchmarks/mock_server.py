@@ -0,0 +1,268 @@
+"""
+A local stand-in for the Inspirehep API to run benchmarks.
+
+The `MockInspireServer` replays recorded payloads for single records and
+builds search pages from them, with configurable latency and injection
+of 429 (Too Many Requests) responses. Point a client to it by setting
+`client.REST_API_URL = server.url`.
+"""
+
+import copy
+import json
+import os
+import re
+import threading
+import time
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from pathlib import Path
+from urllib.parse import (
+    parse_qs,
+    urlparse,
+)
+
+
+TESTS_DIRECTORY = Path(__file__).parent.parent / "tests"
+
+CONTROL_NUMBER_RANGE = re.compile(r"control_number:(\d+)->(\d+)")
+
+CONTROL_NUMBER = re.compile(r"control_number:(\d+)(?!\d|-)")
+
+DATE_UPDATED = re.compile(r"\bdu:")
+
+
+def default_payloads() -> dict:
+    """Returns payloads of records by identifier type.
+
+    The literature payload is the sample metadata used in tests.
+    """
+    with open(os.path.join(TESTS_DIRECTORY, "literature.json"), "r") as f:
+        literature = json.load(f)
+    author = {
+        "name": {"value": "Ebadi, Javad", "preferred_name": "Javad Ebadi"},
+        "ids": [
+            {"value": "0000-0002-4600-8310", "schema": "ORCID"},
+            {"value": "J.Ebadi.1", "schema": "INSPIRE BAI"},
+            ],
+        "positions": [{
+            "record": {"$ref": "https://inspirehep.net/api/institutions/906446"},
+            "current": True,
+            "institution": "IPM, Tehran",
+            }],
+        "control_number": 1679997,
+        "$schema": "https://inspirehep.net/schemas/records/authors.json",
+        }
+    return {"literature": literature, "authors": author}
+
+
+def load_payloads(directory: str) -> dict:
+    """Returns payloads recorded as `<identifier_type>.json` files.
+
+    Each file contains the metadata of a record of that type.
+    """
+    payloads = {}
+    for name in os.listdir(directory):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), "r") as f:
+                payloads[name[:-len(".json")]] = json.load(f)
+    return payloads
+
+
+class MockInspireServer:
+    """Local http server which mimics the Inspirehep REST API.
+
+    Parameters
+    ----------
+    payloads : dict
+        (Default value = None)
+        The metadata of records by identifier type. When it is None
+        `default_payloads()` will be used.
+    latency : float
+        (Default value = 0.0)
+        Seconds to wait before each response.
+    too_many_requests_every : int
+        (Default value = 0)
+        If positive, every n-th request gets a 429 response.
+    host : str
+        (Default value = '127.0.0.1')
+    port : int
+        (Default value = 0)
+        When it is 0 a free port will be used.
+    updated : list
+        (Default value = None)
+        Control numbers of the records found by queries of the date of
+        update (`du:`).
+
+    Example:
+    >>> with MockInspireServer(latency=0.01) as server:
+    ...     client = Client()
+    ...     client.REST_API_URL = server.url
+    ...     client.get_literature("1")
+    """
+
+    def __init__(
+        self,
+        payloads: dict = None,
+        latency: float = 0.0,
+        too_many_requests_every: int = 0,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        updated: list = None,
+        ) -> None:
+        self.payloads = payloads if payloads is not None else default_payloads()
+        self.latency = latency
+        self.too_many_requests_every = too_many_requests_every
+        self.updated = list(updated or [])
+        self.requests = 0
+        self.too_many_requests = 0
+        self._lock = threading.Lock()
+        self._encoded = {}
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Returns the base URL of the API, like `Client.REST_API_URL`.
+
+        """
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def start(self) -> "MockInspireServer":
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever,
+            daemon=True,
+            )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockInspireServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _count_request(self) -> bool:
+        """Counts a request and returns True if it must get a 429.
+
+        """
+        with self._lock:
+            self.requests += 1
+            throttled = (
+                self.too_many_requests_every > 0
+                and self.requests % self.too_many_requests_every == 0
+            )
+            if throttled:
+                self.too_many_requests += 1
+            return throttled
+
+    def record(self, identifier_type: str, control_number: int) -> dict:
+        """Returns a record json with the given control number.
+
+        """
+        metadata = copy.copy(self.payloads[identifier_type])
+        metadata["control_number"] = control_number
+        return {
+            "id": str(control_number),
+            "created": "2019-05-10T10:48:20.123456+00:00",
+            "updated": "2021-11-02T16:40:55.829101+00:00",
+            "links": {},
+            "metadata": metadata,
+            }
+
+    def encoded_record(self, identifier_type: str, control_number: int) -> bytes:
+        """Returns the encoded json of a record.
+
+        Encoded records are cached so the server is not the bottleneck.
+        """
+        key = (identifier_type, control_number)
+        encoded = self._encoded.get(key)
+        if encoded is None:
+            encoded = json.dumps(
+                self.record(identifier_type, control_number),
+                ).encode()
+            self._encoded[key] = encoded
+        return encoded
+
+    def search(self, identifier_type: str, query: dict) -> bytes:
+        """Returns the encoded json of a search page.
+
+        Queries of the form `control_number:start->end` return one record
+        per control number in the range, queries of control numbers like
+        `control_number:1 or control_number:5` return these records,
+        queries of the date of update return the `updated` records, and
+        other queries return `size` records per page out of
+        `PAGINATION_LIMIT` records.
+        """
+        size = int(query.get("size", ["10"])[0])
+        page = int(query.get("page", ["1"])[0])
+        q = query.get("q", [""])[0]
+        match = CONTROL_NUMBER_RANGE.search(q)
+        if match:
+            start, end = int(match.group(1)), int(match.group(2))
+            control_numbers = range(start, end + 1)
+        elif DATE_UPDATED.search(q):
+            control_numbers = self.updated
+        elif CONTROL_NUMBER.search(q):
+            control_numbers = [int(n) for n in CONTROL_NUMBER.findall(q)]
+        else:
+            control_numbers = range(1, 10001)
+        total = len(control_numbers)
+        hits = b",".join(
+            self.encoded_record(identifier_type, control_number)
+            for control_number in control_numbers[(page - 1) * size:page * size]
+            )
+        return (
+            b'{"hits": {"total": %d, "hits": [%s]}, "links": {}}'
+            % (total, hits)
+        )
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status_code: int, body: bytes) -> None:
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._count_request():
+                    self._send(429, b'{"message": "Too many requests"}')
+                    return
+                url = urlparse(self.path)
+                parts = [part for part in url.path.split("/") if part]
+                if not parts or parts[0] != "api" or len(parts) not in (2, 3):
+                    self._send(404, b'{"message": "Not found"}')
+                    return
+                identifier_type = parts[1]
+                if identifier_type not in server.payloads:
+                    self._send(404, b'{"message": "PID does not exist"}')
+                    return
+                if len(parts) == 2:
+                    body = server.search(identifier_type, parse_qs(url.query))
+                elif parts[2].isdigit():
+                    body = server.encoded_record(identifier_type, int(parts[2]))
+                else:
+                    self._send(404, b'{"message": "PID does not exist"}')
+                    return
+                self._send(200, body)
+
+        return Handler
@@ -0,0 +1,244 @@
+"""
+Benchmarks of pyinspirehep against a local mock of the Inspirehep API.
+
+Run from the root of the repository:
+
+    python -m benchmarks.run
+    python -m benchmarks.run --latency 0.02 --too-many-requests-every 50
+    python -m benchmarks.run --only parse fetch
+    python -m benchmarks.run --only import
+
+Each benchmark prints the number of operations, the total time and the
+throughput, so changes in performance show up as numbers.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+from benchmarks.mock_server import (
+    MockInspireServer,
+    default_payloads,
+)
+from pyinspirehep.author import Author
+from pyinspirehep.client import Client
+from pyinspirehep.contrib.clone import LiteratureClone
+from pyinspirehep.exception import InspirehepTooManyRequestsError
+from pyinspirehep.literature import Literature
+
+
+def create_client(server: MockInspireServer) -> Client:
+    """Returns a client which sends requests to `server`.
+
+    """
+    client = Client()
+    client.REST_API_URL = server.url
+    client.LIMIT_TIME = 0.01
+    return client
+
+
+def with_retry(client: Client, func: Callable, *args, **kwargs):
+    """Calls `func` and retries it after 429 responses.
+
+    """
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except InspirehepTooManyRequestsError:
+            client.wait_429()
+
+
+def report(name: str, operations: int, elapsed: float, unit: str = "ops") -> dict:
+    """Prints and returns the result of a benchmark.
+
+    """
+    rate = operations / elapsed if elapsed else float("inf")
+    print(
+        f"{name:<36} {operations:>8} {unit:<8} "
+        f"{elapsed:>9.3f} s {rate:>12.1f} {unit}/s"
+    )
+    return {
+        "name": name,
+        "operations": operations,
+        "elapsed": elapsed,
+        "rate": rate,
+        }
+
+
+def bench_fetch(server: MockInspireServer, number: int) -> list:
+    """Fetches single literature and author records.
+
+    """
+    client = create_client(server)
+    results = []
+    for name, get in (
+        ("fetch literature", client.get_literature),
+        ("fetch literature object", client.get_literature_object),
+        ("fetch author object", client.get_author_object),
+        ):
+        start = time.perf_counter()
+        for control_number in range(1, number + 1):
+            with_retry(client, get, str(control_number))
+        results.append(report(name, number, time.perf_counter() - start))
+    return results
+
+
+def bench_search(server: MockInspireServer, pages: int, size: int) -> list:
+    """Pages through literature search results.
+
+    """
+    client = create_client(server)
+    results = []
+    for name, search in (
+        ("search pages", client.search_literature),
+        ("search pages object", client.search_literature_object),
+        ):
+        start = time.perf_counter()
+        for page in range(1, pages + 1):
+            with_retry(client, search, size=size, page=page)
+        results.append(report(name, pages * size, time.perf_counter() - start, "records"))
+    return results
+
+
+def bench_clone(server: MockInspireServer, records: int, record_numbers: int) -> list:
+    """Clones literature records to a temporary directory.
+
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        cloner = LiteratureClone(
+            directory,
+            record_numbers=record_numbers,
+            verbose=0,
+            )
+        cloner.client = create_client(server)
+        get_by_control_number = cloner._get_by_control_number
+        cloner._get_by_control_number = lambda start: with_retry(
+            cloner.client,
+            get_by_control_number,
+            start,
+            )
+        start = time.perf_counter()
+        cloner.clone(0, records, batch_record_number=records)
+        elapsed = time.perf_counter() - start
+    return [report("clone", records, elapsed, "records")]
+
+
+def bench_parse(number: int) -> list:
+    """Decodes records with `from_response` without any http request.
+
+    """
+    payloads = default_payloads()
+    results = []
+    for name, record_class, identifier_type in (
+        ("parse literature", Literature, "literature"),
+        ("parse author", Author, "authors"),
+        ):
+        response = json.loads(json.dumps({
+            "id": "1",
+            "created": "2019-05-10T10:48:20.123456+00:00",
+            "updated": "2021-11-02T16:40:55.829101+00:00",
+            "metadata": payloads[identifier_type],
+            }))
+        start = time.perf_counter()
+        for _ in range(number):
+            record_class.from_response(response)
+        results.append(report(name, number, time.perf_counter() - start))
+    return results
+
+
+# Modules whose import time is measured in a new interpreter.
+IMPORT_MODULES = (
+    "pyinspirehep",
+    "pyinspirehep.query",
+    "pyinspirehep.client",
+    "pyinspirehep.contrib.loader",
+    )
+
+# Modules which must not be imported by the import of each module,
+# because they are loaded on first use.
+LAZY_MODULES = {
+    "pyinspirehep": ("requests", "pyinspirehep.client"),
+    "pyinspirehep.client": (
+        "httpx",
+        "pyinspirehep.cache",
+        "pyinspirehep.compression",
+        "pyinspirehep.instrumentation",
+        "pyinspirehep.scheduler",
+        "pyinspirehep.singleflight",
+        "pyinspirehep.transport",
+        ),
+    }
+
+
+def bench_import(number: int) -> list:
+    """Imports modules in new interpreters and measures the import time.
+
+    The import of each module is also checked to not import the modules
+    in `LAZY_MODULES` which are loaded on first use.
+    """
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(elapsed, *[name for name in {lazy!r} if name in sys.modules])\n"
+    )
+    results = []
+    for module in IMPORT_MODULES:
+        lazy = LAZY_MODULES.get(module, ())
+        elapsed = 0.0
+        for _ in range(number):
+            output = subprocess.run(
+                [sys.executable, "-c", code.format(module=module, lazy=lazy)],
+                check=True,
+                capture_output=True,
+                text=True,
+                ).stdout.split()
+            elapsed += float(output[0])
+        results.append(report(f"import {module}", number, elapsed, "imports"))
+        if output[1:]:
+            print(f"  import {module} loaded {', '.join(output[1:])}")
+    return results
+
+
+BENCHMARKS = ("fetch", "search", "clone", "parse", "import")
+
+
+def main(argv=None) -> list:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=BENCHMARKS)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds of latency of each response")
+    parser.add_argument("--too-many-requests-every", type=int, default=0,
+                        help="send a 429 response every n requests")
+    parser.add_argument("--number", type=int, default=200,
+                        help="number of records to fetch and parse")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--size", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    results = []
+    with MockInspireServer(
+        latency=args.latency,
+        too_many_requests_every=args.too_many_requests_every,
+        ) as server:
+        if "fetch" in args.only:
+            results.extend(bench_fetch(server, args.number))
+        if "search" in args.only:
+            results.extend(bench_search(server, args.pages, args.size))
+        if "clone" in args.only:
+            results.extend(bench_clone(server, args.pages * args.size, args.size))
+        if "parse" in args.only:
+            results.extend(bench_parse(args.number * 10))
+        if "import" in args.only:
+            results.extend(bench_import(max(1, args.number // 20)))
+        if server.too_many_requests:
+            print(f"429 responses: {server.too_many_requests} of {server.requests}")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,33 @@
 """
 The pyinspirehep is A python wrapper for Inspirehep API.
 
+The public classes are imported on first use (PEP 562), so importing the
+package does not import `requests` and the data models until they are
+needed.
 """
-from pyinspirehep.client import Client
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyinspirehep.client import Client
+
+
+# The public names of the package and the modules which define them.
+_LAZY_ATTRIBUTES = {
+    'Client': 'pyinspirehep.client',
+    }
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,4 @@
+import sys
+from pyinspirehep.cli import main
+
+sys.exit(main())
@@ -8,18 +8,28 @@ a request to Inspire hep API for author record.
 """
 
 import datetime
-from dataclasses import dataclass
-from typing import List
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Dict,
+    Iterable,
+    List,
+)
 from pyinspirehep.utils import (
-    convert_json_timestamp,
     convert_to_bool,
     convert_to_date,
 )
-from .data_models import SingleRecordResponse
+from .data_models import (
+    MetadataDecoder,
+    RecordMetadata,
+    SingleRecordResponse,
+)
 
 
 @dataclass
-class AuthorMetadata:
+class AuthorMetadata(RecordMetadata):
     """Author Metadata according to Inspirehep API.
     """
     project_membership: List[dict] = None
@@ -37,29 +47,22 @@ class AuthorMetadata:
     arxiv_categories: List[str] = None
     legacy_creation_date: datetime.datetime = None
 
-    @classmethod
-    def from_dict(cls, metadata: dict = None):
-        if metadata is None:
-            return AuthorMetadata()
-        legacy_creation_date = convert_to_date(
-            metadata.get("legacy_creation_date", None),
-        )
-        return AuthorMetadata(
-            project_membership=metadata.get("project_membership", None),
-            positions=metadata.get("positions", None),
-            advisors=metadata.get("advisors", None),
-            email_addresses=metadata.get("email_addresses", None),
-            ids=metadata.get("ids", None),
-            name=metadata.get("name", None),
-            stub=convert_to_bool(metadata.get("stub", None)),
-            status=metadata.get("status", None),
-            schema=metadata.get("$schema", None),
-            deleted=convert_to_bool(metadata.get("deleted", None)),
-            control_number=int(metadata.get("control_number", None)),
-            legacy_version=metadata.get("legacy_version", None),
-            arxiv_categories=metadata.get("arxiv_categories", None),
-            legacy_creation_date=legacy_creation_date,
-        )
+    DECODER = MetadataDecoder((
+        ("project_membership", "project_membership", None, None),
+        ("positions", "positions", None, None),
+        ("advisors", "advisors", None, None),
+        ("email_addresses", "email_addresses", None, None),
+        ("ids", "ids", None, None),
+        ("name", "name", None, None),
+        ("stub", "stub", convert_to_bool, False),
+        ("status", "status", None, None),
+        ("schema", "$schema", None, None),
+        ("deleted", "deleted", convert_to_bool, False),
+        ("control_number", "control_number", int, None),
+        ("legacy_version", "legacy_version", None, None),
+        ("arxiv_categories", "arxiv_categories", None, None),
+        ("legacy_creation_date", "legacy_creation_date", convert_to_date, None),
+    ))
 
 
 @dataclass
@@ -89,38 +92,16 @@ class Author(SingleRecordResponse):
     updated: datetime.datetime = None
     links: dict = None
     metadata: AuthorMetadata = None
+    # Indexes of the metadata which are built on first use. Getters
+    # return copies of their lists, so callers can not change them.
+    _ids_index: dict = field(
+        default=None, init=False, repr=False, compare=False)
+    _memberships_index: dict = field(
+        default=None, init=False, repr=False, compare=False)
+    _institutions_index: dict = field(
+        default=None, init=False, repr=False, compare=False)
 
-    @classmethod
-    def from_response(cls, respone: dict):
-        """
-
-        Parameters
-        ----------
-        respone : dict
-            
-
-        Returns
-        -------
-        SingleRecordResponse
-
-        """
-        id = respone.get("id", None)
-        created = convert_json_timestamp(
-            respone.get("created", None),
-        )
-        updated = convert_json_timestamp(
-            respone.get("updated", None),
-        )
-        links = respone.get("links", {})
-        metadata = respone.get("metadata", {})
-        metadata = AuthorMetadata.from_dict(metadata)
-        return Author(
-            id=id,
-            created=created,
-            updated=updated,
-            links=links,
-            metadata=metadata,
-        )
+    METADATA_CLASS = AuthorMetadata
 
     @property
     def name(self):
@@ -192,59 +173,62 @@ class Author(SingleRecordResponse):
     def ids(self):
         return self.metadata.ids
 
+    def _get_ids_index(self) -> dict:
+        """Returns dict of upper case schema to value of `self.ids`.
+
+        The index is built on first use, and for repeated schemas the
+        first value is kept.
+        """
+        if self._ids_index is None:
+            index = {}
+            for id_ in self.ids or ():
+                schema = id_.get('schema', None)
+                if schema is not None:
+                    index.setdefault(schema.upper(), id_.get("value", None))
+            self._ids_index = index
+        return self._ids_index
+
+    def get_id_by_schema(self, schema: str):
+        """Returns the id of the author in the given schema if exists
+
+        Parameters
+        ----------
+        schema : str
+            The schema of the id, for example 'ORCID' or 'INSPIRE BAI'.
+            It is not case sensitive.
+
+        """
+        return self._get_ids_index().get(schema.upper(), None)
+
     def get_id_orcid(self):
         """Returns orcid id of the author if exists
         
         """
-        for id_ in self.ids:
-            if id_.get('schema', None).upper() == 'ORCID':
-                return id_.get("value", None)
-        return None
+        return self.get_id_by_schema('ORCID')
 
     def get_id_cern(self):
         """Returns CERN id of the author if exists
         
         """
-        for id_ in self.ids:
-            if id_.get('schema', None).upper() == 'CERN':
-                return id_.get("value", None)
-        return None
-
-    def get_id_linkedin(self):
-        """Returns Linkedin id of the author if exists
-        
-        """
-        for id_ in self.ids:
-            if id_.get('schema', None).upper() == 'LINKEDIN':
-                return id_.get("value", None)
-        return None
+        return self.get_id_by_schema('CERN')
 
     def get_id_linkedin(self):
         """Returns Linkedin id of the author if exists
         
         """
-        for id_ in self.ids:
-            if id_.get('schema', None).upper() == 'LINKEDIN':
-                return id_.get("value", None)
-        return None
+        return self.get_id_by_schema('LINKEDIN')
 
     def get_id_inspire_bai(self):
         """Returns INSPIRE BAI of the author if exists
         
         """
-        for id_ in self.ids:
-            if id_.get('schema', None).upper() == 'INSPIRE BAI':
-                return id_.get("value", None)
-        return None
+        return self.get_id_by_schema('INSPIRE BAI')
 
     def get_id_inspire_id(self):
         """Returns INSPIRE ID of the author if exists
         
         """
-        for id_ in self.ids:
-            if id_.get('schema', None).upper() == 'INSPIRE ID':
-                return id_.get("value", None)
-        return None
+        return self.get_id_by_schema('INSPIRE ID')
 
     @property
     def arxiv_categories(self):
@@ -279,6 +263,30 @@ class Author(SingleRecordResponse):
         """
         return self.metadata.project_membership
 
+    def _get_memberships_index(self) -> dict:
+        """Returns the project memberships names and ids.
+
+        The lists are built on first use and stored in a dict with keys
+        'names', 'ids', 'current_names' and 'current_ids'.
+        """
+        if self._memberships_index is None:
+            index = {
+                'names': [],
+                'ids': [],
+                'current_names': [],
+                'current_ids': [],
+                }
+            for project in self.project_membereship or ():
+                name = project["name"]
+                id_ = project["record"]['$ref'].split("/")[-1]
+                index['names'].append(name)
+                index['ids'].append(id_)
+                if project['current'] == True:
+                    index['current_names'].append(name)
+                    index['current_ids'].append(id_)
+            self._memberships_index = index
+        return self._memberships_index
+
     def get_project_memberships(self, current=False):
         """Returns the project memberships of the authors.
         
@@ -298,19 +306,9 @@ class Author(SingleRecordResponse):
         """
         if not self.project_membereship:
             return None
-        if current:
-            memberships = [
-                project["name"]
-                for project in self.project_membereship
-                if project['current'] == True
-                ]
-
-        else:
-            memberships = [
-                project["name"]
-                for project in self.project_membereship
-                ]
-        return memberships if memberships else None
+        index = self._get_memberships_index()
+        memberships = index['current_names' if current else 'names']
+        return list(memberships) if memberships else None
 
     def get_project_memberships_ids(self, current=False):
         """Returns the project memberships ids of the authors.
@@ -331,18 +329,9 @@ class Author(SingleRecordResponse):
         """
         if not self.project_membereship:
             return None
-        if current:
-            memberships = [
-                project["record"]['$ref'].split("/")[-1]
-                for project in self.project_membereship
-                if project['current'] == True
-                ]
-        else:
-            memberships = [
-                project["record"]['$ref'].split("/")[-1]
-                for project in self.project_membereship
-                ]
-        return memberships if memberships else None
+        index = self._get_memberships_index()
+        memberships = index['current_ids' if current else 'ids']
+        return list(memberships) if memberships else None
 
     @property
     def advisors(self):
@@ -379,15 +368,31 @@ class Author(SingleRecordResponse):
         """
         return self.metadata.positions
 
+    def _get_institutions_index(self) -> dict:
+        """Returns names and ids of institutions of the positions.
+
+        The lists are built on first use and stored in a dict with keys
+        'names' and 'ids'.
+        """
+        if self._institutions_index is None:
+            self._institutions_index = {
+                'names': [
+                    position.get("institution", None)
+                    for position in self.positions
+                    ],
+                'ids': [
+                    position["record"]["$ref"].split("/")[-1]
+                    for position in self.positions
+                    ],
+                }
+        return self._institutions_index
+
     def get_institutions(self):
         """Returns name of institutions of the author
 
         """
         if self.positions:
-            return [
-                position.get("institution", None)
-                for position in self.positions
-                ]
+            return list(self._get_institutions_index()['names'])
         else:
             return None
 
@@ -396,10 +401,7 @@ class Author(SingleRecordResponse):
 
         """
         if self.positions:
-            return [
-                position["record"]["$ref"].split("/")[-1]
-                for position in self.positions
-                ]
+            return list(self._get_institutions_index()['ids'])
         else:
             return None
 
@@ -407,3 +409,49 @@ class Author(SingleRecordResponse):
         """Returns dict of positions of the authors
         """
         return self.positions
+
+
+AUTHOR_ID_SCHEMAS = (
+    'ORCID',
+    'INSPIRE BAI',
+    'INSPIRE ID',
+    'CERN',
+    'LINKEDIN',
+    )
+
+
+def get_authors_ids(
+    authors: Iterable[Author],
+    schemas: Iterable[str] = AUTHOR_ID_SCHEMAS,
+    ) -> Dict[str, list]:
+    """Returns ids of many authors as columns.
+
+    The ids of each author are indexed once and the values for all of the
+    `schemas` are looked up in the index, which is faster than calling
+    the `get_id_*` methods of each author.
+
+    Parameters
+    ----------
+    authors : Iterable[Author]
+
+    schemas : Iterable[str]
+        (Default value = AUTHOR_ID_SCHEMAS)
+        The schemas of ids to extract. They are not case sensitive.
+
+    Returns
+    -------
+    Dict[str, list]
+        A dict with 'control_number' and each of the `schemas` as keys.
+        Each value is a list with one item per author which is None when
+        the author does not have an id in that schema.
+
+    """
+    schemas = [schema.upper() for schema in schemas]
+    columns = {'control_number': []}
+    columns.update({schema: [] for schema in schemas})
+    for author in authors:
+        found = author._get_ids_index()
+        columns['control_number'].append(author.control_number)
+        for schema in schemas:
+            columns[schema].append(found.get(schema, None))
+    return columns
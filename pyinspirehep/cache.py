@@ -0,0 +1,131 @@
+"""
+Cache of responses of Inspirehep API stored compressed on disk.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pyinspirehep.compression import (
+    GzipCodec,
+    read_dictionary,
+    write_dictionary,
+    write_file_atomic,
+)
+
+
+class ResponseCache:
+    """Cache of json responses which are kept compressed on disk.
+
+    Each response is saved in a file named by the hash of its URL and
+    query parameters, and it is decompressed only when it is read. The
+    cache can be shared between threads and processes, because files are
+    written atomically.
+
+    Parameters
+    ----------
+    directory : str or path
+        The directory of the cache files.
+
+    codec :
+        (Default value = None)
+        The codec to compress responses, e.g. `ZstdCodec` with a
+        dictionary trained on Inspirehep records. When it is None
+        `GzipCodec` is used. If the codec has a dictionary it is saved in
+        the directory, and a cache opened without a codec reuses it.
+
+    max_age : float
+        (Default value = None)
+        The number of seconds a response is served from the cache after
+        it was saved. Older responses are requested again, so values
+        which change like `citation_count` are refreshed. When it is
+        None responses never expire.
+
+    Example:
+    >>> from pyinspirehep import Client
+    >>> from pyinspirehep.cache import ResponseCache
+    >>> client = Client(cache=ResponseCache("inspire-cache", max_age=86400))
+    """
+
+    def __init__(self, directory: str, codec=None, max_age: float = None) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_age = max_age
+        if codec is None:
+            codec = self._default_codec(directory)
+        elif getattr(codec, 'dictionary', None) is not None:
+            write_dictionary(directory, codec.dictionary)
+        self.codec = codec
+
+    @staticmethod
+    def _default_codec(directory: str):
+        dictionary = read_dictionary(directory)
+        if dictionary is None:
+            return GzipCodec()
+        from pyinspirehep.compression import ZstdCodec
+        return ZstdCodec(dictionary=dictionary)
+
+    @staticmethod
+    def key(url: str, params: dict = None) -> str:
+        """Returns the key of a request.
+
+        >>> ResponseCache.key('https://inspirehep.net/api/literature/1') == ResponseCache.key('https://inspirehep.net/api/literature/1', {})
+        True
+        """
+        if params:
+            url = url + "?" + json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + self.codec.extension)
+
+    def _is_fresh(self, path: str) -> bool:
+        """Returns True if the file was saved within `max_age` seconds.
+
+        The modification time of the file is the time it was saved.
+        """
+        if self.max_age is None:
+            return True
+        return time.time() - os.path.getmtime(path) <= self.max_age
+
+    def get(self, key: str):
+        """Returns the cached response or None if it is not cached.
+
+        Responses older than `max_age` are not returned.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                if not self._is_fresh(path):
+                    return None
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        return json.loads(self.codec.decompress(data))
+
+    def set(self, key: str, value) -> None:
+        """Saves the response compressed.
+
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_file_atomic(path, self.codec.compress(json.dumps(value).encode()))
+
+    def delete(self, key: str) -> bool:
+        """Removes a response from the cache.
+
+        Returns
+        -------
+        bool
+            True if the response was cached.
+
+        """
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        path = self._path(key)
+        return os.path.isfile(path) and self._is_fresh(path)
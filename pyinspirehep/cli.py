@@ -0,0 +1,426 @@
+"""
+Command line interface of pyinspirehep.
+
+Examples:
+
+    pyinspirehep clone literature/ --max 100000 --concurrency 8 --rate 5
+    pyinspirehep clone literature/ --max 100000 --resume --compression zstd
+    pyinspirehep sync literature/
+    pyinspirehep export literature/ literature-parquet/ --format parquet
+    pyinspirehep diff literature-2024/ literature/ --output changes.tsv.gz
+    pyinspirehep lookup 451647 1713040 --fields titles citation_count
+    pyinspirehep lookup --type doi 10.1103/PhysRevLett.19.1264
+
+While requests are sent, the throughput (records/s, MB/s and the number
+of 429 responses) is printed to stderr, unless `--quiet` is given.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+from typing import (
+    Callable,
+    List,
+)
+
+
+# The file in a clone directory which keeps the settings of the clone
+# and the date of its last synchronization.
+STATE_FILENAME = ".pyinspirehep-state"
+
+# The method of `Client` to get a record of each identifier type.
+LOOKUP_METHODS = {
+    'literature': 'get_literature',
+    'authors': 'get_author',
+    'institutions': 'get_institution',
+    'conferences': 'get_conference',
+    'seminars': 'get_seminar',
+    'journals': 'get_journal',
+    'jobs': 'get_job',
+    'experiments': 'get_experiment',
+    'data': 'get_data',
+    'doi': 'get_doi',
+    'arxiv': 'get_arxiv',
+    'orcid': 'get_orcid',
+    }
+
+
+class ThroughputMonitor:
+    """Prints the throughput of a client periodically.
+
+    The number of records is read from `count` and the received bytes
+    and 429 responses from a `MetricsCollector` observing the client.
+
+    Parameters
+    ----------
+    client : Client
+        The client whose requests are measured.
+    count : Callable
+        Returns the number of records received so far.
+    interval : float
+        (Default value = 1.0)
+        Seconds between the printed lines.
+    stream :
+        (Default value = None)
+        The stream to print to. When it is None `sys.stderr` is used.
+    """
+
+    def __init__(
+        self,
+        client,
+        count: Callable[[], int],
+        interval: float = 1.0,
+        stream=None,
+        ) -> None:
+        from pyinspirehep.instrumentation import MetricsCollector
+        self.client = client
+        self.count = count
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stderr
+        self.metrics = MetricsCollector()
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = None
+        self._last = None
+
+    def _snapshot(self) -> tuple:
+        return (
+            time.monotonic(),
+            self.count(),
+            self.metrics.bytes_received,
+            )
+
+    def format(self, previous: tuple, current: tuple) -> str:
+        """Returns the throughput between two snapshots as a line.
+
+        """
+        elapsed = (current[0] - previous[0]) or float('inf')
+        return (
+            f"{current[1]} records, "
+            f"{(current[1] - previous[1]) / elapsed:.1f} records/s, "
+            f"{(current[2] - previous[2]) / elapsed / 2 ** 20:.2f} MB/s, "
+            f"{self.metrics.too_many_requests} 429s"
+        )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            current = self._snapshot()
+            print(self.format(self._last, current), file=self.stream, flush=True)
+            self._last = current
+
+    def __enter__(self) -> "ThroughputMonitor":
+        self.client.add_observer(self.metrics)
+        self._started = self._last = self._snapshot()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.client.remove_observer(self.metrics)
+        print(
+            "total: " + self.format(self._started, self._snapshot()),
+            file=self.stream,
+            flush=True,
+            )
+
+
+class _QuietMonitor:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+def _monitor(args, client, count: Callable[[], int]):
+    if args.quiet:
+        return _QuietMonitor()
+    return ThroughputMonitor(client, count, interval=args.interval)
+
+
+def _create_client(args):
+    """Returns a client with the connection options of the arguments.
+
+    """
+    from pyinspirehep.client import Client
+    from pyinspirehep.retry import DEFAULT_RETRY_POLICIES
+    client = Client(
+        max_connections=args.concurrency,
+        rate_limit=args.rate,
+        http2=args.http2,
+        retry_policies=None if args.no_retry else DEFAULT_RETRY_POLICIES,
+        )
+    if args.api_url is not None:
+        client.REST_API_URL = args.api_url
+    return client
+
+
+def _read_state(directory: str) -> dict:
+    path = os.path.join(directory, STATE_FILENAME)
+    if not os.path.isfile(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_state(directory: str, state: dict) -> None:
+    with open(os.path.join(directory, STATE_FILENAME), 'w') as f:
+        json.dump(state, f, indent=2)
+
+
+def clone(args) -> int:
+    from pyinspirehep.contrib.clone import LiteratureClone
+    client = _create_client(args)
+    started = datetime.date.today()
+    state = _read_state(args.directory) if args.resume else {}
+    fields = args.fields or state.get('fields')
+    cloner = LiteratureClone(
+        args.directory,
+        record_numbers=args.page_size,
+        verbose=0 if args.quiet else 1,
+        compression=args.compression,
+        client=client,
+        fields=fields,
+        )
+    _write_state(args.directory, {
+        'fields': fields,
+        'page_size': args.page_size,
+        'last_sync': state.get('last_sync', started.isoformat()),
+        })
+    with _monitor(args, client, lambda: cloner.records):
+        cloner.clone(
+            args.min,
+            args.max,
+            batch_record_number=args.batch,
+            max_workers=args.concurrency,
+            resume=args.resume,
+            )
+    return 0
+
+
+def sync(args) -> int:
+    from pyinspirehep.contrib.clone import LiteratureClone
+    state = _read_state(args.directory)
+    since = args.since or state.get('last_sync')
+    if since is None:
+        print(
+            f"The date of the last sync of {args.directory} is unknown, "
+            "use --since",
+            file=sys.stderr,
+            )
+        return 2
+    client = _create_client(args)
+    started = datetime.date.today()
+    cloner = LiteratureClone(
+        args.directory,
+        record_numbers=state.get('page_size', 500),
+        verbose=0 if args.quiet else 1,
+        client=client,
+        fields=state.get('fields'),
+        )
+    with _monitor(args, client, lambda: cloner.records):
+        cloner.sync(
+            datetime.date.fromisoformat(since),
+            step_days=args.step_days,
+            max_workers=args.concurrency,
+            )
+    state['last_sync'] = started.isoformat()
+    _write_state(args.directory, state)
+    return 0
+
+
+def export(args) -> int:
+    from pyinspirehep.contrib.export import ArrowExporter
+    exporter = ArrowExporter(
+        args.directory,
+        args.output,
+        format=args.format,
+        processes=args.processes,
+        compression=args.compression,
+        )
+    start = time.monotonic()
+    paths = exporter.export()
+    if not args.quiet:
+        print(
+            f"Exported {len(paths)} files in {time.monotonic() - start:.1f} s",
+            file=sys.stderr,
+            )
+    return 0
+
+
+def diff(args) -> int:
+    from pyinspirehep.contrib.diff import (
+        CloneSnapshot,
+        diff_snapshots,
+        write_change_log,
+    )
+    changes = diff_snapshots(
+        CloneSnapshot(args.old, processes=args.processes),
+        CloneSnapshot(args.new, processes=args.processes),
+        )
+    counts = write_change_log(changes, args.output or sys.stdout)
+    if not args.quiet:
+        print(
+            f"{counts['A']} added, {counts['M']} changed, "
+            f"{counts['D']} removed",
+            file=sys.stderr,
+            )
+    return 0
+
+
+def _read_identifiers(identifiers: List[str]) -> List[str]:
+    if identifiers and identifiers != ['-']:
+        return identifiers
+    return [line.strip() for line in sys.stdin if line.strip()]
+
+
+def lookup(args) -> int:
+    client = _create_client(args)
+    get = getattr(client, LOOKUP_METHODS[args.type])
+    not_found = []
+    count = 0
+    results = {}
+    with _monitor(args, client, lambda: count):
+        for identifier, record in client.map(
+            get,
+            _read_identifiers(args.identifiers),
+            *(args.fields or ()),
+            max_workers=args.concurrency,
+            not_found=not_found,
+            ):
+            count += 1
+            if args.format == 'jsonl':
+                print(json.dumps(record), flush=True)
+            else:
+                results[identifier] = record
+    if args.format == 'json':
+        print(json.dumps(results, indent=2))
+    for identifier in not_found:
+        print(f"Not found: {identifier}", file=sys.stderr)
+    return 1 if not_found else 0
+
+
+def _add_client_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="do not print progress and throughput")
+    group = parser.add_argument_group("requests")
+    group.add_argument("--concurrency", type=int, default=4,
+                       help="number of concurrent requests (default: 4)")
+    group.add_argument("--rate", type=float, default=None,
+                       help="maximum number of requests per second")
+    group.add_argument("--http2", action="store_true",
+                       help="send requests over HTTP/2 (needs httpx)")
+    group.add_argument("--no-retry", action="store_true",
+                       help="do not retry failed requests")
+    group.add_argument("--api-url", default=None,
+                       help="base URL of the API, e.g. of a mirror")
+    group.add_argument("--interval", type=float, default=1.0,
+                       help="seconds between throughput lines (default: 1)")
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Returns the parser of the command line arguments.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="pyinspirehep",
+        description="Harvest and look up records of the Inspirehep API.",
+        )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_clone = subparsers.add_parser(
+        "clone", help="clone literature records to json files")
+    parser_clone.add_argument("directory")
+    parser_clone.add_argument("--min", type=int, default=0,
+                              help="first control number (default: 0)")
+    parser_clone.add_argument("--max", type=int, default=2000000,
+                              help="last control number, excluded "
+                                   "(default: 2000000)")
+    parser_clone.add_argument("--page-size", type=int, default=500,
+                              help="records per request (default: 500)")
+    parser_clone.add_argument("--batch", type=int, default=10000,
+                              help="control numbers per json file "
+                                   "(default: 10000)")
+    parser_clone.add_argument("--fields", nargs="+", default=None,
+                              help="metadata fields to clone (default: all)")
+    parser_clone.add_argument("--compression", choices=("gzip", "zstd"),
+                              default=None)
+    parser_clone.add_argument("--resume", action="store_true",
+                              help="skip json files which are saved")
+    _add_client_arguments(parser_clone)
+    parser_clone.set_defaults(func=clone)
+
+    parser_sync = subparsers.add_parser(
+        "sync", help="update a clone with the records updated since the "
+                     "last clone or sync")
+    parser_sync.add_argument("directory")
+    parser_sync.add_argument("--since", default=None,
+                             help="date of the last sync as YYYY-MM-DD")
+    parser_sync.add_argument("--step-days", type=int, default=7,
+                             help="days of updates per query (default: 7)")
+    _add_client_arguments(parser_sync)
+    parser_sync.set_defaults(func=sync)
+
+    parser_export = subparsers.add_parser(
+        "export", help="export a clone to Parquet or Arrow files")
+    parser_export.add_argument("directory")
+    parser_export.add_argument("output")
+    parser_export.add_argument("--format", choices=("parquet", "arrow"),
+                               default="parquet")
+    parser_export.add_argument("--processes", type=int, default=None,
+                               help="number of worker processes "
+                                    "(default: number of CPUs)")
+    parser_export.add_argument("--compression", default="zstd",
+                               help="compression of the files "
+                                    "(default: zstd)")
+    parser_export.add_argument("-q", "--quiet", action="store_true",
+                               help="do not print the summary")
+    parser_export.set_defaults(func=export)
+
+    parser_diff = subparsers.add_parser(
+        "diff", help="write the records added, changed and removed between "
+                     "two clones")
+    parser_diff.add_argument("old")
+    parser_diff.add_argument("new")
+    parser_diff.add_argument("--output", default=None,
+                             help="path of the change log, compressed if it "
+                                  "ends with .gz (default: stdout)")
+    parser_diff.add_argument("--processes", type=int, default=None,
+                             help="number of worker processes "
+                                  "(default: number of CPUs)")
+    parser_diff.add_argument("-q", "--quiet", action="store_true",
+                             help="do not print the summary")
+    parser_diff.set_defaults(func=diff)
+
+    parser_lookup = subparsers.add_parser(
+        "lookup", help="get records by identifiers and print them as json")
+    parser_lookup.add_argument("identifiers", nargs="*",
+                               help="identifiers, read from stdin if not "
+                                    "given or '-'")
+    parser_lookup.add_argument("--type", choices=sorted(LOOKUP_METHODS),
+                               default="literature")
+    parser_lookup.add_argument("--fields", nargs="+", default=None,
+                               help="metadata fields to get (default: all)")
+    parser_lookup.add_argument("--format", choices=("jsonl", "json"),
+                               default="jsonl",
+                               help="a json line per record or a json object "
+                                    "of records by identifier")
+    _add_client_arguments(parser_lookup)
+    parser_lookup.set_defaults(func=lookup)
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = create_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,21 +5,134 @@ get data from Inspirehep API.
 
 """
 
+import contextlib
 import requests
+import threading
 import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union,
+)
 from pyinspirehep.exception import (
+    InspirehepConnectionError,
+    InspirehepError,
     InspirehepPIDDoesNotExistError,
+    InspirehepResponseDecodeError,
+    InspirehepServerError,
+    InspirehepTimeoutError,
     InspirehepTooManyRequestsError,
+    InspirehepUnexpectedStatusError,
 )
 from pyinspirehep.data_models import (
+    SearchResponse,
     SingleRecordResponse,
 )
 from pyinspirehep.author import Author
+from pyinspirehep.conference import Conference
+from pyinspirehep.data import Data
+from pyinspirehep.experiment import Experiment
+from pyinspirehep.institution import Institution
+from pyinspirehep.job import Job
+from pyinspirehep.journal import Journal
+from pyinspirehep.limiter import RateLimiter
 from pyinspirehep.literature import Literature
+from pyinspirehep.query import (
+    RefersTo,
+    Term,
+)
+from pyinspirehep.retry import (
+    CircuitBreaker,
+    RetryPolicy,
+    get_retry_policy,
+)
+from pyinspirehep.seminar import Seminar
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyinspirehep.cache import ResponseCache
+    from pyinspirehep.instrumentation import (
+        RequestEvent,
+        RequestObserver,
+    )
 
 
 class Client:
     """Client to use Inspirehep API.
+
+    A client can be shared between threads. All threads use the same
+    connection pool of `max_connections` connections and the same rate
+    limiter, so a single client should be used for concurrent requests
+    instead of a client per thread.
+
+    Parameters
+    ----------
+    max_connections : int
+        (Default value = 10)
+        The number of connections kept in the pool of the session.
+
+    rate_limit : float
+        (Default value = None)
+        The maximum number of requests per second sent by all threads.
+        When it is None requests are not limited.
+
+    priorities : Dict[str, float]
+        (Default value = None)
+        The weight of each priority of requests which share `rate_limit`,
+        see `pyinspirehep.scheduler.RequestScheduler`. When it is None
+        `pyinspirehep.scheduler.DEFAULT_WEIGHTS` is used, which gives
+        'interactive' requests 8 times the share of 'bulk' requests.
+        The priority of requests is set by `Client.priority`. Requests
+        which do not set it have `default_priority`: 'interactive' if it
+        is configured, otherwise the priority with the largest weight.
+        Background requests (e.g. of `LiteratureClone`) have
+        `bulk_priority`: 'bulk' if it is configured, otherwise the
+        priority with the smallest weight.
+
+    timeout : float or Tuple[float, float]
+        (Default value = DEFAULT_TIMEOUT)
+        The connect and read timeouts of requests in seconds. If it is a
+        number it is used for both.
+
+    retry_policies : Dict[type, RetryPolicy]
+        (Default value = None)
+        The retry policy for each class of error, for example
+        `pyinspirehep.retry.DEFAULT_RETRY_POLICIES`. Errors whose class has
+        no policy are raised without retry. When it is None no request
+        is retried.
+
+    circuit_breaker : CircuitBreaker
+        (Default value = None)
+        If given, requests are stopped after consecutive outages.
+
+    http2 : bool
+        (Default value = False)
+        If True, requests are sent over HTTP/2 using `httpx`, which
+        multiplexes concurrent requests over `max_connections`
+        connections. It requires `pip install pyinspirehep[http2]`.
+
+    cache : ResponseCache
+        (Default value = None)
+        If given, successful responses are saved compressed in the cache
+        and later requests with the same URL and parameters are served
+        from it.
+
+    coalesce_requests : bool
+        (Default value = False)
+        If True, concurrent requests with the same URL and parameters
+        (e.g. from threads of `map`) share one http request and all of
+        them get its result. The result is the same object for all of the
+        callers, so it must not be modified.
+
     """
 
     REST_API_URL = 'https://inspirehep.net/api/'
@@ -44,6 +157,22 @@ class Client:
         'orcid',
         ]
 
+    # The data model of records for each identifier type.
+    RECORD_CLASSES = {
+        'literature': Literature,
+        'authors': Author,
+        'institutions': Institution,
+        'conferences': Conference,
+        'seminars': Seminar,
+        'journals': Journal,
+        'jobs': Job,
+        'experiments': Experiment,
+        'data': Data,
+        'doi': Literature,
+        'arxiv': Literature,
+        'orcid': Author,
+        }
+
     LIMIT_TIME = 5
 
     PAGINATION_LIMIT = 10000
@@ -51,21 +180,163 @@ class Client:
     MAX_RECORDS_PER_PAGE = 1000
 
     MAX_PAGES = PAGINATION_LIMIT // MAX_RECORDS_PER_PAGE
+
+    # The connect and read timeouts of requests in seconds.
+    DEFAULT_TIMEOUT = (10, 60)
     
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_connections: int = 10,
+        rate_limit: float = None,
+        priorities: Dict[str, float] = None,
+        timeout=DEFAULT_TIMEOUT,
+        retry_policies: Dict[type, RetryPolicy] = None,
+        circuit_breaker: CircuitBreaker = None,
+        http2: bool = False,
+        cache: 'ResponseCache' = None,
+        coalesce_requests: bool = False,
+        ) -> None:
+        self.max_connections = max_connections
+        self.http2 = http2
+        self.cache = cache
+        self.single_flight = None
+        if coalesce_requests:
+            from pyinspirehep.singleflight import SingleFlight
+            self.single_flight = SingleFlight()
+        self.timeout = timeout
+        self.retry_policies = retry_policies or {}
+        self.circuit_breaker = circuit_breaker
         self.session = self._init_session()
+        self.limiter = (
+            RateLimiter(rate_limit, burst=max_connections)
+            if rate_limit is not None
+            else None
+        )
+        # The scheduler is imported on first use like the other optional
+        # components, so importing the client stays fast.
+        from pyinspirehep.scheduler import (
+            RequestScheduler,
+            bulk_priority,
+            check_weights,
+            default_priority,
+        )
+        self.priorities = check_weights(priorities)
+        self.default_priority = default_priority(self.priorities)
+        self.bulk_priority = bulk_priority(self.priorities)
+        self.scheduler = (
+            RequestScheduler(self.limiter, self.priorities)
+            if self.limiter is not None
+            else None
+        )
+        self.observers = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def add_observer(self, observer: 'RequestObserver') -> None:
+        """Adds an observer to be notified about requests.
+
+        Parameters
+        ----------
+        observer : RequestObserver
+            For example an instance of `MetricsCollector`.
+
+        """
+        with self._lock:
+            self.observers = self.observers + [observer]
+
+    def remove_observer(self, observer: 'RequestObserver') -> None:
+        """Removes an observer which was added by `add_observer`.
+
+        """
+        with self._lock:
+            observers = list(self.observers)
+            observers.remove(observer)
+            self.observers = observers
+
+    def _get_identifier_type(self, url: str) -> str:
+        """Returns the identifier type of a URL of Inspirehep API.
+
+        >>> Client()._get_identifier_type('https://inspirehep.net/api/literature/451647')
+        'literature'
+        """
+        if url.startswith(self.REST_API_URL):
+            url = url[len(self.REST_API_URL):].lstrip("/")
+        return url.split("/", 1)[0].split("?", 1)[0]
+
+    @contextlib.contextmanager
+    def priority(self, priority: str):
+        """Sets the priority of requests sent by the current thread.
+
+        Requests of each priority wait in their own queue for the shared
+        rate limit, and the queues are served by their weights in
+        `priorities`. Requests have `default_priority` by default. When
+        the client has no `rate_limit` requests are not queued, so the
+        priority has no effect, but it is still checked.
+
+        Parameters
+        ----------
+        priority : str
+            One of `priorities`, for example `client.bulk_priority` for
+            background harvests.
+
+        Example:
+        >>> client = Client(rate_limit=3)
+        >>> with client.priority(client.bulk_priority):
+        ...     papers = client.search_literature(q='t higgs', size=100)
+        """
+        if priority not in self.priorities:
+            raise ValueError(f"Unknown priority '{priority}'")
+        previous = getattr(self._local, 'priority', None)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def _get_priority(self) -> str:
+        """Returns the priority of requests of the current thread.
+
+        """
+        return getattr(self._local, 'priority', None) or self.default_priority
+
+    def _call_with_priority(self, priority: str, func: Callable, *args):
+        with self.priority(priority):
+            return func(*args)
+
+    def _notify(self, hook: str, event: 'RequestEvent') -> None:
+        """Calls the `hook` method of all observers with `event`.
+
+        """
+        for observer in self.observers:
+            getattr(observer, hook)(event)
 
     def _init_session(self) -> requests.session:
         """Initialize session.
-        """
 
-        session = requests.session()
+        When `self.http2` is True an `HTTP2Session` is returned which has
+        the same interface as `requests.Session`. The `Accept-Encoding`
+        header is left to the transport, which accepts the encodings it
+        can decode with the installed packages (e.g. br or zstd).
+        """
         headers = {
             'Accept': 'application/json',
             'User-Agent': 'pyinspirehep',
             'Content-Type': 'application/json',
             }
+        if self.http2:
+            from pyinspirehep.transport import HTTP2Session
+            return HTTP2Session(
+                max_connections=self.max_connections,
+                headers=headers,
+                )
+        session = requests.session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.max_connections,
+            pool_maxsize=self.max_connections,
+            )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         session.headers.update(headers)
         return session
 
@@ -79,16 +350,19 @@ class Client:
     def _get(self, *args, **kwargs) -> dict:
         """Sends a GET request and returns json data.
 
-        This method uses `requests.get` method to get data from API and
-        and returns data as json.
+        This method uses `get` method of the session to get data from API
+        and returns data as json. Failed requests are retried according to
+        `retry_policies`, and if the client has a cache, responses are read
+        from and saved to it. With `coalesce_requests`, concurrent calls
+        with the same URL and parameters share a single request.
 
         Parameters
         ----------
         *args :
-            Passed to `requests.get` as *args.
+            Passed to `requests.Session.get` as *args.
             
         **kwargs :
-            Passed to `requests.get` as **kwargs.
+            Passed to `requests.Session.get` as **kwargs.
 
         Returns
         -------
@@ -104,22 +378,308 @@ class Client:
             When because of too many request the IP is blocked for
             a few seconds.
 
+        InspirehepTimeoutError
+            When connecting or reading the response timed out.
+
+        InspirehepConnectionError
+            When no response was received.
+
+        InspirehepServerError
+            When the response has a 5xx status code.
+
+        InspirehepResponseDecodeError
+            When the body of a successful response is not json.
+
+        InspirehepUnexpectedStatusError
+            When the response has another status code.
+
+        InspirehepCircuitOpenError
+            When requests are stopped by the circuit breaker.
+
         """
+        kwargs.setdefault('timeout', self.timeout)
+        if self.single_flight is None:
+            return self._get_cached(*args, **kwargs)
+        from pyinspirehep.cache import ResponseCache
+        url = args[0] if args else kwargs.get('url', '')
+        return self.single_flight.do(
+            ResponseCache.key(url, kwargs.get('params', None)),
+            self._get_cached,
+            *args,
+            **kwargs,
+            )
+
+    def _get_cached(self, *args, **kwargs) -> dict:
+        """Returns the response from cache or sends the request.
+
+        """
+        if self.cache is None:
+            return self._get_with_retries(*args, **kwargs)
+        url = args[0] if args else kwargs.get('url', '')
+        key = self.cache.key(url, kwargs.get('params', None))
+        data = self.cache.get(key)
+        if data is not None:
+            if self.observers:
+                event = self._create_event(url, kwargs, from_cache=True)
+                event.finish()
+                self._notify('after_response', event)
+            return data
+        if self.observers:
+            self._notify('on_cache_miss', self._create_event(url, kwargs))
+        data = self._get_with_retries(*args, **kwargs)
+        self.cache.set(key, data)
+        return data
+
+    def _get_with_retries(self, *args, **kwargs) -> dict:
+        """Sends a GET request and retries it according to `retry_policies`.
+
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._get_observed(*args, **kwargs)
+            except InspirehepError as e:
+                policy = get_retry_policy(self.retry_policies, e)
+                delay = None
+                if policy is not None:
+                    delay = policy.delay(attempt, e.retry_after)
+                if delay is None:
+                    raise
+                if self.observers:
+                    url = args[0] if args else kwargs.get('url', '')
+                    self._notify('on_retry', self._create_event(
+                        url,
+                        kwargs,
+                        error=e,
+                        attempt=attempt,
+                        retry_delay=delay,
+                        ))
+                attempt += 1
+                time.sleep(delay)
+
+    def _create_event(self, url: str, kwargs: dict, **fields) -> 'RequestEvent':
+        """Returns the event of a request to `url` with `kwargs` of `get`.
+
+        """
+        from pyinspirehep.instrumentation import RequestEvent
+        return RequestEvent(
+            url=url,
+            params=kwargs.get('params', None),
+            identifier_type=self._get_identifier_type(url),
+            **fields,
+            )
+
+    def _get_observed(self, *args, **kwargs) -> dict:
+        """Sends a GET request and notifies observers about it.
+
+        """
+        if not self.observers:
+            return self._get_response(*args, **kwargs)
+        url = args[0] if args else kwargs.get('url', '')
+        event = self._create_event(url, kwargs)
+        self._notify('before_request', event)
+        try:
+            return self._get_response(*args, event=event, **kwargs)
+        except Exception as e:
+            if event.elapsed is None:
+                event.finish()
+            event.error = e
+            self._notify('on_error', event)
+            raise
+
+    def _get_response(
+        self,
+        *args,
+        event: 'RequestEvent' = None,
+        **kwargs,
+        ) -> dict:
+        """Sends a GET request and returns json data.
+
+        If `event` is given, it will be updated with the response and
+        observers will be notified about the response.
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
         try:
-            response = requests.get(*args, **kwargs)
-        except requests.exceptions.ConnectionError as e:
-            raise InspirehepTooManyRequestsError(str(e))
-        data = response.json()
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 404:
+            if self.scheduler is not None:
+                self.scheduler.acquire(self._get_priority())
+            try:
+                response = self.session.get(*args, **kwargs)
+            except requests.exceptions.Timeout as e:
+                raise InspirehepTimeoutError(str(e))
+            except requests.exceptions.RequestException as e:
+                raise InspirehepConnectionError(str(e))
+            if event is not None:
+                event.finish()
+                event.status_code = response.status_code
+                event.bytes_received = Client._get_received_bytes(response)
+                self._notify('after_response', event)
+            data = Client._handle_response(response)
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record()
+        except InspirehepError as e:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record(e)
+            raise
+        finally:
+            if self.circuit_breaker is not None:
+                # Unexpected errors end the trial of a half-open circuit too.
+                self.circuit_breaker.release()
+        return data
+
+    @staticmethod
+    def _get_received_bytes(response: requests.Response) -> int:
+        """Returns the size of the body of a response as it was received.
+
+        The 'Content-Length' header is the size before the body is
+        decompressed. Responses without it, e.g. chunked responses, are
+        measured by their decompressed content.
+        """
+        length = response.headers.get('Content-Length')
+        if isinstance(length, str) and length.isdigit():
+            return int(length)
+        return len(response.content)
+
+    @staticmethod
+    def _handle_response(response: requests.Response) -> dict:
+        """Returns json data of the response or raises the related error.
+
+        The status code is checked before decoding the body, because error
+        pages of Inspirehep (e.g. for 5xx status codes) may not be json.
+        """
+        status_code = response.status_code
+        if status_code == 200:
+            try:
+                return response.json()
+            except ValueError as e:
+                raise InspirehepResponseDecodeError(
+                    f"Invalid json in response: {e}",
+                    status_code=status_code,
+                    )
+        message = Client._get_error_message(response)
+        if status_code == 404:
             raise InspirehepPIDDoesNotExistError(
-                data.get('message', '404 status code'),
+                message or '404 status code',
+                status_code=status_code,
                 )
-        elif response.status_code == 429:
+        elif status_code == 429:
             raise InspirehepTooManyRequestsError(
-                data.get('message', '429 status code'),
+                message or '429 status code',
+                status_code=status_code,
+                retry_after=Client._get_retry_after(response),
+                )
+        elif status_code >= 500:
+            raise InspirehepServerError(
+                message or f'{status_code} status code',
+                status_code=status_code,
+                retry_after=Client._get_retry_after(response),
                 )
+        raise InspirehepUnexpectedStatusError(
+            message or f'{status_code} status code',
+            status_code=status_code,
+            )
+
+    @staticmethod
+    def _get_error_message(response: requests.Response) -> str:
+        """Returns the message of an error response if it is json.
+
+        """
+        try:
+            data = response.json()
+        except ValueError:
+            return None
+        if isinstance(data, dict):
+            return data.get('message', None)
+        return None
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> float:
+        """Returns seconds of the Retry-After header if it exists.
+
+        """
+        headers = getattr(response, 'headers', None) or {}
+        try:
+            return float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+
+    def map(
+        self,
+        get_fn: Union[Callable, str],
+        identifiers: Iterable[str],
+        *args,
+        max_workers: int = 8,
+        not_found: List[str] = None,
+        ) -> Iterator[Tuple[str, object]]:
+        """Calls `get_fn` for identifiers in a pool of threads.
+
+        Results are yielded as soon as they are completed, so their order
+        may differ from the order of `identifiers`. Identifiers which do
+        not exist in Inspirehep do not abort the other requests. The
+        requests have the priority of the calling thread.
+
+        Parameters
+        ----------
+        get_fn : Callable or str
+            A function which gets an identifier, like `client.get_literature`,
+            or the name of a method of the client like 'get_literature'.
+
+        identifiers : Iterable[str]
+            The identifiers passed to `get_fn`.
+
+        *args :
+            Passed to `get_fn` after the identifier, e.g. the fields to
+            include in metadata.
+
+        max_workers : int
+            (Default value = 8)
+            The number of threads.
+
+        not_found : List[str]
+            (Default value = None)
+            If given, the identifiers which raised
+            `InspirehepPIDDoesNotExistError` are appended to it.
+
+        Returns
+        -------
+        Iterator[Tuple[str, object]]
+            Pairs of identifier and result of `get_fn`.
+
+        """
+        if isinstance(get_fn, str):
+            get_fn = getattr(self, get_fn)
+        identifiers = iter(identifiers)
+        priority = self._get_priority()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+
+            def submit(count):
+                for identifier in identifiers:
+                    future = executor.submit(
+                        self._call_with_priority,
+                        priority,
+                        get_fn,
+                        identifier,
+                        *args,
+                        )
+                    pending[future] = identifier
+                    count -= 1
+                    if count == 0:
+                        break
+
+            submit(2 * max_workers)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    identifier = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except InspirehepPIDDoesNotExistError:
+                        if not_found is not None:
+                            not_found.append(identifier)
+                        continue
+                    yield identifier, result
+                submit(len(done))
 
     def _get_record(
         self,
@@ -151,18 +711,22 @@ class Client:
             The json data part of the respone as Python dict will be returned.
 
         """
-        args = [self.REST_API_URL, identifier_type, identifier_value]
+        uri = Client._create_uri(
+            self.REST_API_URL,
+            identifier_type,
+            identifier_value,
+            )
         fields = ""
         if args:
             fields = ",".join(args)
         if fields:
             return self._get(
-                Client._create_uri(*args),
+                uri,
                 params={'fields':fields}
                 )
         else:
             return self._get(
-                Client._create_uri(*args)
+                uri
                 )
 
     def _create_q(
@@ -186,10 +750,12 @@ class Client:
         str
 
         """
-        if nested_key is None:
-            return f"{metadata_field}:{value}"
-        else:
-            return f"{metadata_field}.{nested_key}:{value}"
+        return Term(
+            metadata_field,
+            value,
+            nested_key=nested_key,
+            quoted=False,
+            ).compile()
 
     def _search(
         self,
@@ -247,9 +813,15 @@ class Client:
         Returns
         -------
         SingleRecrodResponse
+            An instance of the data model in `RECORD_CLASSES` for the
+            `identifier_type`.
 
         """
-        return SingleRecordResponse.from_response(
+        record_class = self.RECORD_CLASSES.get(
+            identifier_type,
+            SingleRecordResponse,
+            )
+        return record_class.from_response(
             self._get_record(
                 *args,
                 identifier_type=identifier_type,
@@ -257,6 +829,45 @@ class Client:
                 ),
             )
 
+    def _search_object(
+        self,
+        *args,
+        identifier_type: str,
+        lazy: bool = False,
+        **kwargs,
+        ) -> SearchResponse:
+        """
+
+        Parameters
+        ----------
+        *args :
+            The fields that must be included in metadata.
+
+        identifier_type : str
+
+        lazy : bool
+            (Default value = False)
+            If True, each hit is decoded only when it is accessed.
+
+        **kwargs :
+            Passed to `Client._search`.
+
+        Returns
+        -------
+        SearchResponse
+            Hits of the search decoded by the data model in
+            `RECORD_CLASSES` for the `identifier_type`.
+
+        """
+        return SearchResponse.from_response(
+            self._search(*args, identifier_type=identifier_type, **kwargs),
+            record_class=self.RECORD_CLASSES.get(
+                identifier_type,
+                SingleRecordResponse,
+                ),
+            lazy=lazy,
+            )
+
     @staticmethod
     def _create_params(
         *args,
@@ -285,8 +896,9 @@ class Client:
         size : str
             (Default value = None). The number of records in page.
 
-        q : str
-            (Default value = None). The search query.
+        q : str or Query
+            (Default value = None). The search query. It can be a query
+            built with `pyinspirehep.query`.
 
         Returns
         -------
@@ -306,7 +918,7 @@ class Client:
         if size is not None:
             params['size'] = size  # The number of results returned per page
         if q is not None:
-            params['q'] = q  # The search query
+            params['q'] = str(q)  # The search query
         fields = None  # The fields in the metadata to be returned
         if args:
             fields = ",".join(args)
@@ -387,18 +999,18 @@ class Client:
         >>> len(client.get_literature_citations("1785369")["hits"]["hits"][1]["metadata"]["references"])
         133
         """
-        args=[
-            self.REST_API_URL + 'literature',
-            f"?q=refersto%3Arecid%3A{literature_id}" + f'&size={size}' + f'&page={page}',
-            ]
-        print(Client._create_uri(*args))
-        return self._get(Client._create_uri(*args))
+        return self._search(
+            identifier_type='literature',
+            size=size,
+            page=page,
+            q=RefersTo(literature_id),
+            )
 
     def get_literature_object(
         self,
         literature_id: str,
         *args,
-        ) -> SingleRecordResponse:
+        ) -> Literature:
         """
 
         Parameters
@@ -410,7 +1022,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Literature
 
         """
         return Literature.from_response(
@@ -461,6 +1073,52 @@ class Client:
             q=q,
         )
 
+    def search_literature_object(
+        self,
+        *args,
+        sorting='mostrecent',
+        size=1,
+        page=1,
+        q=None,
+        lazy=False,
+        ) -> SearchResponse:
+        """
+
+        Parameters
+        ----------
+        sorting : str
+             (Default value = 'mostrecent')
+
+        size : int
+             (Default value = 1)
+
+        page : int
+             (Default value = 1)
+
+        q :
+             (Default value = None)
+
+        lazy : bool
+             (Default value = False)
+             If True, each hit is decoded to `Literature` only when
+             it is accessed.
+
+        Returns
+        -------
+        SearchResponse
+            Search results with hits as `Literature` objects.
+
+        """
+        return self._search_object(
+            *args,
+            identifier_type='literature',
+            lazy=lazy,
+            sorting=sorting,
+            size=size,
+            page=page,
+            q=q,
+        )
+
     def get_author(
         self,
         author_id: str,
@@ -552,6 +1210,53 @@ class Client:
             q=q,
             )
 
+    def search_authors_object(
+        self,
+        *args,
+        sorting='bestmatch',
+        size=1000,
+        page=1,
+        q=None,
+        name=None,
+        lazy=False,
+        ) -> SearchResponse:
+        """
+
+        Parameters
+        ----------
+        sorting :
+             (Default value = 'bestmatch')
+        size :
+             (Default value = 1000)
+        page :
+             (Default value = 1)
+        q :
+             (Default value = None)
+        name :
+             (Default value = None)
+        lazy : bool
+             (Default value = False)
+             If True, each hit is decoded to `Author` only when it is
+             accessed.
+
+        Returns
+        -------
+        SearchResponse
+            Search results with hits as `Author` objects.
+
+        """
+        if name is not None:
+            q = Client._create_q('name', 'value', name)
+        return self._search_object(
+            *args,
+            identifier_type='authors',
+            lazy=lazy,
+            sorting=sorting,
+            size=size,
+            page=page,
+            q=q,
+            )
+
     def get_institution(
         self,
         institution_id: str,
@@ -579,7 +1284,7 @@ class Client:
         self,
         institution_id: str,
         *args,
-        ) -> SingleRecordResponse:
+        ) -> Institution:
         """
 
         Parameters
@@ -589,7 +1294,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Institution
 
         """
         return self._get_record_object(
@@ -625,7 +1330,7 @@ class Client:
         self,
         conference_id: str,
         *args,
-        ) -> SingleRecordResponse:
+        ) -> Conference:
         """
 
         Parameters
@@ -635,7 +1340,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Conference
 
         """
         return self._get_record_object(
@@ -671,7 +1376,7 @@ class Client:
         self,
         seminar_id: str,
         *args,
-        ) -> SingleRecordResponse:
+        ) -> Seminar:
         """
 
         Parameters
@@ -681,7 +1386,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Seminar
 
         """
         return self._get_record_object(
@@ -717,7 +1422,7 @@ class Client:
         self,
         journal_id: str,
         *args,
-        ) -> SingleRecordResponse:
+        ) -> Journal:
         """
 
         Parameters
@@ -727,7 +1432,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Journal
 
         """
         return self._get_record_object(
@@ -763,7 +1468,7 @@ class Client:
         self,
         job_id: str,
         *args,
-        ) -> SingleRecordResponse:
+        ) -> Job:
         """
 
         Parameters
@@ -773,7 +1478,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Job
 
         """
         return self._get_record_object(
@@ -809,7 +1514,7 @@ class Client:
         self,
         experiment_id: str,
         *args,
-        ) -> SingleRecordResponse:
+        ) -> Experiment:
         """
 
         Parameters
@@ -819,7 +1524,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Experiment
 
         """
         return self._get_record_object(
@@ -855,7 +1560,7 @@ class Client:
         self,
         data_id: str,
         *args,
-        ) -> dict:
+        ) -> Data:
         """
 
         Parameters
@@ -865,7 +1570,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Data
 
         """
         return self._get_record_object(
@@ -905,7 +1610,7 @@ class Client:
         self,
         doi_identifier: str,
         *args,
-        ) -> SingleRecordResponse:
+        ) -> Literature:
         """
 
         Parameters
@@ -915,7 +1620,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Literature
 
         """
         return self._get_record_object(
@@ -960,7 +1665,7 @@ class Client:
         self,
         arxiv_identifier: str,
         *args,
-        ) -> dict:
+        ) -> Literature:
         """
 
         Parameters
@@ -970,7 +1675,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Literature
         
         """
         return self._get_record_object(
@@ -1011,7 +1716,7 @@ class Client:
         self,
         orcid_id: str,
         *args,
-        ) -> SingleRecordResponse:
+        ) -> Author:
         """
 
         Parameters
@@ -1021,7 +1726,7 @@ class Client:
 
         Returns
         -------
-        SingleRecordResponse
+        Author
 
         """
         return self._get_record_object(
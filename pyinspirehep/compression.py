@@ -0,0 +1,244 @@
+"""
+Compression of json payloads stored on disk.
+
+Cached responses and cloned records are stored compressed and are
+decompressed only when they are read. The gzip codec only needs the
+standard library. The zstd codec needs the optional `zstandard` package
+and can use a dictionary trained on Inspirehep records, which improves
+the compression of small payloads like single records a lot:
+
+    pip install pyinspirehep[zstd]
+"""
+
+import contextlib
+import gzip
+import json
+import os
+import tempfile
+from typing import (
+    Iterable,
+    List,
+)
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+# The name of the file of the zstd dictionary in a directory of
+# compressed files.
+DICTIONARY_FILENAME = "zstd.dict"
+
+
+class GzipCodec:
+    """Codec to compress payloads with gzip.
+
+    >>> codec = GzipCodec()
+    >>> codec.decompress(codec.compress(b'{}'))
+    b'{}'
+    """
+
+    name = "gzip"
+    extension = ".gz"
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return gzip.decompress(data)
+
+
+class ZstdCodec:
+    """Codec to compress payloads with zstd and an optional dictionary.
+
+    Parameters
+    ----------
+    dictionary : bytes
+        (Default value = None)
+        A dictionary created by `train_dictionary`. Payloads compressed
+        with a dictionary can only be decompressed with the same one.
+
+    level : int
+        (Default value = 3)
+        The compression level.
+
+    """
+
+    name = "zstd"
+    extension = ".zst"
+
+    def __init__(self, dictionary: bytes = None, level: int = 3) -> None:
+        if zstandard is None:
+            raise ImportError(
+                "The zstd codec requires zstandard, install it using "
+                "'pip install pyinspirehep[zstd]'"
+            )
+        self.dictionary = dictionary
+        self.level = level
+        dict_data = (
+            zstandard.ZstdCompressionDict(dictionary)
+            if dictionary is not None
+            else None
+        )
+        self._compressor = zstandard.ZstdCompressor(
+            level=level,
+            dict_data=dict_data,
+            )
+        self._decompressor = zstandard.ZstdDecompressor(dict_data=dict_data)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+def train_dictionary(samples: Iterable, size: int = 112640) -> bytes:
+    """Returns a zstd dictionary trained on sample records.
+
+    Parameters
+    ----------
+    samples : Iterable
+        Records as dicts or as encoded json bytes, e.g. a few thousands
+        records of a clone.
+
+    size : int
+        (Default value = 112640)
+        The size of the dictionary in bytes.
+
+    Returns
+    -------
+    bytes
+
+    """
+    if zstandard is None:
+        raise ImportError(
+            "Training a dictionary requires zstandard, install it using "
+            "'pip install pyinspirehep[zstd]'"
+        )
+    encoded: List[bytes] = [
+        sample if isinstance(sample, bytes) else json.dumps(sample).encode()
+        for sample in samples
+        ]
+    return zstandard.train_dictionary(size, encoded).as_bytes()
+
+
+def get_codec(name: str, dictionary: bytes = None):
+    """Returns the codec with the given name.
+
+    Parameters
+    ----------
+    name : str
+        'gzip' or 'zstd'.
+
+    dictionary : bytes
+        (Default value = None)
+        The dictionary of the zstd codec.
+
+    """
+    if name == GzipCodec.name:
+        return GzipCodec()
+    elif name == ZstdCodec.name:
+        return ZstdCodec(dictionary=dictionary)
+    raise ValueError(f"Unknown compression '{name}'")
+
+
+def read_dictionary(directory: str) -> bytes:
+    """Returns the zstd dictionary saved in `directory` if exists.
+
+    """
+    path = os.path.join(directory, DICTIONARY_FILENAME)
+    if not os.path.isfile(path):
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def write_dictionary(directory: str, dictionary: bytes) -> None:
+    """Saves the zstd dictionary in `directory`.
+
+    """
+    with open(os.path.join(directory, DICTIONARY_FILENAME), 'wb') as f:
+        f.write(dictionary)
+
+
+def load_json_file(path: str, dictionary: bytes = None):
+    """Returns the content of a json file which may be compressed.
+
+    The compression is determined by the extension of the file: '.gz'
+    for gzip and '.zst' for zstd. If a zstd file is read without
+    `dictionary`, the dictionary saved next to it is used if exists.
+    """
+    if path.endswith(GzipCodec.extension):
+        with gzip.open(path, 'rb') as f:
+            return json.load(f)
+    if path.endswith(ZstdCodec.extension):
+        if dictionary is None:
+            dictionary = read_dictionary(os.path.dirname(path))
+        with open(path, 'rb') as f:
+            return json.loads(ZstdCodec(dictionary).decompress(f.read()))
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def get_file_codec(path: str):
+    """Returns the codec of a json file by its extension.
+
+    None is returned for files which are not compressed.
+
+    >>> get_file_codec('1000.json.gz').name
+    'gzip'
+    >>> get_file_codec('1000.json') is None
+    True
+    """
+    if path.endswith(GzipCodec.extension):
+        return GzipCodec()
+    if path.endswith(ZstdCodec.extension):
+        return ZstdCodec(read_dictionary(os.path.dirname(path)))
+    return None
+
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """Writes `data` to `path` through a temporary file in its directory.
+
+    Readers see either the previous or the new content of `path`, never
+    a partial file. The temporary file has the '.tmp' suffix and is
+    removed if the write fails.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or None,
+        suffix='.tmp',
+        )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def dump_json_file(obj, path: str, codec=None) -> str:
+    """Writes `obj` as json to `path` compressed with `codec`.
+
+    The extension of the codec is appended to the path. The file is
+    written atomically, so an interrupted write does not leave a partial
+    file at `path`.
+
+    Returns
+    -------
+    str
+        The path of the written file.
+
+    """
+    data = json.dumps(obj).encode()
+    if codec is not None:
+        path = path + codec.extension
+        data = codec.compress(data)
+    write_file_atomic(path, data)
+    return path
@@ -0,0 +1,126 @@
+"""
+Module for conferences repsone of Inspirehep
+
+The module provides a data class with several get methods
+to make it easy to get conferences information from the response of
+a request to Inspire hep API for conference record.
+
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import List
+from pyinspirehep.utils import (
+    convert_to_bool,
+    convert_to_date,
+)
+from .data_models import (
+    MetadataDecoder,
+    RecordMetadata,
+    SingleRecordResponse,
+)
+
+
+@dataclass
+class ConferenceMetadata(RecordMetadata):
+    """Conference Metadata according to Inspirehep API.
+    """
+    titles: List[dict] = None
+    acronyms: List[str] = None
+    cnum: str = None
+    opening_date: datetime.date = None
+    closing_date: datetime.date = None
+    addresses: List[dict] = None
+    contact_details: List[dict] = None
+    inspire_categories: List[dict] = None
+    keywords: List[dict] = None
+    public_notes: List[dict] = None
+    series: List[dict] = None
+    urls: List[dict] = None
+    proceedings: List[dict] = None
+    number_of_contributions: int = 0
+    core: bool = None
+    deleted: bool = None
+    schema: str = None
+    control_number: int = None
+    legacy_creation_date: datetime.date = None
+
+    DECODER = MetadataDecoder((
+        ("titles", "titles", None, None),
+        ("acronyms", "acronyms", None, None),
+        ("cnum", "cnum", None, None),
+        ("opening_date", "opening_date", convert_to_date, None),
+        ("closing_date", "closing_date", convert_to_date, None),
+        ("addresses", "addresses", None, None),
+        ("contact_details", "contact_details", None, None),
+        ("inspire_categories", "inspire_categories", None, None),
+        ("keywords", "keywords", None, None),
+        ("public_notes", "public_notes", None, None),
+        ("series", "series", None, None),
+        ("urls", "urls", None, None),
+        ("proceedings", "proceedings", None, None),
+        ("number_of_contributions", "number_of_contributions", None, 0),
+        ("core", "core", convert_to_bool, False),
+        ("deleted", "deleted", convert_to_bool, False),
+        ("schema", "$schema", None, None),
+        ("control_number", "control_number", int, None),
+        ("legacy_creation_date", "legacy_creation_date", convert_to_date, None),
+    ))
+
+
+@dataclass
+class Conference(SingleRecordResponse):
+    """Class to contain Inspirehep API single record response for Conference.
+
+    Attribtes
+    ---------
+    id : str
+        The unique identifier of the object.
+
+    created : datetime.datetime
+        The UTC timestamp when object was created.
+
+    updated : datetime.datetime
+        The UTC timestamp when object was las updated.
+
+    links : dict
+        List of related links to current object.
+
+    metadata : ConferenceMetadata
+        Information about the Conference which is an instance ConferenceMetadata object.
+
+    """
+    id: str
+    created: datetime.datetime = None
+    updated: datetime.datetime = None
+    links: dict = None
+    metadata: ConferenceMetadata = None
+
+    METADATA_CLASS = ConferenceMetadata
+
+    @property
+    def control_number(self):
+        """Returns the `control_number` of `self.metadata`
+
+        """
+        return self.metadata.control_number
+
+    def get_id(self, as_int=False):
+        """Returns the conference id in INSPIRE HEP
+
+        """
+        return self.control_number if as_int else str(self.control_number)
+
+    def get_title(self):
+        """Returns the title of the conference if exists.
+
+        """
+        if self.metadata.titles:
+            return self.metadata.titles[0].get("title", None)
+        return None
+
+    def get_cnum(self):
+        """Returns the conference number (cnum) of the conference.
+
+        """
+        return self.metadata.cnum
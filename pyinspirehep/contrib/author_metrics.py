@@ -0,0 +1,315 @@
+"""
+A module to compute publication and citation metrics of authors in bulk.
+
+Instead of getting each author and paging through their literature one by
+one, the `AuthorMetricsCollector` searches the literature of a batch of
+authors with a single query, asks only for the fields needed to compute
+the metrics and attributes each paper to the authors of the batch.
+
+The API returns at most `Client.PAGINATION_LIMIT` results of a query, so
+a batch with more papers is split in halves, and the papers of a single
+author with more papers are searched by ranges of their earliest date.
+"""
+
+import datetime
+import logging
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+)
+from pyinspirehep.client import Client
+from pyinspirehep.query import (
+    And,
+    DateRange,
+    Raw,
+)
+
+
+def h_index(citations: Iterable[int]) -> int:
+    """Returns the h-index of a list of citation counts.
+
+    Parameters
+    ----------
+    citations : Iterable[int]
+        Citation counts of the papers of an author.
+
+    Returns
+    -------
+    int
+
+    >>> h_index([10, 8, 5, 4, 3])
+    4
+    >>> h_index([])
+    0
+    """
+    h = 0
+    for rank, count in enumerate(sorted(citations, reverse=True), start=1):
+        if count < rank:
+            break
+        h = rank
+    return h
+
+
+@dataclass
+class AuthorMetrics:
+    """Publication and citation metrics of an author.
+
+    Attribtes
+    ---------
+    bai : str
+        The INSPIRE BAI of the author.
+
+    paper_count : int
+        The number of papers of the author.
+
+    citation_count : int
+        The total citations of the papers of the author.
+
+    citation_count_without_self_citations : int
+        The total citations of the papers of the author without
+        self citations.
+
+    h_index : int
+        The h-index of the author.
+
+    """
+    bai: str
+    paper_count: int = 0
+    citation_count: int = 0
+    citation_count_without_self_citations: int = 0
+    h_index: int = 0
+
+    @classmethod
+    def from_citations(
+        cls,
+        bai: str,
+        citations: List[int],
+        citations_without_self_citations: List[int],
+        ):
+        """Creates metrics from citation counts of the papers of an author.
+
+        """
+        return cls(
+            bai=bai,
+            paper_count=len(citations),
+            citation_count=sum(citations),
+            citation_count_without_self_citations=sum(
+                citations_without_self_citations,
+                ),
+            h_index=h_index(citations),
+        )
+
+
+class AuthorMetricsCollector:
+    """Class to compute metrics of many authors with batched queries.
+
+    Example:
+    >>> from pyinspirehep.contrib.author_metrics import AuthorMetricsCollector
+    >>> collector = AuthorMetricsCollector()
+    >>> metrics = collector.collect(['J.Ebadi.1', 'G.t.Hooft.1'])
+    >>> metrics['J.Ebadi.1'].h_index
+    """
+
+    # The literature fields needed to compute the metrics.
+    FIELDS = (
+        'control_number',
+        'citation_count',
+        'citation_count_without_self_citations',
+        'authors.bai',
+        )
+
+    # The field of the date ranges which split the papers of an author
+    # with more papers than the pagination limit.
+    DATE_FIELD = 'de'
+    MIN_DATE = datetime.date(1800, 1, 1)
+
+    def __init__(
+        self,
+        client: Client = None,
+        batch_size: int = 20,
+        page_size: int = Client.MAX_RECORDS_PER_PAGE,
+        ) -> None:
+        """
+        Parameters
+        ----------
+        client : Client
+            (Default value None)
+            The client to send requests. A new client will be created
+            if it is not given.
+        batch_size : int
+            (Default value 20)
+            The number of authors searched with a single query.
+        page_size : int
+            (Default value `Client.MAX_RECORDS_PER_PAGE`)
+            The number of papers per page of the search.
+        """
+        self.client = client if client is not None else Client()
+        self.batch_size = batch_size
+        self.page_size = page_size
+        # The number of papers found by the queries without any of the
+        # searched authors, e.g. papers whose authors have no BAI.
+        self.unmatched = 0
+
+    @staticmethod
+    def _create_query(bais: List[str]) -> str:
+        """Returns the query to search literature of all authors in `bais`.
+
+        >>> AuthorMetricsCollector._create_query(['J.Ebadi.1', 'S.Khatibi.1'])
+        'a J.Ebadi.1 or a S.Khatibi.1'
+        """
+        return " or ".join(f"a {bai}" for bai in bais)
+
+    def _search(self, query, page: int = 1) -> dict:
+        return self.client.search_literature(
+            *self.FIELDS,
+            sorting='mostrecent',
+            size=self.page_size,
+            page=page,
+            q=query,
+            )['hits']
+
+    def _iter_pages(self, query, hits: dict) -> Iterator[dict]:
+        """Yields metadata of the papers of a query from its first page.
+
+        """
+        max_pages = self.client.PAGINATION_LIMIT // self.page_size
+        page = 1
+        while True:
+            for hit in hits['hits']:
+                yield hit['metadata']
+            if (
+                page * self.page_size >= hits['total']
+                or not hits['hits']
+                or page >= max_pages
+            ):
+                break
+            page += 1
+            hits = self._search(query, page)
+
+    def _iter_date_ranges(
+        self,
+        query: str,
+        start: datetime.date,
+        end: datetime.date,
+        ) -> Iterator[dict]:
+        """Yields metadata of the papers of a query by earliest date.
+
+        The date range is split in halves until the papers of each range
+        fit the pagination limit.
+        """
+        ranged = And(Raw(query), DateRange(self.DATE_FIELD, start, end))
+        hits = self._search(ranged)
+        if hits['total'] > self.client.PAGINATION_LIMIT and start < end:
+            middle = start + (end - start) // 2
+            yield from self._iter_date_ranges(query, start, middle)
+            yield from self._iter_date_ranges(
+                query,
+                middle + datetime.timedelta(days=1),
+                end,
+                )
+            return
+        if hits['total'] > self.client.PAGINATION_LIMIT:
+            logging.warning(
+                f"More than {self.client.PAGINATION_LIMIT} papers of "
+                f"'{query}' have the earliest date {start}, only "
+                f"{self.client.PAGINATION_LIMIT} of them are counted"
+            )
+        yield from self._iter_pages(ranged, hits)
+
+    def _iter_papers(self, query: str, hits: dict) -> Iterator[dict]:
+        """Yields metadata of the papers of a query from its first page.
+
+        The papers of a query with more results than the pagination
+        limit are searched by ranges of their earliest date.
+        """
+        if hits['total'] <= self.client.PAGINATION_LIMIT:
+            yield from self._iter_pages(query, hits)
+            return
+        count = 0
+        for metadata in self._iter_date_ranges(
+            query,
+            self.MIN_DATE,
+            datetime.date.today(),
+            ):
+            count += 1
+            yield metadata
+        if count < hits['total']:
+            logging.warning(
+                f"{hits['total'] - count} of {hits['total']} papers of "
+                f"'{query}' were not found by date and are not counted"
+            )
+
+    def _collect_batch(self, bais: List[str]) -> Dict[str, AuthorMetrics]:
+        """Returns metrics of a batch of authors.
+
+        A batch with more papers than the pagination limit is split in
+        halves. Papers without any author of the batch are counted in
+        `unmatched` and are not attributed to any author.
+        """
+        query = self._create_query(bais)
+        hits = self._search(query)
+        if hits['total'] > self.client.PAGINATION_LIMIT and len(bais) > 1:
+            middle = len(bais) // 2
+            metrics = self._collect_batch(bais[:middle])
+            metrics.update(self._collect_batch(bais[middle:]))
+            return metrics
+        citations = {bai: [] for bai in bais}
+        citations_without_self = {bai: [] for bai in bais}
+        for metadata in self._iter_papers(query, hits):
+            count = metadata.get('citation_count', 0)
+            count_without_self = metadata.get(
+                'citation_count_without_self_citations', 0,
+                )
+            paper_bais = {
+                author.get('bai') for author in metadata.get('authors', ())
+                }
+            matched = paper_bais.intersection(citations)
+            if not matched:
+                self.unmatched += 1
+            for bai in matched:
+                citations[bai].append(count)
+                citations_without_self[bai].append(count_without_self)
+        return {
+            bai: AuthorMetrics.from_citations(
+                bai,
+                citations[bai],
+                citations_without_self[bai],
+                )
+            for bai in bais
+            }
+
+    def iter_collect(self, bais: Iterable[str]) -> Iterator[AuthorMetrics]:
+        """Yields metrics of authors batch by batch.
+
+        Parameters
+        ----------
+        bais : Iterable[str]
+            INSPIRE BAIs of the authors.
+
+        """
+        batch = []
+        for bai in dict.fromkeys(bais):
+            batch.append(bai)
+            if len(batch) == self.batch_size:
+                yield from self._collect_batch(batch).values()
+                batch = []
+        if batch:
+            yield from self._collect_batch(batch).values()
+
+    def collect(self, bais: Iterable[str]) -> Dict[str, AuthorMetrics]:
+        """Returns metrics of authors as a dict with BAIs as keys.
+
+        Parameters
+        ----------
+        bais : Iterable[str]
+            INSPIRE BAIs of the authors.
+
+        Returns
+        -------
+        Dict[str, AuthorMetrics]
+
+        """
+        return {metrics.bai: metrics for metrics in self.iter_collect(bais)}
@@ -0,0 +1,282 @@
+"""
+A module to resolve author names, BAIs and ORCIDs to author records offline.
+
+The `AuthorIndex` is built from author records, e.g. the json files of
+author search results saved like a clone, and keeps in memory the
+control number of each ORCID, INSPIRE BAI and normalized name, so the
+authors of many papers can be resolved without a request per name to
+`search_authors` or `get_orcid`.
+
+Names are normalized by removing accents, punctuation and case and by
+sorting their words, so 'Ellis, John' and 'John Ellis' have the same
+key. A name is also indexed by its last name and first initial, e.g.
+'ellis j', which matches the abbreviated names of author lists.
+"""
+
+import re
+import unicodedata
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+from pyinspirehep.author import Author
+from pyinspirehep.contrib.loader import CloneLoader
+
+
+ORCID_PATTERN = re.compile(r'^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$')
+BAI_PATTERN = re.compile(r'^[^\s,]+\.\d+$')
+_SEPARATORS = re.compile(r'[^\w]+')
+
+
+def _words(name: str) -> List[str]:
+    """Returns the lower case words of a name without accents.
+
+    >>> _words("Müller-Ellis, J.R.")
+    ['muller', 'ellis', 'j', 'r']
+    """
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    return [word for word in _SEPARATORS.split(name.casefold()) if word]
+
+
+def name_key(name: str) -> str:
+    """Returns the key of a full name, independent of the order of words.
+
+    >>> name_key("Ellis, John") == name_key("john  ELLIS")
+    True
+    """
+    return ' '.join(sorted(_words(name)))
+
+
+def initials_key(name: str) -> Optional[str]:
+    """Returns the key of the last name and the first initial of a name.
+
+    Names with a comma are read as 'Last, First' and others as
+    'First Last'. None is returned for names of a single word.
+
+    >>> initials_key("Ellis, John R.")
+    'ellis j'
+    >>> initials_key("J. Ellis")
+    'ellis j'
+    """
+    if ',' in name:
+        last, first = name.split(',', 1)
+        last, first = _words(last), _words(first)
+    else:
+        words = _words(name)
+        last, first = words[-1:], words[:-1]
+    if not last or not first:
+        return None
+    return f"{' '.join(last)} {first[0][0]}"
+
+
+def _author_entry(author: Author) -> Tuple[int, str, str, List[str]]:
+    """Returns control number, ORCID, BAI and names of an author.
+
+    """
+    names = []
+    if author.name:
+        names = [author.get_name(), author.get_name_preferred()]
+        names.extend(author.get_names_native() or ())
+        names.extend(author.name.get('name_variants') or ())
+    return (
+        author.get_id(as_int=True),
+        author.get_id_orcid(),
+        author.get_id_inspire_bai(),
+        [name for name in names if name],
+    )
+
+
+def _author_entries(authors: List[Author]) -> List[tuple]:
+    return [_author_entry(author) for author in authors]
+
+
+class AuthorIndex:
+    """In-memory lookup of author control numbers by names and ids.
+
+    Attribtes
+    ---------
+    orcids : Dict[str, int]
+        The control number of each ORCID.
+
+    bais : Dict[str, int]
+        The control number of each INSPIRE BAI in lower case.
+
+    names : Dict[str, List[int]]
+        The control numbers of each `name_key` of the names of authors.
+
+    initials : Dict[str, List[int]]
+        The control numbers of each `initials_key` of the names of
+        authors.
+
+    authors : int
+        The number of added authors.
+
+    Example:
+    >>> from pyinspirehep.contrib.authors import AuthorIndex
+    >>> index = AuthorIndex.from_clone(authors_directory, processes=4)
+    >>> index.resolve("0000-0002-7399-0813")
+    [1010819]
+    >>> index.resolve_many(["Ellis, John", "J.R.Ellis.1"])
+    {'Ellis, John': [1010819], 'J.R.Ellis.1': [1010819]}
+    """
+
+    def __init__(self) -> None:
+        self.orcids: Dict[str, int] = {}
+        self.bais: Dict[str, int] = {}
+        self.names: Dict[str, List[int]] = {}
+        self.initials: Dict[str, List[int]] = {}
+        self.authors = 0
+
+    @classmethod
+    def from_clone(cls, directory: str, processes: int = None) -> "AuthorIndex":
+        """Builds the index of the author records of a clone directory.
+
+        The records are decoded by `Author` in worker processes of a
+        `CloneLoader`, which send back only the names and ids.
+        """
+        index = cls()
+        loader = CloneLoader(directory, processes=processes, record_class=Author)
+        for entries in loader.map(_author_entries):
+            for entry in entries:
+                index._add_entry(*entry)
+        return index
+
+    def _add_entry(
+        self,
+        control_number: int,
+        orcid: str,
+        bai: str,
+        names: List[str],
+        ) -> None:
+        self.authors += 1
+        if orcid:
+            self.orcids[orcid.upper()] = control_number
+        if bai:
+            self.bais[bai.lower()] = control_number
+        for keys, key in (
+            *((self.names, name_key(name)) for name in names),
+            *((self.initials, initials_key(name)) for name in names),
+            ):
+            if not key:
+                continue
+            control_numbers = keys.setdefault(key, [])
+            if control_number not in control_numbers:
+                control_numbers.append(control_number)
+
+    def add_author(self, author: Author) -> None:
+        self._add_entry(*_author_entry(author))
+
+    def add_authors(self, authors: Iterable[Author]) -> None:
+        for author in authors:
+            self.add_author(author)
+
+    def __len__(self) -> int:
+        return self.authors
+
+    def get_by_orcid(self, orcid: str) -> int:
+        """Returns the control number of an ORCID or None.
+
+        """
+        return self.orcids.get(orcid.strip().upper())
+
+    def get_by_bai(self, bai: str) -> int:
+        """Returns the control number of an INSPIRE BAI or None.
+
+        """
+        return self.bais.get(bai.strip().lower())
+
+    def get_by_name(self, name: str, initials: bool = True) -> List[int]:
+        """Returns the control numbers of the authors with a name.
+
+        Parameters
+        ----------
+        name : str
+            A name like 'Ellis, John' or 'John Ellis'.
+        initials : bool
+            (Default value = True)
+            If True and no author has the full name, the authors with the
+            same last name and first initial are returned.
+
+        Returns
+        -------
+        List[int]
+            All of the matching authors, so the name is ambiguous if there
+            is more than one.
+
+        """
+        found = self.names.get(name_key(name))
+        if not found and initials:
+            found = self.initials.get(initials_key(name))
+        return list(found or ())
+
+    def resolve(self, identifier: str) -> List[int]:
+        """Returns control numbers of an ORCID, INSPIRE BAI or name.
+
+        The type of the identifier is detected by its format.
+        """
+        identifier = identifier.strip()
+        if ORCID_PATTERN.match(identifier.upper()):
+            found = self.get_by_orcid(identifier)
+            return [found] if found is not None else []
+        if BAI_PATTERN.match(identifier):
+            found = self.get_by_bai(identifier)
+            if found is not None:
+                return [found]
+        return self.get_by_name(identifier)
+
+    def resolve_many(self, identifiers: Iterable[str]) -> Dict[str, List[int]]:
+        """Resolves many identifiers, see `resolve`.
+
+        """
+        return {identifier: self.resolve(identifier) for identifier in identifiers}
+
+    def resolve_literature_authors(
+        self,
+        authors: List[dict],
+        ) -> List[Optional[int]]:
+        """Returns the control numbers of the authors of a literature.
+
+        Authors with `record.$ref` are used as they are, and the others
+        are resolved by the ORCID or BAI in their ids, or by their full
+        name if it matches a single author. Authors which can not be
+        resolved, or whose `$ref` does not end with a control number,
+        are None.
+
+        Parameters
+        ----------
+        authors : List[dict]
+            `LiteratureMetadata.authors`.
+
+        Returns
+        -------
+        List[Optional[int]]
+
+        """
+        control_numbers = []
+        for author in authors or ():
+            ref = (author.get('record') or {}).get('$ref')
+            if ref:
+                try:
+                    control_numbers.append(int(ref.rsplit('/', 1)[-1]))
+                except ValueError:
+                    control_numbers.append(None)
+                continue
+            found = None
+            for id_ in author.get('ids') or ():
+                schema = (id_.get('schema') or '').upper()
+                if schema == 'ORCID':
+                    found = self.get_by_orcid(id_.get('value', ''))
+                elif schema == 'INSPIRE BAI':
+                    found = self.get_by_bai(id_.get('value', ''))
+                if found is not None:
+                    break
+            if found is None and author.get('full_name'):
+                candidates = self.get_by_name(author['full_name'])
+                if len(candidates) == 1:
+                    found = candidates[0]
+            control_numbers.append(found)
+        return control_numbers
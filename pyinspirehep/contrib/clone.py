@@ -2,10 +2,33 @@
 A module to get all information from Inspirehep API.
 """
 
+import bisect
+import datetime
+import logging
 import os
-import json
-from tabnanny import verbose
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+)
 from pyinspirehep.client import Client
+from pyinspirehep.query import (
+    DateRange,
+    Or,
+    Range,
+)
+from pyinspirehep.compression import (
+    dump_json_file,
+    get_file_codec,
+    get_codec,
+    load_json_file,
+    write_dictionary,
+)
+from pyinspirehep.contrib.loader import (
+    EXTENSIONS,
+    _file_order,
+)
 
 
 class LiteratureClone:
@@ -31,6 +54,10 @@ class LiteratureClone:
         directory=None,
         record_numbers=500,
         verbose=2,
+        compression=None,
+        dictionary=None,
+        client: Client = None,
+        fields: List[str] = None,
         ) -> None:
         """
         Parameters
@@ -44,18 +71,47 @@ class LiteratureClone:
             (Default value 2)
             Determines the amount of information to be printed during clone.
             When it is 2 the maximum inofrmation will be printed.
+        compression : str
+            (Default value None)
+            If 'gzip' or 'zstd' the json files will be saved compressed.
+        dictionary : bytes
+            (Default value None)
+            The zstd dictionary to compress the json files, e.g. created
+            by `pyinspirehep.compression.train_dictionary`. It is saved in
+            the directory to be used when the files are loaded.
+        client : Client
+            (Default value None)
+            The client to send requests, e.g. a client shared with
+            interactive lookups. A new client will be created if it is
+            None. The requests of the clone have the `bulk_priority` of
+            the client.
+        fields : List[str]
+            (Default value None)
+            The fields of metadata to clone, e.g. ['titles']. The
+            'control_number' is always cloned, because the records are
+            saved and synchronized by it. All fields are cloned when it
+            is None.
         """
         if directory is None:
             raise ValueError("You must determine the directory name to save cloned data")
         self.collection = []
-        self.client = Client()
+        self.records = 0
+        self.fields = list(fields or [])
+        if self.fields and 'control_number' not in self.fields:
+            self.fields.append('control_number')
+        self.client = client if client is not None else Client()
         self.record_numbers = record_numbers
         self.verbose = verbose
         self.directory = directory
         if os.path.isdir(self.directory):
             pass
         else:
-            self.directory = os.makedirs(self.directory)
+            os.makedirs(self.directory)
+        self.codec = None
+        if compression is not None:
+            self.codec = get_codec(compression, dictionary=dictionary)
+            if dictionary is not None:
+                write_dictionary(self.directory, dictionary)
 
     def clean(self) -> None:
         self.collection = []
@@ -74,8 +130,14 @@ class LiteratureClone:
 
         """
         filename = os.path.join(self.directory, filename)
-        with open(filename, 'w') as f:
-            json.dump(self.collection, f)
+        dump_json_file(self.collection, filename, self.codec)
+
+    def is_saved(self, filename: str) -> bool:
+        """Returns True if the json file is saved, compressed or not.
+
+        """
+        stem = os.path.join(self.directory, filename.split('.', 1)[0])
+        return any(os.path.isfile(stem + extension) for extension in EXTENSIONS)
 
     def _get_by_control_number(self, start) -> list:
         """Gets literatures list by using control number field.
@@ -88,18 +150,66 @@ class LiteratureClone:
         -------
         List
             list of all literatures by control_number between `start` and
-            `start` + `self.record_number`.
+            `start` + `self.record_number` (excluded).
+        """
+        with self.client.priority(self.client.bulk_priority):
+            return self.client.search_literature(
+                *self.fields,
+                q=Range('control_number', start, start + self.record_numbers - 1),
+                size=self.record_numbers,
+                )['hits']['hits']
+
+    def _batches(
+        self,
+        min_control_number: int,
+        max_control_number: int,
+        batch_record_number: int,
+        ) -> Iterator[Tuple[int, List[int]]]:
+        """Yields the number of each json file and its page starts.
+
+        A file ends with the page whose end is a multiple of
+        `batch_record_number`, and the last pages make a file too. The
+        file of the last pages is replaced by a complete file when a
+        later clone goes further, see `_remove_covered`.
+        """
+        starts = []
+        for start in range(
+            min_control_number,
+            max_control_number,
+            self.record_numbers
+            ):
+            starts.append(start)
+            if (start + self.record_numbers) % batch_record_number == 0:
+                yield start + self.record_numbers, starts
+                starts = []
+        if starts:
+            yield starts[-1] + self.record_numbers, starts
+
+    def _iter_pages(
+        self,
+        starts: List[int],
+        max_workers: int = 1,
+        ) -> Iterator[Tuple[int, list]]:
+        """Yields start and records of pages as they are received.
+
         """
-        return self.client.search_literature(
-            q=f'control_number:{start}->{start+self.record_numbers}',
-            size=self.record_numbers,
-            )['hits']['hits']
+        if max_workers == 1:
+            for start in starts:
+                yield start, self._get_by_control_number(start)
+            return
+        yield from self.client.map(
+            self._get_by_control_number,
+            starts,
+            max_workers=max_workers,
+            )
 
     def clone(
         self,
         min_control_number=0,
         max_control_number=2000000,
         batch_record_number=10000,
+        max_workers=1,
+        resume=False,
         ):
         """Clones all literature data in given interval.
 
@@ -114,25 +224,230 @@ class LiteratureClone:
             When the control numbers modolue to `batch_record_number`
             is 0 it will be saved in hard disc and the `self.collection`
             will be cleared.
+        max_workers : int
+            (Default 1)
+            The number of pages of a json file requested concurrently.
+            The records are saved in the order of pages anyway.
+        resume : bool
+            (Default False)
+            If True, json files which are already saved are skipped, so
+            an interrupted clone can be continued.
         
         """
-        for start in range(
+        for number, starts in self._batches(
             min_control_number,
             max_control_number,
-            self.record_numbers
+            batch_record_number,
             ):
-            current_records = self._get_by_control_number(start)
-            self.collection.extend(current_records)
-            if self.verbose >= 2:
-                print(f"current collection size = {len(self.collection)}")
-            if (start + self.record_numbers) % batch_record_number == 0:
-                if self.verbose >=1:
-                    print("----------------------------------------------->")
-                    print(f"Saving json file number = {start + self.record_numbers}")
-                self.save(str(start + self.record_numbers)+".json")
+            filename = str(number) + ".json"
+            if resume and self.is_saved(filename):
+                if self.verbose >= 1:
+                    print(f"Skipping saved json file number = {number}")
+                continue
+            pages = {}
+            size = len(self.collection)
+            for start, current_records in self._iter_pages(starts, max_workers):
+                pages[start] = current_records
+                self.records += len(current_records)
+                size += len(current_records)
+                if self.verbose >= 2:
+                    print(f"current collection size = {size}")
+            for start in starts:
+                self.collection.extend(pages.pop(start))
+            if self.verbose >=1:
+                print("----------------------------------------------->")
+                print(f"Saving json file number = {number}")
+            self.save(filename)
+            self._remove_covered(starts[0], number)
+            if self.verbose >= 1:
+                print("-----------------------------------------------<")
+            self.clean()
+
+    def _remove_covered(self, start: int, number: int) -> None:
+        """Removes json files whose records are in a file saved after them.
+
+        A clone whose last file was partial, e.g. '1500.json' of a clone
+        up to 1500, leaves that file behind when it is resumed up to a
+        larger control number and '2000.json' is saved, so the records
+        from 1000 to 1499 would be in both files.
+        """
+        numbers, paths = self._files()
+        for file_number, path in zip(numbers, paths):
+            if start < file_number < number:
+                os.remove(path)
                 if self.verbose >= 1:
-                    print("-----------------------------------------------<")
-                self.clean()
+                    print(f"Removing json file number = {file_number}")
+
+    def _files(self) -> Tuple[List[int], List[str]]:
+        """Returns the numbers and paths of saved json files in order.
+
+        """
+        names = sorted(
+            (
+                name for name in os.listdir(self.directory)
+                if name.endswith(EXTENSIONS)
+                and name.split('.', 1)[0].isdigit()
+            ),
+            key=_file_order,
+            )
+        return (
+            [int(name.split('.', 1)[0]) for name in names],
+            [os.path.join(self.directory, name) for name in names],
+            )
+
+    def _get_updated_in(self, query: DateRange) -> List[int]:
+        """Returns control numbers of records updated in a date range.
+
+        A range with more updated records than the pagination limit of
+        the API is split in halves until the records of each range fit.
+        """
+        size = self.client.MAX_RECORDS_PER_PAGE
+        control_numbers = []
+        for page in range(1, self.client.MAX_PAGES + 1):
+            with self.client.priority(self.client.bulk_priority):
+                hits = self.client.search_literature(
+                    'control_number',
+                    q=query,
+                    size=size,
+                    page=page,
+                    )['hits']
+            if page == 1 and hits['total'] > self.client.PAGINATION_LIMIT:
+                if query.start < query.end:
+                    middle = query.start + (query.end - query.start) // 2
+                    return (
+                        self._get_updated_in(
+                            DateRange(query.field, query.start, middle)
+                            )
+                        + self._get_updated_in(DateRange(
+                            query.field,
+                            middle + datetime.timedelta(days=1),
+                            query.end,
+                            ))
+                        )
+                logging.warning(
+                    f"More than {self.client.PAGINATION_LIMIT} records were "
+                    f"updated on {query.start}, only "
+                    f"{self.client.PAGINATION_LIMIT} of them are synchronized"
+                )
+            control_numbers.extend(
+                hit['metadata']['control_number'] for hit in hits['hits']
+                )
+            if page * size >= hits['total'] or not hits['hits']:
+                break
+        return control_numbers
+
+    def _get_updated_control_numbers(
+        self,
+        since: datetime.date,
+        until: datetime.date,
+        step_days: int = 7,
+        ) -> List[int]:
+        """Returns control numbers of records updated between two dates.
+
+        The interval is split to ranges of `step_days` days, and ranges
+        whose results exceed the pagination limit of the API are split
+        further.
+        """
+        control_numbers = []
+        for query in DateRange('du', since, until).split(step_days):
+            control_numbers.extend(self._get_updated_in(query))
+        return control_numbers
+
+    def _get_by_control_numbers(self, query) -> list:
+        with self.client.priority(self.client.bulk_priority):
+            return self.client.search_literature(
+                *self.fields,
+                q=query,
+                size=self.record_numbers,
+                )['hits']['hits']
+
+    def sync(
+        self,
+        since: datetime.date,
+        until: datetime.date = None,
+        step_days: int = 7,
+        max_workers: int = 1,
+        ) -> int:
+        """Updates the saved json files with the records updated since a date.
+
+        The updated records are requested again and are replaced in (or
+        added to) the json file which covers their control number. Records
+        whose control number is after the last json file are not added;
+        `clone` should be used to extend the clone.
+
+        Parameters
+        ----------
+        since : datetime.date
+            The records updated since this date are synchronized, e.g. the
+            date when the clone was started.
+        until : datetime.date
+            (Default None)
+            The last date of updates. When it is None today is used.
+        step_days : int
+            (Default 7)
+            The number of days of updates searched by each query.
+        max_workers : int
+            (Default 1)
+            The number of concurrent requests of updated records.
+
+        Returns
+        -------
+        int
+            The number of updated records.
+
+        """
+        if until is None:
+            until = datetime.date.today()
+        numbers, paths = self._files()
+        updated: Dict[int, set] = {}
+        for control_number in self._get_updated_control_numbers(
+            since,
+            until,
+            step_days,
+            ):
+            index = bisect.bisect_right(numbers, control_number)
+            if index < len(numbers):
+                updated.setdefault(index, set()).add(control_number)
+        count = 0
+        for index, control_numbers in sorted(updated.items()):
+            queries = Or.of('control_number', sorted(control_numbers)).split(
+                max_terms=self.record_numbers,
+                )
+            if max_workers == 1:
+                pages = map(self._get_by_control_numbers, queries)
+            else:
+                pages = (
+                    records for _, records in self.client.map(
+                        self._get_by_control_numbers,
+                        queries,
+                        max_workers=max_workers,
+                        )
+                    )
+            records = {
+                record['metadata']['control_number']: record
+                for page in pages
+                for record in page
+                }
+            received = len(records)
+            path = paths[index]
+            collection = load_json_file(path)
+            for i, record in enumerate(collection):
+                control_number = record.get('metadata', {}).get('control_number')
+                if control_number in records:
+                    collection[i] = records.pop(control_number)
+            collection.extend(records.values())
+            codec = get_file_codec(path)
+            if codec is not None:
+                path = path[:-len(codec.extension)]
+            dump_json_file(collection, path, codec)
+            self.records += received
+            count += received
+            if self.verbose >= 1:
+                print(
+                    f"Updated {received} records of json file "
+                    f"number = {numbers[index]}"
+                )
+        return count
 
 
 if __name__ == '__main__':
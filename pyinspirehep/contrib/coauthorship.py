@@ -0,0 +1,348 @@
+"""
+A module to build the co-authorship network of cloned literature.
+
+The `CoauthorshipGraph` streams over the records of a clone and counts
+the papers shared by each pair of authors. Authors are identified by the
+control numbers in `record.$ref` of `LiteratureMetadata.authors` and are
+interned to consecutive node indices. Edges are accumulated in a dict of
+bounded size which is spilled to compact typed arrays, whose entries of
+the same edge are summed with NumPy when the arrays have doubled, and
+papers of large collaborations are kept as lists of authors which are
+expanded only when the matrix is exported, so no Python objects are
+created per pair of their authors.
+"""
+
+from array import array
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+)
+from pyinspirehep.contrib.loader import CloneLoader
+
+
+# Pairs of nodes are encoded as `i << _KEY_BITS | j` keys.
+_KEY_BITS = 32
+
+
+def _author_ids(metadata: dict) -> array:
+    """Returns control numbers of the authors of a literature record.
+
+    Authors which are not linked to an author record are skipped.
+
+    >>> list(_author_ids({'authors': [{'record': {'$ref': 'https://inspirehep.net/api/authors/1679997'}}, {'full_name': 'Doe, J.'}]}))
+    [1679997]
+    """
+    ids = array('q')
+    for author in metadata.get('authors') or ():
+        ref = (author.get('record') or {}).get('$ref')
+        if ref:
+            ids.append(int(ref.rsplit('/', 1)[-1]))
+    return ids
+
+
+def _papers_authors(records: List[dict]) -> List[array]:
+    """Returns the author ids of each json record of a clone file.
+
+    """
+    return [_author_ids(record.get('metadata', {})) for record in records]
+
+
+class CoauthorshipGraph:
+    """Weighted co-authorship graph of literature records.
+
+    The weight of the edge of two authors is the number of papers they
+    share or, if `fractional` is True, the sum of `1 / (n - 1)` over
+    these papers where `n` is the number of authors of a paper.
+
+    Parameters
+    ----------
+    max_pair_authors : int
+        (Default value = 100)
+        Papers with more authors are kept as lists of authors instead of
+        pairs, and their pairs are created by SciPy when the matrix is
+        exported.
+
+    fractional : bool
+        (Default value = False)
+        If True, the weight of a paper is divided between its authors.
+
+    max_pending_edges : int
+        (Default value = 1000000)
+        The maximum number of edges accumulated in a dict before they are
+        spilled to typed arrays. Edges spilled more than once are summed
+        when the arrays have twice as many entries as after they were
+        last summed (if NumPy is installed), so they grow with the number
+        of distinct edges.
+
+    Attribtes
+    ---------
+    author_ids : array
+        The control number of the author of each node.
+
+    index : Dict[int, int]
+        The node of each author control number.
+
+    papers : int
+        The number of papers added with at least two authors.
+
+    Example:
+    >>> from pyinspirehep.contrib.coauthorship import CoauthorshipGraph
+    >>> graph = CoauthorshipGraph.from_clone(directory, processes=4)
+    >>> matrix = graph.to_scipy()
+    >>> coauthors = matrix[graph.index[1679997]].indices
+    >>> [graph.author_ids[node] for node in coauthors]
+    """
+
+    def __init__(
+        self,
+        max_pair_authors: int = 100,
+        fractional: bool = False,
+        max_pending_edges: int = 1000000,
+        ) -> None:
+        self.max_pair_authors = max_pair_authors
+        self.fractional = fractional
+        self.max_pending_edges = max_pending_edges
+        self.author_ids = array('q')
+        self.index: Dict[int, int] = {}
+        self.papers = 0
+        self._pending: Dict[int, float] = {}
+        self._rows = array('i')
+        self._cols = array('i')
+        self._data = array('d')
+        # The number of spilled entries after they were last summed.
+        self._compacted = 0
+        # Nodes of large papers, concatenated, with their offsets.
+        self._group_nodes = array('i')
+        self._group_offsets = array('q', [0])
+        self._group_weights = array('d')
+
+    @classmethod
+    def from_clone(
+        cls,
+        directory: str,
+        processes: int = None,
+        **kwargs,
+        ) -> "CoauthorshipGraph":
+        """Builds the graph of the literature records of a clone.
+
+        The author ids are extracted from the json files in worker
+        processes of a `CloneLoader` and the records are not decoded.
+
+        Parameters
+        ----------
+        directory : str or path
+            The directory of the clone.
+        processes : int
+            (Default value = None)
+            The number of worker processes of the `CloneLoader`.
+        **kwargs :
+            Passed to `CoauthorshipGraph`.
+
+        """
+        graph = cls(**kwargs)
+        loader = CloneLoader(directory, processes=processes)
+        for papers in loader.map(_papers_authors, raw=True):
+            graph.add_papers(papers)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.author_ids)
+
+    def intern(self, author_id: int) -> int:
+        """Returns the node of an author and adds it if it is new.
+
+        """
+        node = self.index.get(author_id)
+        if node is None:
+            node = self.index[author_id] = len(self.author_ids)
+            self.author_ids.append(author_id)
+        return node
+
+    def add_paper(self, author_ids: Iterable[int]) -> None:
+        """Adds the edges between the authors of a paper.
+
+        Parameters
+        ----------
+        author_ids : Iterable[int]
+            The control numbers of the authors of the paper. Duplicates
+            are counted once.
+
+        """
+        intern = self.intern
+        nodes = sorted({intern(author_id) for author_id in author_ids})
+        n = len(nodes)
+        if n < 2:
+            return
+        self.papers += 1
+        weight = 1 / (n - 1) if self.fractional else 1.0
+        if n > self.max_pair_authors:
+            self._group_nodes.extend(nodes)
+            self._group_offsets.append(len(self._group_nodes))
+            self._group_weights.append(weight)
+            return
+        pending = self._pending
+        get = pending.get
+        for a in range(n - 1):
+            base = nodes[a] << _KEY_BITS
+            for j in nodes[a + 1:]:
+                key = base | j
+                pending[key] = get(key, 0.0) + weight
+        if len(pending) >= self.max_pending_edges:
+            self._spill()
+
+    def add_papers(self, papers: Iterable[Iterable[int]]) -> None:
+        """Adds papers given as lists of author control numbers.
+
+        """
+        for author_ids in papers:
+            self.add_paper(author_ids)
+
+    def add_records(self, records: Iterable[dict]) -> None:
+        """Adds json literature records, e.g. records of a clone file.
+
+        """
+        for record in records:
+            self.add_paper(_author_ids(record.get('metadata', {})))
+
+    def _extend(self, edges: Dict[int, float]) -> None:
+        """Appends edges given by keys and weights to the typed arrays.
+
+        """
+        mask = (1 << _KEY_BITS) - 1
+        keys = edges.keys()
+        self._rows.extend(key >> _KEY_BITS for key in keys)
+        self._cols.extend(key & mask for key in keys)
+        self._data.extend(edges.values())
+
+    def _spill(self) -> None:
+        """Moves the accumulated edges to the typed arrays.
+
+        """
+        self._extend(self._pending)
+        self._pending = {}
+        if len(self._data) >= 2 * max(self._compacted, self.max_pending_edges):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Sums the weights of the spilled entries of the same edge.
+
+        The entries are reduced as NumPy arrays, so no Python object is
+        created per edge. Without NumPy they are summed when the matrix is
+        exported.
+        """
+        self._compacted = len(self._data)
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        keys = (
+            np.frombuffer(self._rows, dtype=np.intc).astype(np.int64) << _KEY_BITS
+            | np.frombuffer(self._cols, dtype=np.intc)
+            )
+        keys, inverse = np.unique(keys, return_inverse=True)
+        weights = np.bincount(
+            inverse.ravel(),
+            weights=np.frombuffer(self._data, dtype=np.float64),
+            minlength=len(keys),
+            )
+        self._rows = array('i', (keys >> _KEY_BITS).astype(np.intc).tobytes())
+        self._cols = array(
+            'i',
+            (keys & ((1 << _KEY_BITS) - 1)).astype(np.intc).tobytes(),
+            )
+        self._data = array('d', weights.tobytes())
+        self._compacted = len(self._data)
+
+    def to_coo(self, symmetric: bool = True) -> Tuple[array, array, array]:
+        """Returns the edges as row, column and weight arrays.
+
+        The arrays can be passed to `scipy.sparse.coo_matrix((data, (row,
+        col)))`. An edge may have several entries, which are summed by
+        SciPy. The pairs of authors of large papers are expanded, so
+        `to_scipy` should be preferred for collections with large
+        collaborations.
+
+        Parameters
+        ----------
+        symmetric : bool
+            (Default value = True)
+            If False only edges with `row < col` are returned.
+
+        Returns
+        -------
+        Tuple[array, array, array]
+
+        """
+        self._spill()
+        rows = array('i', self._rows)
+        cols = array('i', self._cols)
+        data = array('d', self._data)
+        offsets = self._group_offsets
+        for group, weight in enumerate(self._group_weights):
+            nodes = self._group_nodes[offsets[group]:offsets[group + 1]]
+            for a in range(len(nodes) - 1):
+                count = len(nodes) - a - 1
+                rows.extend(array('i', [nodes[a]]) * count)
+                cols.extend(nodes[a + 1:])
+                data.extend(array('d', [weight]) * count)
+        if symmetric:
+            rows, cols = rows + cols, cols + rows
+            data = data + data
+        return rows, cols, data
+
+    def to_scipy(self, format: str = 'csr', symmetric: bool = True):
+        """Returns the weighted adjacency matrix as a SciPy sparse matrix.
+
+        The row and column of an author is its node in `index`. The pairs
+        of large papers are created by the product of the sparse
+        incidence matrix of papers and authors.
+
+        Parameters
+        ----------
+        format : str
+            (Default value = 'csr')
+            The sparse format, e.g. 'csr', 'csc' or 'coo'.
+        symmetric : bool
+            (Default value = True)
+            If False only the upper triangle is returned.
+
+        """
+        try:
+            import numpy as np
+            import scipy.sparse as sparse
+        except ImportError:
+            raise ImportError(
+                "SciPy is required to export the matrix, "
+                "install it with `pip install pyinspirehep[graph]`"
+            )
+        self._spill()
+        shape = (len(self.author_ids), len(self.author_ids))
+        matrix = sparse.coo_matrix(
+            (
+                np.frombuffer(self._data, dtype=np.float64),
+                (
+                    np.frombuffer(self._rows, dtype=np.intc),
+                    np.frombuffer(self._cols, dtype=np.intc),
+                ),
+            ),
+            shape=shape,
+            ).tocsr()
+        if self._group_weights:
+            incidence = sparse.csr_matrix(
+                (
+                    np.ones(len(self._group_nodes)),
+                    np.frombuffer(self._group_nodes, dtype=np.intc),
+                    np.frombuffer(self._group_offsets, dtype=np.int64),
+                ),
+                shape=(len(self._group_weights), shape[1]),
+                )
+            weights = sparse.diags(
+                np.frombuffer(self._group_weights, dtype=np.float64),
+                )
+            groups = incidence.T.tocsr() @ weights @ incidence
+            matrix = matrix + sparse.triu(groups, k=1, format='csr')
+        if symmetric:
+            matrix = matrix + matrix.T
+        return matrix.asformat(format)
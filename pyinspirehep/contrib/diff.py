@@ -0,0 +1,236 @@
+"""
+A module to find the records which changed between two snapshots.
+
+Each record of a snapshot is reduced to the hash of its canonical json,
+and the hashes of two snapshots are compared by control number
+with a merge of two sorted streams, so neither snapshot is loaded into
+memory. The changes are written to a compact change log with a line per
+added, removed or changed record:
+
+    A	1713040	5b0c2a...
+    M	1713041	9e81f7...
+    D	1713042
+"""
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+)
+from pyinspirehep.contrib.loader import CloneLoader
+
+
+# The operations of a change log.
+ADDED = 'A'
+REMOVED = 'D'
+CHANGED = 'M'
+
+
+def canonical_json(record: dict) -> bytes:
+    """Returns the canonical json of a record, independent of key order.
+
+    >>> canonical_json({'b': 1, 'a': [1, 2]})
+    b'{"a":[1,2],"b":1}'
+    """
+    return json.dumps(
+        record,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        ).encode()
+
+
+def content_hash(data: bytes) -> str:
+    """Returns the hash of the canonical json of a record as hex.
+
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def record_hash(record: dict) -> str:
+    """Returns the content hash of a json record.
+
+    The whole record is hashed, not only its metadata, because it is the
+    name of the record in a `RecordStore` too. Change logs written when
+    only the metadata was hashed have other hashes, so their hashes
+    should not be compared with new ones.
+
+    >>> record_hash({'a': 1, 'b': 2}) == record_hash({'b': 2, 'a': 1})
+    True
+    """
+    return content_hash(canonical_json(record))
+
+
+def _file_hashes(records: List[dict]) -> List[Tuple[int, str]]:
+    """Returns control numbers and hashes of records sorted by control number.
+
+    """
+    hashes = [
+        (int(record['metadata']['control_number']), record_hash(record))
+        for record in records
+        ]
+    hashes.sort()
+    return hashes
+
+
+class CloneSnapshot:
+    """Snapshot of the records of a clone directory.
+
+    The hashes of each json file are computed in worker processes of a
+    `CloneLoader`. The control numbers of the files must be in ranges
+    ordered like the files, as they are in clones made by
+    `LiteratureClone`. A control number which is repeated, e.g. in two
+    files of a clone whose ranges share their boundary, is yielded once
+    with the hash of its last record.
+
+    Parameters
+    ----------
+    directory : str or path
+        The directory of the clone.
+    processes : int
+        (Default value = None)
+        The number of worker processes of the `CloneLoader`.
+    """
+
+    def __init__(self, directory: str, processes: int = None) -> None:
+        self.directory = directory
+        self.loader = CloneLoader(directory, processes=processes)
+
+    def iter_hashes(self) -> Iterator[Tuple[int, str]]:
+        """Yields control numbers and hashes of records in order.
+
+        """
+        previous = None
+        for hashes in self.loader.map(_file_hashes, raw=True):
+            for item in hashes:
+                if previous is not None:
+                    if item[0] < previous[0]:
+                        raise ValueError(
+                            f"The files of {self.directory} are not ordered "
+                            f"by control number ({item[0]} after {previous[0]})"
+                        )
+                    if item[0] != previous[0]:
+                        yield previous
+                previous = item
+        if previous is not None:
+            yield previous
+
+
+class Change(NamedTuple):
+    """A change of a record between two snapshots.
+
+    Attribtes
+    ---------
+    operation : str
+        `ADDED`, `REMOVED` or `CHANGED`.
+
+    control_number : int
+
+    hash : str
+        The hash of the record in the new snapshot, None for removed
+        records.
+
+    """
+    operation: str
+    control_number: int
+    hash: str = None
+
+
+def _snapshot(source):
+    if isinstance(source, (str, os.PathLike)):
+        return CloneSnapshot(source)
+    return source
+
+
+def diff_snapshots(old, new) -> Iterator[Change]:
+    """Yields the changes from `old` to `new` snapshot by control number.
+
+    Parameters
+    ----------
+    old :
+        A clone directory or a snapshot with an `iter_hashes` method
+        which yields control numbers and hashes in order, e.g.
+        `CloneSnapshot` or the `StoreSnapshot` of a `RecordStore`.
+    new :
+        Like `old`.
+
+    Returns
+    -------
+    Iterator[Change]
+
+    """
+    old_hashes = iter(_snapshot(old).iter_hashes())
+    new_hashes = iter(_snapshot(new).iter_hashes())
+    old_item = next(old_hashes, None)
+    new_item = next(new_hashes, None)
+    while old_item is not None or new_item is not None:
+        if new_item is None or (
+            old_item is not None and old_item[0] < new_item[0]
+        ):
+            yield Change(REMOVED, old_item[0])
+            old_item = next(old_hashes, None)
+        elif old_item is None or new_item[0] < old_item[0]:
+            yield Change(ADDED, new_item[0], new_item[1])
+            new_item = next(new_hashes, None)
+        else:
+            if old_item[1] != new_item[1]:
+                yield Change(CHANGED, new_item[0], new_item[1])
+            old_item = next(old_hashes, None)
+            new_item = next(new_hashes, None)
+
+
+def _open(path: str, mode: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def write_change_log(changes: Iterable[Change], path) -> Dict[str, int]:
+    """Writes changes as tab separated lines and returns their counts.
+
+    Parameters
+    ----------
+    changes : Iterable[Change]
+    path : str or file
+        The path of the change log, which is compressed with gzip if it
+        ends with '.gz', or a text file to write to.
+
+    Returns
+    -------
+    Dict[str, int]
+        The number of changes of each operation.
+
+    """
+    counts = {ADDED: 0, CHANGED: 0, REMOVED: 0}
+    if hasattr(path, 'write'):
+        context = contextlib.nullcontext(path)
+    else:
+        context = _open(path, 'w')
+    with context as f:
+        for change in changes:
+            counts[change.operation] += 1
+            if change.hash is None:
+                f.write(f"{change.operation}\t{change.control_number}\n")
+            else:
+                f.write(
+                    f"{change.operation}\t{change.control_number}\t{change.hash}\n"
+                )
+    return counts
+
+
+def read_change_log(path: str) -> Iterator[Change]:
+    """Yields the changes of a change log.
+
+    """
+    with _open(path, 'r') as f:
+        for line in f:
+            fields = line.rstrip('\n').split('\t')
+            yield Change(fields[0], int(fields[1]), *fields[2:])
@@ -0,0 +1,301 @@
+"""
+A module to export cloned literature to columnar files.
+
+The `ArrowExporter` streams the json files of a clone and writes each
+one as a Parquet or Arrow IPC file with a schema derived from the fields
+of `LiteratureMetadata`, so the clone can be scanned by column with
+tools like Spark or DuckDB without parsing json again, e.g.
+`SELECT control_number, citation_count FROM 'parquet/*.parquet'`.
+"""
+
+import dataclasses
+import datetime
+import functools
+import json
+import os
+from typing import (
+    Callable,
+    Dict,
+    List,
+)
+from pyinspirehep.contrib.loader import CloneLoader
+from pyinspirehep.literature import LiteratureMetadata
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+# Extensions of the exported files for each format.
+FORMATS = {
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+    }
+
+
+def _require_pyarrow() -> None:
+    if pyarrow is None:
+        raise ImportError(
+            "Exporting to Parquet or Arrow requires pyarrow, install it "
+            "using 'pip install pyinspirehep[arrow]'"
+        )
+
+
+def _record_id(item: dict):
+    """Returns the control number in `record.$ref` of an item or None.
+
+    >>> _record_id({'record': {'$ref': 'https://inspirehep.net/api/literature/3438'}})
+    3438
+    """
+    ref = (item.get('record') or {}).get('$ref')
+    return int(ref.rsplit('/', 1)[-1]) if ref else None
+
+
+def _author_row(author: dict) -> dict:
+    return {
+        'full_name': author.get('full_name'),
+        'recid': _record_id(author),
+        'bai': author.get('bai'),
+        'affiliations': [
+            affiliation.get('value')
+            for affiliation in author.get('affiliations') or ()
+            ],
+        }
+
+
+def _reference_row(reference: dict) -> dict:
+    details = reference.get('reference') or {}
+    return {
+        'recid': _record_id(reference),
+        'label': details.get('label'),
+        'arxiv_eprint': details.get('arxiv_eprint'),
+        'dois': details.get('dois'),
+        }
+
+
+def _nested_types() -> Dict[str, tuple]:
+    """Returns the arrow type and the converter of the nested fields.
+
+    Authors and references are lists of structs of their main fields, so
+    they can be joined to other records by `recid`.
+    """
+    string_list = pyarrow.list_(pyarrow.string())
+    author = pyarrow.struct([
+        ('full_name', pyarrow.string()),
+        ('recid', pyarrow.int64()),
+        ('bai', pyarrow.string()),
+        ('affiliations', string_list),
+        ])
+    reference = pyarrow.struct([
+        ('recid', pyarrow.int64()),
+        ('label', pyarrow.string()),
+        ('arxiv_eprint', pyarrow.string()),
+        ('dois', string_list),
+        ])
+    return {
+        'authors': (pyarrow.list_(author), _author_row),
+        'references': (pyarrow.list_(reference), _reference_row),
+        }
+
+
+def _to_str(value):
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def _to_date(value):
+    return value if isinstance(value, datetime.date) else None
+
+
+def _to_json(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _list_of(converter: Callable) -> Callable:
+    def convert(value):
+        if isinstance(value, dict):
+            value = [value]
+        elif not isinstance(value, list):
+            return None
+        return [converter(item) for item in value]
+    return convert
+
+
+def _field_type(field: dataclasses.Field) -> tuple:
+    """Returns the arrow type and the converter of a metadata field.
+
+    Lists of dicts other than the nested fields are kept as lists of
+    json strings, because their keys differ from record to record.
+    """
+    nested = _nested_types()
+    if field.name in nested:
+        arrow_type, converter = nested[field.name]
+        return arrow_type, _list_of(converter)
+    if field.name == 'control_number':
+        return pyarrow.int64(), int
+    scalars = {
+        str: (pyarrow.string(), _to_str),
+        int: (pyarrow.int64(), int),
+        bool: (pyarrow.bool_(), bool),
+        datetime.date: (pyarrow.date32(), _to_date),
+        dict: (pyarrow.string(), _to_json),
+        }
+    if getattr(field.type, '__origin__', None) is list:
+        (item_type,) = field.type.__args__
+        arrow_type, converter = scalars[item_type]
+        return pyarrow.list_(arrow_type), _list_of(converter)
+    return scalars[field.type]
+
+
+def arrow_schema(metadata_class: type = LiteratureMetadata):
+    """Returns the arrow schema of the fields of a metadata data model.
+
+    Parameters
+    ----------
+    metadata_class : type
+        (Default value = LiteratureMetadata)
+        A dataclass whose fields have the types str, int, bool, date,
+        dict or lists of them.
+
+    Returns
+    -------
+    pyarrow.Schema
+
+    """
+    _require_pyarrow()
+    return pyarrow.schema([
+        (field.name, _field_type(field)[0])
+        for field in dataclasses.fields(metadata_class)
+        ])
+
+
+def _converters(metadata_class: type) -> List[tuple]:
+    return [
+        (field.name, _field_type(field)[1])
+        for field in dataclasses.fields(metadata_class)
+        ]
+
+
+def records_to_table(
+    records: List[dict],
+    metadata_class: type = LiteratureMetadata,
+    ):
+    """Returns an arrow table of the metadata of json records.
+
+    Parameters
+    ----------
+    records : List[dict]
+        Json records, e.g. the content of a clone file.
+    metadata_class : type
+        (Default value = LiteratureMetadata)
+
+    Returns
+    -------
+    pyarrow.Table
+
+    """
+    _require_pyarrow()
+    converters = _converters(metadata_class)
+    columns = {name: [] for name, _ in converters}
+    decode = metadata_class.DECODER.decode
+    for record in records:
+        values = decode(record.get('metadata', {}))
+        for name, converter in converters:
+            value = values[name]
+            columns[name].append(None if value is None else converter(value))
+    return pyarrow.Table.from_pydict(columns, schema=arrow_schema(metadata_class))
+
+
+class ArrowExporter:
+    """Class to export a literature clone to Parquet or Arrow IPC files.
+
+    Each json file of the clone is converted in a worker process of a
+    `CloneLoader` and written as a partition with the same name, e.g.
+    `1000.json.gz` is written to `1000.parquet`.
+
+    Example:
+    >>> from pyinspirehep.contrib.export import ArrowExporter
+    >>> exporter = ArrowExporter(clone_directory, "parquet", processes=4)
+    >>> paths = exporter.export()
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        output_directory: str,
+        format: str = 'parquet',
+        processes: int = None,
+        compression: str = 'zstd',
+        metadata_class: type = LiteratureMetadata,
+        ) -> None:
+        """
+        Parameters
+        ----------
+        directory : str or path
+            The directory which contains the json files of the clone.
+        output_directory : str or path
+            The directory of the exported files.
+        format : str
+            (Default value 'parquet')
+            'parquet' or 'arrow' (Arrow IPC file).
+        processes : int
+            (Default value None)
+            The number of worker processes of the `CloneLoader`.
+        compression : str
+            (Default value 'zstd')
+            The compression of the exported files, e.g. 'zstd', 'lz4' or
+            None.
+        metadata_class : type
+            (Default value LiteratureMetadata)
+            The data model whose fields are exported.
+        """
+        _require_pyarrow()
+        if format not in FORMATS:
+            raise ValueError(
+                f"Unknown format '{format}', use one of {list(FORMATS)}"
+            )
+        self.loader = CloneLoader(directory, processes=processes)
+        self.output_directory = output_directory
+        self.format = format
+        self.compression = compression
+        self.metadata_class = metadata_class
+        self.schema = arrow_schema(metadata_class)
+
+    def _write(self, table, path: str) -> None:
+        if self.format == 'parquet':
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(table, path, compression=self.compression)
+            return
+        import pyarrow.ipc
+        options = pyarrow.ipc.IpcWriteOptions(compression=self.compression)
+        with pyarrow.ipc.new_file(path, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+    def export(self) -> List[str]:
+        """Writes a file for each json file of the clone.
+
+        Returns
+        -------
+        List[str]
+            Paths of the written files.
+
+        """
+        os.makedirs(self.output_directory, exist_ok=True)
+        sources = self.loader.files()
+        tables = self.loader.map(
+            functools.partial(
+                records_to_table,
+                metadata_class=self.metadata_class,
+                ),
+            raw=True,
+            )
+        paths = []
+        for source, table in zip(sources, tables):
+            name = os.path.basename(source).split('.', 1)[0]
+            path = os.path.join(
+                self.output_directory,
+                name + FORMATS[self.format],
+                )
+            self._write(table, path)
+            paths.append(path)
+        return paths
@@ -0,0 +1,249 @@
+"""
+A module to search the titles and abstracts of cloned literature locally.
+
+The `FullTextIndex` keeps the titles, abstracts and keywords of records
+in an SQLite FTS5 table whose rowids are control numbers, so keyword
+queries are answered from disk in about a millisecond instead of
+a request to `search_literature`. The index is built incrementally: the
+hash of the indexed texts of each record is saved, and records whose
+texts did not change since they were indexed are skipped when a clone
+is indexed again, e.g. after a `sync` which updated citation counts.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from typing import (
+    Iterable,
+    List,
+    Tuple,
+)
+from pyinspirehep.contrib.loader import CloneLoader
+
+
+# The columns of the index and the metadata field and key of their text.
+COLUMNS = (
+    ('title', 'titles', 'title'),
+    ('abstract', 'abstracts', 'value'),
+    ('keywords', 'keywords', 'value'),
+    )
+
+
+def _text(metadata: dict, field: str, key: str) -> str:
+    """Returns the values of `key` of the items of a metadata field.
+
+    >>> _text({'titles': [{'title': 'A'}, {'title': 'B'}]}, 'titles', 'title')
+    'A\\nB'
+    """
+    return '\n'.join(
+        item[key]
+        for item in metadata.get(field) or ()
+        if isinstance(item, dict) and item.get(key)
+        )
+
+
+def _document(record: dict) -> tuple:
+    """Returns control number, hash of texts and texts of a record.
+
+    """
+    metadata = record.get('metadata', {})
+    texts = [_text(metadata, field, key) for _, field, key in COLUMNS]
+    digest = hashlib.blake2b(digest_size=16)
+    for text in texts:
+        digest.update(text.encode())
+        # Separates the texts, so moving text between columns changes it.
+        digest.update(b'\0')
+    return (int(metadata['control_number']), digest.hexdigest(), *texts)
+
+
+def _documents(records: List[dict]) -> List[tuple]:
+    return [_document(record) for record in records]
+
+
+class FullTextIndex:
+    """Full-text index of literature records ranked by BM25.
+
+    Parameters
+    ----------
+    path : str or path
+        The path of the SQLite database. ':memory:' keeps the index in
+        memory.
+
+    Example:
+    >>> from pyinspirehep.contrib.fulltext import FullTextIndex
+    >>> index = FullTextIndex("literature.sqlite")
+    >>> index.add_clone(directory, processes=4)
+    >>> index.search('"dark matter" AND axion', limit=20)
+    [1713040, 1689954, ...]
+    """
+
+    def __init__(self, path: str = ':memory:') -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        columns = ', '.join(column for column, _, _ in COLUMNS)
+        with self._connection:
+            self._connection.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS document USING fts5("
+                f"{columns}, tokenize='porter unicode61')"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS indexed "
+                "(control_number INTEGER PRIMARY KEY, hash TEXT)"
+            )
+
+    def _add_documents(self, documents: Iterable[tuple]) -> int:
+        """Indexes documents which are new or changed.
+
+        Of documents with the same control number the last one is kept.
+        """
+        documents = list({
+            document[0]: document for document in documents
+            }.values())
+        hashes = {}
+        with self._lock:
+            for i in range(0, len(documents), 500):
+                chunk = [document[0] for document in documents[i:i + 500]]
+                hashes.update(self._connection.execute(
+                    "SELECT control_number, hash FROM indexed WHERE "
+                    f"control_number IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                    ))
+            changed = [
+                document for document in documents
+                if hashes.get(document[0]) != document[1]
+                ]
+            with self._connection:
+                self._connection.executemany(
+                    "DELETE FROM document WHERE rowid = ?",
+                    ((document[0],) for document in changed),
+                    )
+                self._connection.executemany(
+                    "INSERT INTO document(rowid, title, abstract, keywords) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        (document[0], *document[2:])
+                        for document in changed
+                    ),
+                    )
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO indexed VALUES (?, ?)",
+                    (document[:2] for document in changed),
+                    )
+        return len(changed)
+
+    def add_records(self, records: Iterable[dict]) -> int:
+        """Indexes json literature records.
+
+        Returns
+        -------
+        int
+            The number of records which were new or changed.
+
+        """
+        return self._add_documents(_document(record) for record in records)
+
+    def add_clone(self, directory: str, processes: int = None) -> int:
+        """Indexes the records of a clone which are new or changed.
+
+        The texts and hashes are extracted from the json files in worker
+        processes of a `CloneLoader`.
+
+        Returns
+        -------
+        int
+            The number of records which were new or changed.
+
+        """
+        count = 0
+        for documents in CloneLoader(directory, processes=processes).map(
+            _documents,
+            raw=True,
+            ):
+            count += self._add_documents(documents)
+        return count
+
+    def remove(self, control_numbers: Iterable[int]) -> None:
+        """Removes records from the index, e.g. records deleted in a diff.
+
+        """
+        rows = [(int(control_number),) for control_number in control_numbers]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM document WHERE rowid = ?", rows)
+            self._connection.executemany(
+                "DELETE FROM indexed WHERE control_number = ?", rows)
+
+    def search_with_scores(
+        self,
+        query: str,
+        limit: int = 10,
+        weights: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+        ) -> List[Tuple[int, float]]:
+        """Returns control numbers and BM25 scores of the best matches.
+
+        Parameters
+        ----------
+        query : str
+            An FTS5 query, e.g. 'axion', '"dark matter" OR wimp' or
+            'title:neutrino'.
+        limit : int
+            (Default value = 10)
+            The maximum number of results.
+        weights : Tuple[float, float, float]
+            (Default value = (1.0, 1.0, 1.0))
+            The weights of matches in title, abstract and keywords.
+
+        Returns
+        -------
+        List[Tuple[int, float]]
+            The best match first. Scores of SQLite BM25 are negative and
+            smaller is better.
+
+        Raises
+        ------
+        ValueError
+            If the query is not a valid FTS5 query, e.g. 'dark-matter'
+            which should be written '"dark-matter"'.
+
+        """
+        with self._lock:
+            try:
+                return self._connection.execute(
+                    "SELECT rowid, bm25(document, ?, ?, ?) AS score "
+                    "FROM document WHERE document MATCH ? "
+                    "ORDER BY score LIMIT ?",
+                    (*weights, query, limit),
+                    ).fetchall()
+            except sqlite3.OperationalError as e:
+                raise ValueError(
+                    f"Invalid full-text query '{query}' ({e}), quote terms "
+                    "with punctuation like '\"dark-matter\"'"
+                ) from e
+
+    def search(self, query: str, limit: int = 10, **kwargs) -> List[int]:
+        """Returns control numbers of the best matches of a query.
+
+        See `search_with_scores` for the arguments.
+        """
+        return [
+            control_number
+            for control_number, _ in self.search_with_scores(query, limit, **kwargs)
+            ]
+
+    def optimize(self) -> None:
+        """Merges the segments of the index, e.g. after a large build.
+
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO document(document) VALUES ('optimize')")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM indexed"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
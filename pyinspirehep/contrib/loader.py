@@ -0,0 +1,267 @@
+"""
+A module to load cloned data in parallel.
+
+The json files written by `LiteratureClone` are parsed independently of
+each other, so the `CloneLoader` fans them out across a process pool and
+returns the results file by file.
+"""
+
+import collections
+import functools
+import itertools
+import os
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+)
+from pyinspirehep.literature import (
+    Literature,
+    LiteratureMetadata,
+)
+from pyinspirehep.compression import load_json_file
+from pyinspirehep.data_models import MetadataDecoder
+
+
+# The extensions of json files of a clone which may be compressed.
+EXTENSIONS = ('.json', '.json.gz', '.json.zst')
+
+
+def _load_file(path: str) -> list:
+    """Returns the list of raw records saved in a clone json file.
+
+    """
+    return load_json_file(path)
+
+
+def _parse_file(path: str, record_class: type = Literature) -> list:
+    """Returns records of a clone json file decoded by `record_class`.
+
+    """
+    from_response = record_class.from_response
+    return [from_response(record) for record in _load_file(path)]
+
+
+def _columns_file(path: str, decoder: MetadataDecoder) -> dict:
+    """Returns the metadata fields of `decoder` as columns of a json file.
+
+    """
+    columns = {attribute: [] for attribute, _, _, _ in decoder.fields}
+    appenders = [
+        (attribute, columns[attribute].append)
+        for attribute, _, _, _ in decoder.fields
+        ]
+    decode = decoder.decode
+    for record in _load_file(path):
+        values = decode(record.get("metadata", {}))
+        for attribute, append in appenders:
+            append(values[attribute])
+    return columns
+
+
+def _map_file(
+    path: str,
+    func: Callable,
+    record_class: type = Literature,
+    raw: bool = False,
+    ):
+    """Applies `func` to the records of a clone json file.
+
+    The records are decoded by `record_class` unless `raw` is True.
+    """
+    if raw:
+        return func(_load_file(path))
+    return func(_parse_file(path, record_class))
+
+
+def _file_order(name: str) -> tuple:
+    """Returns key to sort clone files by the number in their names.
+
+    """
+    stem = name.split('.', 1)[0]
+    return (0, int(stem), name) if stem.isdigit() else (1, 0, name)
+
+
+class CloneLoader:
+    """Class to load the json files of a clone in parallel.
+
+    Each json file is parsed in a worker process. The results can be the
+    decoded records, columns of selected metadata fields, or the result
+    of a function applied to the records of each file, which avoids
+    sending whole records back from the workers.
+
+    Example:
+    >>> from pyinspirehep.contrib.loader import CloneLoader
+    >>> loader = CloneLoader(directory, processes=4)
+    >>> for columns in loader.iter_columns('control_number', 'citation_count'):
+    ...     print(sum(columns['citation_count']))
+    >>> total = loader.reduce(
+    ...     count_citations,
+    ...     lambda total, count: total + count,
+    ...     initial=0,
+    ...     )
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        processes: int = None,
+        record_class: type = Literature,
+        ) -> None:
+        """
+        Parameters
+        ----------
+        directory : str or path
+            The directory which contains the json files of the clone.
+        processes : int
+            (Default value None)
+            The number of worker processes. When it is None the number
+            of CPUs will be used and when it is 1 the files are parsed
+            in the current process.
+        record_class : type
+            (Default value Literature)
+            The data model used to decode records.
+        """
+        if not os.path.isdir(directory):
+            raise ValueError(f"The directory '{directory}' does not exist")
+        self.directory = directory
+        self.processes = processes
+        self.record_class = record_class
+
+    def files(self) -> List[str]:
+        """Returns paths of the json files of the clone.
+
+        The files are sorted by the control number in their names.
+        """
+        names = [
+            name for name in os.listdir(self.directory)
+            if name.endswith(EXTENSIONS)
+            ]
+        names.sort(key=_file_order)
+        return [os.path.join(self.directory, name) for name in names]
+
+    def _map(self, func: Callable, paths: Iterable[str] = None) -> Iterator:
+        """Applies `func` to each path in worker processes.
+
+        The results are yielded in the order of the paths. At most two
+        files per process are submitted ahead of the result which is
+        yielded, so results do not pile up when the consumer is slower
+        than the workers.
+        """
+        if paths is None:
+            paths = self.files()
+        if self.processes == 1:
+            yield from map(func, paths)
+            return
+        # Imported here because it imports multiprocessing.
+        from concurrent.futures import ProcessPoolExecutor
+        processes = self.processes or os.cpu_count() or 1
+        paths = iter(paths)
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending = collections.deque(
+                executor.submit(func, path)
+                for path in itertools.islice(paths, 2 * processes)
+                )
+            while pending:
+                result = pending.popleft().result()
+                for path in itertools.islice(paths, 1):
+                    pending.append(executor.submit(func, path))
+                yield result
+
+    def iter_raw(self) -> Iterator[list]:
+        """Yields list of json records of each file.
+
+        """
+        return self._map(_load_file)
+
+    def iter_records(self) -> Iterator[list]:
+        """Yields list of decoded records of each file.
+
+        """
+        return self._map(
+            functools.partial(_parse_file, record_class=self.record_class),
+            )
+
+    def iter_columns(self, *fields) -> Iterator[dict]:
+        """Yields the metadata fields of records of each file as columns.
+
+        Only the given fields are decoded in the workers, and a dict of
+        lists (one list per field) is sent back for each file which is much
+        cheaper to transfer than whole records.
+
+        Parameters
+        ----------
+        *fields :
+            Attribute names of the metadata data model, for example
+            'control_number' and 'citation_count'. If not specified, all
+            fields will be included.
+
+        Returns
+        -------
+        Iterator[dict]
+
+        """
+        metadata_class = self.record_class.METADATA_CLASS or LiteratureMetadata
+        rows = metadata_class.DECODER.fields
+        if fields:
+            known = {attribute for attribute, _, _, _ in rows}
+            unknown = set(fields) - known
+            if unknown:
+                raise ValueError(
+                    f"Unknown fields {sorted(unknown)} for "
+                    f"{metadata_class.__name__}"
+                )
+            rows = [row for row in rows if row[0] in fields]
+        return self._map(
+            functools.partial(_columns_file, decoder=MetadataDecoder(rows)),
+            )
+
+    def map(self, func: Callable, raw: bool = False) -> Iterator:
+        """Yields result of `func` applied to records of each file.
+
+        Parameters
+        ----------
+        func : Callable
+            A function which gets the list of decoded records of a file.
+            It runs in worker processes, so it must be picklable (defined
+            at module level).
+        raw : bool
+            (Default value = False)
+            If True, `func` gets the json records instead of decoded
+            records, which skips decoding the fields it does not use.
+
+        Returns
+        -------
+        Iterator
+
+        """
+        return self._map(
+            functools.partial(
+                _map_file,
+                func=func,
+                record_class=self.record_class,
+                raw=raw,
+                ),
+            )
+
+    def reduce(self, func: Callable, reducer: Callable, initial=None):
+        """Reduces the results of `func` on each file to a single value.
+
+        Parameters
+        ----------
+        func : Callable
+            Applied to the list of decoded records of each file in
+            worker processes.
+        reducer : Callable
+            Gets the current value and the result of a file and returns
+            the new value. It runs in the current process.
+        initial :
+            (Default value = None)
+            The initial value.
+
+        """
+        value = initial
+        for result in self.map(func):
+            value = reducer(value, result)
+        return value
@@ -0,0 +1,233 @@
+"""
+A module to profile parsing of cloned records field by field.
+
+The `ParseProfiler` streams over the json files of a clone and measures
+for each field of the metadata data model the time spent to parse and
+decode it, the memory of the decoded objects and the size of its json
+payload. The results help to decide which fields to request and which
+ones to decode lazily.
+
+The json of a file is parsed at once, so the parse time of a field is
+measured by parsing the json of the field of each record again on its
+own, which attributes the cost of `json.load` to the fields.
+"""
+
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import (
+    Iterable,
+    List,
+)
+from pyinspirehep.compression import load_json_file
+from pyinspirehep.contrib.loader import CloneLoader
+from pyinspirehep.literature import Literature
+
+
+def deep_sizeof(value) -> int:
+    """Returns the memory of an object decoded from json in bytes.
+
+    The size of the nested lists and dicts and their items are included
+    and objects shared between items are counted once.
+
+    >>> deep_sizeof([]) == sys.getsizeof([])
+    True
+    """
+    seen = set()
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return size
+
+
+@dataclass
+class FieldProfile:
+    """Profile of a field of metadata over many records.
+
+    Attribtes
+    ---------
+    attribute : str
+        The attribute of the metadata data model.
+
+    key : str
+        The key of the field in json metadata.
+
+    present : int
+        The number of records which have the field.
+
+    parse_time : float
+        The total seconds spent to parse the json of the field.
+
+    decode_time : float
+        The total seconds spent to convert the parsed value of the field
+        to the type of the data model.
+
+    memory : int
+        The total memory of the decoded values in bytes.
+
+    payload_bytes : int
+        The total size of the json of the field in bytes.
+
+    """
+    attribute: str
+    key: str
+    present: int = 0
+    parse_time: float = 0.0
+    decode_time: float = 0.0
+    memory: int = 0
+    payload_bytes: int = 0
+
+    @property
+    def total_time(self) -> float:
+        """The total seconds spent to parse and decode the field.
+
+        """
+        return self.parse_time + self.decode_time
+
+
+class ParseProfiler:
+    """Class to profile parsing of a clone field by field.
+
+    Example:
+    >>> from pyinspirehep.contrib.profiler import ParseProfiler
+    >>> profiler = ParseProfiler(directory)
+    >>> profiler.run(max_files=2)
+    >>> print(profiler.format_report())
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        record_class: type = Literature,
+        ) -> None:
+        """
+        Parameters
+        ----------
+        directory : str or path
+            The directory which contains the json files of the clone.
+        record_class : type
+            (Default value Literature)
+            The data model whose metadata fields are profiled.
+        """
+        self.loader = CloneLoader(directory, processes=1, record_class=record_class)
+        self.record_class = record_class
+        self.decoder = record_class.METADATA_CLASS.DECODER
+        self.records = 0
+        self.files = 0
+        self.load_time = 0.0
+        self.fields = {
+            attribute: FieldProfile(attribute=attribute, key=key)
+            for attribute, key, _, _ in self.decoder.fields
+            }
+
+    def profile_records(self, records: Iterable[dict]) -> None:
+        """Adds the profile of the json records to the results.
+
+        """
+        perf_counter = time.perf_counter
+        dumps = json.dumps
+        loads = json.loads
+        rows = [
+            (self.fields[attribute], key, converter, default)
+            for attribute, key, converter, default in self.decoder.fields
+            ]
+        for record in records:
+            metadata = record.get("metadata", {})
+            self.records += 1
+            for profile, key, converter, default in rows:
+                if key in metadata:
+                    payload = dumps(metadata[key])
+                    start = perf_counter()
+                    value = loads(payload)
+                    profile.parse_time += perf_counter() - start
+                    profile.present += 1
+                    profile.payload_bytes += len(payload)
+                else:
+                    value = default
+                start = perf_counter()
+                if converter is not None and value is not None:
+                    value = converter(value)
+                profile.decode_time += perf_counter() - start
+                if key in metadata:
+                    profile.memory += deep_sizeof(value)
+
+    def run(self, max_files: int = None) -> List[FieldProfile]:
+        """Profiles the json files of the clone one by one.
+
+        Parameters
+        ----------
+        max_files : int
+            (Default value None)
+            The number of files to profile. All files are profiled when
+            it is None.
+
+        Returns
+        -------
+        List[FieldProfile]
+            Profiles sorted by parse and decode time, slowest first.
+
+        """
+        for path in self.loader.files()[:max_files]:
+            start = time.perf_counter()
+            records = load_json_file(path)
+            self.load_time += time.perf_counter() - start
+            self.files += 1
+            self.profile_records(records)
+        return self.report()
+
+    def report(self) -> List[FieldProfile]:
+        """Returns profiles of fields sorted by parse and decode time.
+
+        """
+        return sorted(
+            self.fields.values(),
+            key=lambda profile: profile.total_time,
+            reverse=True,
+            )
+
+    def format_report(self) -> str:
+        """Returns the profiles of fields as a text table.
+
+        """
+        total_payload = sum(p.payload_bytes for p in self.fields.values()) or 1
+        lines = [
+            f"{self.records} records in {self.files} files, "
+            f"json load time {self.load_time:.3f} s",
+            f"{'field':<40} {'present':>8} {'parse ms':>10} "
+            f"{'decode ms':>10} {'memory MB':>10} {'payload MB':>11} "
+            f"{'payload %':>9}",
+            ]
+        for profile in self.report():
+            lines.append(
+                f"{profile.attribute:<40} {profile.present:>8} "
+                f"{profile.parse_time * 1000:>10.2f} "
+                f"{profile.decode_time * 1000:>10.2f} "
+                f"{profile.memory / 2 ** 20:>10.2f} "
+                f"{profile.payload_bytes / 2 ** 20:>11.2f} "
+                f"{100 * profile.payload_bytes / total_payload:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Profile parsing of a literature clone field by field.",
+        )
+    parser.add_argument("directory")
+    parser.add_argument("--max-files", type=int, default=None)
+    args = parser.parse_args()
+    profiler = ParseProfiler(args.directory)
+    profiler.run(max_files=args.max_files)
+    print(profiler.format_report())
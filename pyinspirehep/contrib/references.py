@@ -0,0 +1,358 @@
+"""
+A module to resolve references which are not linked to Inspirehep records.
+
+References of literature without `record.$ref` often have a DOI or an
+arXiv eprint. The `ReferenceResolver` collects these identifiers from
+many papers, searches them in batches with a single query per batch and
+saves the control numbers they resolve to in a persistent cache, so
+every identifier is searched only once.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Set,
+)
+from pyinspirehep.client import Client
+from pyinspirehep.contrib.loader import CloneLoader
+from pyinspirehep.query import (
+    Or,
+    Term,
+)
+
+
+# Prefixes of the keys of identifiers in the cache.
+DOI = 'doi'
+ARXIV = 'arxiv'
+
+
+def _doi_key(doi: str) -> str:
+    return f"{DOI}:{doi.strip().lower()}"
+
+
+def _arxiv_key(eprint: str) -> str:
+    eprint = eprint.strip()
+    if eprint.lower().startswith('arxiv:'):
+        eprint = eprint[len('arxiv:'):]
+    return f"{ARXIV}:{eprint}"
+
+
+def reference_keys(reference: dict) -> List[str]:
+    """Returns the keys of the DOIs and arXiv eprint of a reference.
+
+    DOIs are lower case, because they are not case sensitive.
+
+    >>> reference_keys({'reference': {'dois': ['10.1103/PhysRevLett.37.8'], 'arxiv_eprint': 'hep-ph/0011376'}})
+    ['doi:10.1103/physrevlett.37.8', 'arxiv:hep-ph/0011376']
+    """
+    details = reference.get('reference') or {}
+    keys = [_doi_key(doi) for doi in details.get('dois') or ()]
+    if details.get('arxiv_eprint'):
+        keys.append(_arxiv_key(details['arxiv_eprint']))
+    return keys
+
+
+def unresolved_keys(records: Iterable[dict]) -> Set[str]:
+    """Returns keys of references without record of json literature records.
+
+    """
+    keys = set()
+    for record in records:
+        for reference in record.get('metadata', {}).get('references') or ():
+            if '$ref' not in (reference.get('record') or {}):
+                keys.update(reference_keys(reference))
+    return keys
+
+
+def _query(key: str) -> Term:
+    """Returns the query of the literature with an identifier key.
+
+    >>> _query('arxiv:hep-ph/0011376').compile()
+    'arxiv:hep-ph/0011376'
+    """
+    schema, value = key.split(':', 1)
+    return Term(schema, value)
+
+
+class ReferenceCache:
+    """Persistent map of identifier keys to control numbers in SQLite.
+
+    Identifiers which were searched but not found are saved with None,
+    so they are not searched again until `not_found_ttl` has passed.
+
+    Parameters
+    ----------
+    path : str or path
+        The path of the SQLite database. ':memory:' keeps the cache in
+        memory.
+
+    not_found_ttl : float
+        (Default value = None)
+        The number of seconds an identifier which was not found is kept,
+        so identifiers added to Inspirehep later are searched again.
+        When it is None they are kept forever.
+    """
+
+    def __init__(self, path: str, not_found_ttl: float = None) -> None:
+        self.path = path
+        self.not_found_ttl = not_found_ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS reference "
+                "(key TEXT PRIMARY KEY, control_number INTEGER, checked REAL)"
+            )
+            columns = {
+                row[1] for row in self._connection.execute(
+                    "PRAGMA table_info(reference)"
+                    )
+                }
+            # Caches created before `checked` was added.
+            if 'checked' not in columns:
+                self._connection.execute(
+                    "ALTER TABLE reference ADD COLUMN checked REAL"
+                )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, int]:
+        """Returns the cached control numbers of keys which are cached.
+
+        Keys which were not found more than `not_found_ttl` seconds ago
+        are not returned.
+        """
+        keys = list(keys)
+        found = {}
+        expired = (
+            time.time() - self.not_found_ttl
+            if self.not_found_ttl is not None
+            else None
+        )
+        with self._lock:
+            # SQLite limits the number of parameters of a statement.
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self._connection.execute(
+                    "SELECT key, control_number, checked FROM reference "
+                    f"WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                    )
+                for key, control_number, checked in rows:
+                    if (
+                        control_number is None
+                        and expired is not None
+                        and (checked is None or checked < expired)
+                    ):
+                        continue
+                    found[key] = control_number
+        return found
+
+    def set_many(self, items: Dict[str, int]) -> None:
+        """Saves control numbers (or None for not found) of keys.
+
+        """
+        checked = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO reference VALUES (?, ?, ?)",
+                (
+                    (key, control_number, checked)
+                    for key, control_number in items.items()
+                ),
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM reference"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class ReferenceResolver:
+    """Class to resolve DOIs and arXiv eprints of references in bulk.
+
+    Example:
+    >>> from pyinspirehep.contrib.references import ReferenceResolver
+    >>> resolver = ReferenceResolver(cache_path="references.sqlite")
+    >>> resolver.resolve_clone(directory)
+    >>> ids = resolver.get_references_ids(client.get_literature_object("1713040"))
+    """
+
+    # The literature fields needed to map results to identifiers.
+    FIELDS = (
+        'control_number',
+        'dois.value',
+        'arxiv_eprints.value',
+        )
+
+    def __init__(
+        self,
+        client: Client = None,
+        cache_path: str = ':memory:',
+        batch_size: int = 50,
+        max_workers: int = 1,
+        not_found_ttl: float = 30 * 86400,
+        ) -> None:
+        """
+        Parameters
+        ----------
+        client : Client
+            (Default value None)
+            The client to send requests. A new client will be created
+            if it is not given.
+        cache_path : str or path
+            (Default value ':memory:')
+            The SQLite database of the cache.
+        batch_size : int
+            (Default value 50)
+            The number of identifiers searched with a single query.
+        max_workers : int
+            (Default value 1)
+            The number of concurrent queries.
+        not_found_ttl : float
+            (Default value 30 days)
+            The number of seconds before identifiers which were not found
+            are searched again. When it is None they are never searched
+            again.
+        """
+        self.client = client if client is not None else Client()
+        self.cache = ReferenceCache(cache_path, not_found_ttl=not_found_ttl)
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def _search(self, query) -> Dict[str, int]:
+        """Returns control numbers of the identifiers of the query results.
+
+        All pages of the results are requested, because an identifier may
+        match more than one record.
+        """
+        size = min(self.batch_size * 2, Client.MAX_RECORDS_PER_PAGE)
+        found = {}
+        received = 0
+        for page in range(1, Client.PAGINATION_LIMIT // size + 1):
+            hits = self.client.search_literature(
+                *self.FIELDS,
+                size=size,
+                page=page,
+                q=query,
+                )['hits']
+            received += len(hits['hits'])
+            for hit in hits['hits']:
+                metadata = hit['metadata']
+                control_number = int(metadata['control_number'])
+                for doi in metadata.get('dois') or ():
+                    found[_doi_key(doi['value'])] = control_number
+                for eprint in metadata.get('arxiv_eprints') or ():
+                    found[_arxiv_key(eprint['value'])] = control_number
+            if received >= hits['total'] or not hits['hits']:
+                break
+        return found
+
+    def resolve(self, keys: Iterable[str]) -> Dict[str, int]:
+        """Returns control numbers of identifier keys.
+
+        The keys which are not cached are searched in batches and saved
+        in the cache, including the ones which are not found.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            Keys like 'doi:10.1103/physrevlett.37.8' or
+            'arxiv:hep-ph/0011376', see `reference_keys`.
+
+        Returns
+        -------
+        Dict[str, int]
+            The control number of each key which is found.
+
+        """
+        keys = set(keys)
+        cached = self.cache.get_many(keys)
+        missing = sorted(keys.difference(cached))
+        if missing:
+            queries = Or(*(_query(key) for key in missing)).split(
+                max_terms=self.batch_size,
+                )
+            if self.max_workers == 1:
+                results = map(self._search, queries)
+            else:
+                results = (
+                    found for _, found in self.client.map(
+                        self._search,
+                        queries,
+                        max_workers=self.max_workers,
+                        )
+                    )
+            resolved = {}
+            for found in results:
+                resolved.update(found)
+            new = {key: resolved.get(key) for key in missing}
+            self.cache.set_many(new)
+            cached.update(new)
+        return {
+            key: control_number
+            for key, control_number in cached.items()
+            if control_number is not None
+            }
+
+    def resolve_records(self, records: Iterable[dict]) -> Dict[str, int]:
+        """Resolves the unresolved references of json literature records.
+
+        """
+        return self.resolve(unresolved_keys(records))
+
+    def resolve_clone(self, directory: str, processes: int = None) -> Dict[str, int]:
+        """Resolves the unresolved references of all records of a clone.
+
+        The identifiers are collected from the json files in worker
+        processes of a `CloneLoader`.
+        """
+        keys = set()
+        for file_keys in CloneLoader(directory, processes=processes).map(
+            unresolved_keys,
+            raw=True,
+            ):
+            keys.update(file_keys)
+        return self.resolve(keys)
+
+    def get_references_ids(self, literature) -> List[str]:
+        """Returns ids of references of a literature using the cache.
+
+        References with `record.$ref` are used as they are and the others
+        are looked up by their DOIs and arXiv eprint in the cache, so
+        references should be resolved before with `resolve_*` methods.
+
+        Parameters
+        ----------
+        literature : Literature
+
+        Returns
+        -------
+        List[str]
+
+        """
+        references = literature.metadata.references or []
+        keys = [
+            reference_keys(reference)
+            for reference in references
+            if '$ref' not in (reference.get('record') or {})
+            ]
+        cached = self.cache.get_many(key for item in keys for key in item)
+        ids = []
+        unresolved = iter(keys)
+        for reference in references:
+            ref = (reference.get('record') or {}).get('$ref')
+            if ref is not None:
+                ids.append(ref.split("/")[-1])
+                continue
+            for key in next(unresolved):
+                if cached.get(key) is not None:
+                    ids.append(str(cached[key]))
+                    break
+        return ids
@@ -0,0 +1,322 @@
+"""
+A module to store snapshots of a clone with deduplicated records.
+
+The `RecordStore` keeps each record once as a blob named by the hash of
+its canonical json, and each snapshot as a manifest which maps control
+numbers to hashes. A record which did not change between two snapshots
+is not stored again, so the store grows with the records which changed
+rather than with the number of snapshots:
+
+    store/
+        store.json
+        objects/5b/5b0c2a...
+        snapshots/2024-01.tsv.gz
+        snapshots/2024-02.tsv.gz
+
+The hash of a record is `pyinspirehep.contrib.diff.record_hash`, which
+hashes the whole json record rather than only its metadata, so the
+snapshots of a store can be compared with clones by `diff_snapshots`.
+"""
+
+import functools
+import gzip
+import json
+import os
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+from pyinspirehep.compression import (
+    get_codec,
+    read_dictionary,
+    write_dictionary,
+    write_file_atomic,
+)
+from pyinspirehep.contrib.diff import (
+    canonical_json,
+    content_hash,
+)
+from pyinspirehep.contrib.loader import CloneLoader
+
+
+# The file of the settings of a store.
+CONFIG_FILENAME = "store.json"
+
+# The extension of the manifests of snapshots.
+MANIFEST_EXTENSION = ".tsv.gz"
+
+
+def _put_file(records: List[dict], directory: str) -> Tuple[List[Tuple[int, str]], int]:
+    """Stores the records of a clone file in the store of `directory`.
+
+    """
+    return RecordStore(directory).put_many(records)
+
+
+class StoreSnapshot:
+    """A snapshot of a `RecordStore`, which can be passed to `diff_snapshots`.
+
+    """
+
+    def __init__(self, store: "RecordStore", name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def iter_hashes(self) -> Iterator[Tuple[int, str]]:
+        """Yields control numbers and hashes of records in order.
+
+        """
+        return self.store.manifest(self.name)
+
+    def iter_records(self) -> Iterator[dict]:
+        """Yields the json records of the snapshot by control number.
+
+        """
+        get = self.store.get
+        for _, record_hash in self.iter_hashes():
+            yield get(record_hash)
+
+
+class RecordStore:
+    """Content-addressed storage of json records and snapshot manifests.
+
+    Example:
+    >>> from pyinspirehep.contrib.store import RecordStore
+    >>> store = RecordStore("store", compression="zstd")
+    >>> store.add_clone("2024-02", clone_directory, processes=4)
+    {'records': 2000000, 'new': 35120}
+    >>> for record in store.snapshot("2024-02").iter_records():
+    ...     print(record['metadata']['control_number'])
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        compression: str = None,
+        dictionary: bytes = None,
+        ) -> None:
+        """
+        Parameters
+        ----------
+        directory : str or path
+            The directory of the store. It is created if it does not exist.
+        compression : str
+            (Default value None)
+            If 'gzip' or 'zstd' the blobs are compressed. It is saved in
+            the store when it is created and is read from the store later,
+            so it can be None when an existing store is opened.
+        dictionary : bytes
+            (Default value None)
+            The zstd dictionary of the blobs, e.g. created by
+            `pyinspirehep.compression.train_dictionary`, which compresses
+            single records much better.
+
+        Raises
+        ------
+        ValueError
+            If an existing store has a different compression or
+            dictionary.
+        """
+        self.directory = directory
+        self.objects_directory = os.path.join(directory, "objects")
+        self.snapshots_directory = os.path.join(directory, "snapshots")
+        config_path = os.path.join(directory, CONFIG_FILENAME)
+        if os.path.isfile(config_path):
+            with open(config_path, 'r') as f:
+                saved_compression = json.load(f)['compression']
+            saved_dictionary = read_dictionary(directory)
+            if compression is not None and compression != saved_compression:
+                raise ValueError(
+                    f"The store {directory} has compression "
+                    f"'{saved_compression}', not '{compression}'"
+                )
+            if dictionary is not None and dictionary != saved_dictionary:
+                raise ValueError(
+                    f"The store {directory} has a different dictionary"
+                )
+            compression = saved_compression
+            dictionary = saved_dictionary
+        else:
+            os.makedirs(self.objects_directory, exist_ok=True)
+            os.makedirs(self.snapshots_directory, exist_ok=True)
+            if dictionary is not None:
+                write_dictionary(directory, dictionary)
+            with open(config_path, 'w') as f:
+                json.dump({'compression': compression}, f)
+        self.compression = compression
+        self.codec = None
+        if compression is not None:
+            self.codec = get_codec(compression, dictionary=dictionary)
+
+    def _path(self, record_hash: str) -> str:
+        extension = self.codec.extension if self.codec is not None else ''
+        return os.path.join(
+            self.objects_directory,
+            record_hash[:2],
+            record_hash + extension,
+            )
+
+    def __contains__(self, record_hash: str) -> bool:
+        return os.path.isfile(self._path(record_hash))
+
+    def _put(self, record: dict) -> Tuple[str, bool]:
+        data = canonical_json(record)
+        record_hash = content_hash(data)
+        path = self._path(record_hash)
+        if os.path.isfile(path):
+            return record_hash, False
+        if self.codec is not None:
+            data = self.codec.compress(data)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_file_atomic(path, data)
+        return record_hash, True
+
+    def put(self, record: dict) -> str:
+        """Stores a json record if it is not stored and returns its hash.
+
+        """
+        return self._put(record)[0]
+
+    def put_many(self, records: Iterable[dict]) -> Tuple[List[Tuple[int, str]], int]:
+        """Stores json records.
+
+        Returns
+        -------
+        Tuple[List[Tuple[int, str]], int]
+            The control numbers and hashes of the records, and the number
+            of records which were not stored before.
+
+        """
+        items = []
+        new = 0
+        for record in records:
+            record_hash, is_new = self._put(record)
+            items.append((int(record['metadata']['control_number']), record_hash))
+            new += is_new
+        return items, new
+
+    def get(self, record_hash: str) -> dict:
+        """Returns the json record of a hash.
+
+        """
+        with open(self._path(record_hash), 'rb') as f:
+            data = f.read()
+        if self.codec is not None:
+            data = self.codec.decompress(data)
+        return json.loads(data)
+
+    def _manifest_path(self, name: str) -> str:
+        return os.path.join(self.snapshots_directory, name + MANIFEST_EXTENSION)
+
+    def _write_manifest(self, name: str, items: List[Tuple[int, str]]) -> int:
+        """Writes the manifest of a snapshot and returns its number of rows.
+
+        A control number which is repeated, e.g. in two files of a clone
+        whose ranges share their boundary, has a single row with its last
+        hash, like in `CloneSnapshot`.
+        """
+        hashes = dict(items)
+        lines = ''.join(
+            f"{control_number}\t{hashes[control_number]}\n"
+            for control_number in sorted(hashes)
+            )
+        write_file_atomic(self._manifest_path(name), gzip.compress(lines.encode()))
+        return len(hashes)
+
+    def add_snapshot(self, name: str, records: Iterable[dict]) -> Dict[str, int]:
+        """Stores json records as the snapshot `name`.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of records of the snapshot and of the records which
+            were not stored before.
+
+        """
+        items, new = self.put_many(records)
+        records = self._write_manifest(name, items)
+        return {'records': records, 'new': new}
+
+    def add_clone(
+        self,
+        name: str,
+        directory: str,
+        processes: int = None,
+        ) -> Dict[str, int]:
+        """Stores the records of a clone directory as the snapshot `name`.
+
+        The records of each json file are hashed and stored in worker
+        processes of a `CloneLoader`.
+        """
+        items = []
+        new = 0
+        for file_items, file_new in CloneLoader(directory, processes=processes).map(
+            functools.partial(_put_file, directory=self.directory),
+            raw=True,
+            ):
+            # Sorted like the hashes of a file in `CloneSnapshot`, so the
+            # same record is the last of a repeated control number.
+            items.extend(sorted(file_items))
+            new += file_new
+        records = self._write_manifest(name, items)
+        return {'records': records, 'new': new}
+
+    def snapshots(self) -> List[str]:
+        """Returns the names of the snapshots.
+
+        """
+        return sorted(
+            name[:-len(MANIFEST_EXTENSION)]
+            for name in os.listdir(self.snapshots_directory)
+            if name.endswith(MANIFEST_EXTENSION)
+            )
+
+    def manifest(self, name: str) -> Iterator[Tuple[int, str]]:
+        """Yields control numbers and hashes of a snapshot in order.
+
+        """
+        path = self._manifest_path(name)
+        if not os.path.isfile(path):
+            raise ValueError(f"The snapshot '{name}' does not exist")
+        with gzip.open(path, 'rt') as f:
+            for line in f:
+                control_number, record_hash = line.split()
+                yield int(control_number), record_hash
+
+    def snapshot(self, name: str) -> StoreSnapshot:
+        return StoreSnapshot(self, name)
+
+    def remove_snapshot(self, name: str) -> None:
+        """Removes the manifest of a snapshot.
+
+        Its records are kept until `collect_garbage` is called.
+        """
+        os.remove(self._manifest_path(name))
+
+    def collect_garbage(self) -> int:
+        """Removes the records which are not in any snapshot.
+
+        Temporary files of records which are being written are kept.
+
+        Returns
+        -------
+        int
+            The number of removed records.
+
+        """
+        used = set()
+        for name in self.snapshots():
+            used.update(record_hash for _, record_hash in self.manifest(name))
+        removed = 0
+        for prefix in os.listdir(self.objects_directory):
+            prefix_directory = os.path.join(self.objects_directory, prefix)
+            for filename in os.listdir(prefix_directory):
+                if filename.endswith('.tmp'):
+                    continue
+                if filename.split('.', 1)[0] not in used:
+                    os.remove(os.path.join(prefix_directory, filename))
+                    removed += 1
+        return removed
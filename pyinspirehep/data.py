@@ -0,0 +1,120 @@
+"""
+Module for data repsone of Inspirehep
+
+The module provides a data class with several get methods
+to make it easy to get data information from the response of
+a request to Inspire hep API for data record.
+
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import List
+from pyinspirehep.utils import (
+    convert_to_bool,
+    convert_to_date,
+)
+from .data_models import (
+    MetadataDecoder,
+    RecordMetadata,
+    SingleRecordResponse,
+)
+
+
+@dataclass
+class DataMetadata(RecordMetadata):
+    """Data Metadata according to Inspirehep API.
+    """
+    titles: List[dict] = None
+    abstracts: List[dict] = None
+    authors: List[dict] = None
+    collaborations: List[dict] = None
+    dois: List[dict] = None
+    keywords: List[dict] = None
+    literature: List[dict] = None
+    urls: List[dict] = None
+    creation_date: datetime.date = None
+    deleted: bool = None
+    schema: str = None
+    control_number: int = None
+    legacy_creation_date: datetime.date = None
+
+    DECODER = MetadataDecoder((
+        ("titles", "titles", None, None),
+        ("abstracts", "abstracts", None, None),
+        ("authors", "authors", None, None),
+        ("collaborations", "collaborations", None, None),
+        ("dois", "dois", None, None),
+        ("keywords", "keywords", None, None),
+        ("literature", "literature", None, None),
+        ("urls", "urls", None, None),
+        ("creation_date", "creation_date", convert_to_date, None),
+        ("deleted", "deleted", convert_to_bool, False),
+        ("schema", "$schema", None, None),
+        ("control_number", "control_number", int, None),
+        ("legacy_creation_date", "legacy_creation_date", convert_to_date, None),
+    ))
+
+
+@dataclass
+class Data(SingleRecordResponse):
+    """Class to contain Inspirehep API single record response for Data.
+
+    Attribtes
+    ---------
+    id : str
+        The unique identifier of the object.
+
+    created : datetime.datetime
+        The UTC timestamp when object was created.
+
+    updated : datetime.datetime
+        The UTC timestamp when object was las updated.
+
+    links : dict
+        List of related links to current object.
+
+    metadata : DataMetadata
+        Information about the Data which is an instance DataMetadata object.
+
+    """
+    id: str
+    created: datetime.datetime = None
+    updated: datetime.datetime = None
+    links: dict = None
+    metadata: DataMetadata = None
+
+    METADATA_CLASS = DataMetadata
+
+    @property
+    def control_number(self):
+        """Returns the `control_number` of `self.metadata`
+
+        """
+        return self.metadata.control_number
+
+    def get_id(self, as_int=False):
+        """Returns the data id in INSPIRE HEP
+
+        """
+        return self.control_number if as_int else str(self.control_number)
+
+    def get_title(self):
+        """Returns the title of the data record if exists.
+
+        """
+        if self.metadata.titles:
+            return self.metadata.titles[0].get("title", None)
+        return None
+
+    def get_literature_ids(self):
+        """Returns ids of the literature records of the data record.
+
+        """
+        if self.metadata.literature:
+            return [
+                str(item["record"]["$ref"].split("/")[-1])
+                for item in self.metadata.literature
+                if "record" in item
+                ]
+        return None
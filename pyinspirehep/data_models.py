@@ -1,7 +1,114 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 import datetime
 from pyinspirehep.utils import convert_json_timestamp
-from typing import List
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Tuple,
+)
+
+
+class MetadataDecoder:
+    """Table driven decoder for the metadata of Inspirehep records.
+
+    Every data model of a record type declares its metadata fields once
+    as a table of `(attribute, key, converter, default)` rows and the
+    decoder builds the keyword arguments of the data model from the json
+    metadata. Fields without a converter are copied in a single pass, and
+    converters are only called for the values which exist in the metadata.
+
+    Parameters
+    ----------
+    fields : Iterable[Tuple[str, str, Callable, Any]]
+        Rows of `(attribute, key, converter, default)` where `attribute`
+        is the name of the attribute in data model, `key` is the key in
+        json metadata, `converter` is a callable to convert the json value
+        (or None) and `default` is the value used when the key is missing.
+
+    >>> decoder = MetadataDecoder([('schema', '$schema', None, None), ('count', 'count', int, 0)])
+    >>> decoder.decode({'$schema': 'authors.json', 'count': '12'})
+    {'schema': 'authors.json', 'count': 12}
+    >>> decoder.decode({})
+    {'schema': None, 'count': 0}
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[Tuple[str, str, Callable, Any]],
+        ) -> None:
+        self.fields = tuple(fields)
+        self._plain_fields = tuple(
+            (attribute, key, default)
+            for attribute, key, converter, default in self.fields
+            if converter is None
+            )
+        self._converted_fields = tuple(
+            (attribute, key, converter, default)
+            for attribute, key, converter, default in self.fields
+            if converter is not None
+            )
+
+    @property
+    def keys(self) -> List[str]:
+        """Returns the json keys of the metadata known by the decoder.
+
+        """
+        return [key for _, key, _, _ in self.fields]
+
+    def decode(self, metadata: dict) -> dict:
+        """Returns keyword arguments of the data model from metadata.
+
+        Parameters
+        ----------
+        metadata : dict
+            The metadata part of json response of a record.
+
+        Returns
+        -------
+        dict
+
+        """
+        get = metadata.get
+        kwargs = {
+            attribute: get(key, default)
+            for attribute, key, default in self._plain_fields
+            }
+        for attribute, key, converter, default in self._converted_fields:
+            value = get(key)
+            kwargs[attribute] = default if value is None else converter(value)
+        return kwargs
+
+
+class RecordMetadata:
+    """Base class of metadata data models of Inspirehep records.
+
+    Subclasses are dataclasses which set the `DECODER` class attribute to
+    a `MetadataDecoder` describing their fields.
+    """
+
+    DECODER = MetadataDecoder(())
+
+    @classmethod
+    def from_dict(cls, metadata: dict = None):
+        """Creates the metadata object from json metadata of a record.
+
+        Parameters
+        ----------
+        metadata : dict
+            (Default value = None)
+
+        Returns
+        -------
+        RecordMetadata
+
+        """
+        if metadata is None:
+            return cls()
+        return cls(**cls.DECODER.decode(metadata))
+
 
 @dataclass
 class SingleRecordResponse:
@@ -34,6 +141,11 @@ class SingleRecordResponse:
     links: dict = None
     metadata: dict = None
 
+    # The data model of metadata, subclasses for specific record types
+    # set it to a subclass of `RecordMetadata`. When it is None the
+    # metadata will be kept as a dict.
+    METADATA_CLASS = None
+
     @classmethod
     def from_response(cls, respone: dict):
         """
@@ -46,25 +158,87 @@ class SingleRecordResponse:
         Returns
         -------
         SingleRecordResponse
+            An instance of `cls` with metadata decoded by `METADATA_CLASS`.
 
         """
-        id = respone.get("id", None)
-        created = convert_json_timestamp(
-            respone.get("created", None),
-        )
-        updated = convert_json_timestamp(
-            respone.get("updated", None),
-        )
-        links = respone.get("links", {})
-        metadata = respone.get("metadata", {})
-        return SingleRecordResponse(
-            id=id,
-            created=created,
-            updated=updated,
-            links=links,
+        get = respone.get
+        metadata = get("metadata", {})
+        if cls.METADATA_CLASS is not None:
+            metadata = cls.METADATA_CLASS.from_dict(metadata)
+        return cls(
+            id=get("id", None),
+            created=convert_json_timestamp(get("created", None)),
+            updated=convert_json_timestamp(get("updated", None)),
+            links=get("links", {}),
             metadata=metadata,
         )
 
+class LazyRecordList(Sequence):
+    """Sequence of records which are decoded only when accessed.
+
+    The raw json of the hits is kept and each record is decoded by
+    `record_class.from_response` the first time it is accessed. Decoded
+    records are cached, so each hit is decoded at most once.
+
+    Parameters
+    ----------
+    raw_hits : List[dict]
+        The list of hits in json response of a search.
+
+    record_class : type
+        (Default value = SingleRecordResponse)
+        The data model used to decode each hit.
+
+    >>> records = LazyRecordList([{'id': '1'}, {'id': '2'}])
+    >>> len(records)
+    2
+    >>> records.decoded_count
+    0
+    >>> records[1].id
+    '2'
+    >>> records.decoded_count
+    1
+    """
+
+    def __init__(
+        self,
+        raw_hits: List[dict],
+        record_class: type = SingleRecordResponse,
+        ) -> None:
+        self.raw_hits = raw_hits
+        self.record_class = record_class
+        self._records = [None] * len(raw_hits)
+
+    def __len__(self) -> int:
+        return len(self.raw_hits)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        record = self._records[index]
+        if record is None:
+            record = self.record_class.from_response(self.raw_hits[index])
+            self._records[index] = record
+        return record
+
+    def __iter__(self):
+        for index in range(len(self.raw_hits)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.record_class.__name__}, "
+            f"{len(self)} hits, {self.decoded_count} decoded)"
+        )
+
+    @property
+    def decoded_count(self) -> int:
+        """Returns number of hits which are decoded so far.
+
+        """
+        return sum(1 for record in self._records if record is not None)
+
+
 @dataclass
 class Hits:
     """Class to contain Hits object.
@@ -80,14 +254,20 @@ class Hits:
         The total number of records as a result of search.
 
     hits : List[SingleRecordResponse]
-        List of SingleRecordResponse instances of Inspirehep API
+        List of SingleRecordResponse instances of Inspirehep API. When
+        the hits are decoded lazily it is a `LazyRecordList`.
         
     """
     total: int = None
     hits: List[SingleRecordResponse] = None
 
     @classmethod
-    def from_dict(cls, hits_dict=None):
+    def from_dict(
+        cls,
+        hits_dict=None,
+        record_class: type = SingleRecordResponse,
+        lazy: bool = False,
+        ):
         """
 
         Parameters
@@ -95,27 +275,37 @@ class Hits:
         hits_dict :
              (Default value = None)
 
+        record_class : type
+            (Default value = SingleRecordResponse)
+            The data model used to decode each hit, e.g. `Literature`.
+
+        lazy : bool
+            (Default value = False)
+            If True, the hits will be decoded only when they are accessed.
+
         Returns
         -------
         Hits
         """
-        hits_lits = []
-        if hits_dict is not None:
-            hits = hits_dict.get("hits", None)
-            if hits:
-                for hit in hits:
-                    hits_lits.append(
-                        SingleRecordResponse.from_response(hit)
-                        )
-            total = hits_dict.get("total", None)
+        if hits_dict is None:
+            return cls(hits=[], total=None)
+        hits = hits_dict.get("hits", None) or []
+        if lazy:
+            records = LazyRecordList(hits, record_class)
         else:
-            hits = None
-            total = None
-        return Hits(
-            hits=hits_lits,
-            total=total,
+            from_response = record_class.from_response
+            records = [from_response(hit) for hit in hits]
+        return cls(
+            hits=records,
+            total=hits_dict.get("total", None),
         )
 
+    def __iter__(self):
+        return iter(self.hits)
+
+    def __len__(self) -> int:
+        return len(self.hits)
+
 
 @dataclass
 class SearchResponse:
@@ -126,7 +316,12 @@ class SearchResponse:
     links: dict
 
     @classmethod
-    def from_response(cls, response: dict):
+    def from_response(
+        cls,
+        response: dict,
+        record_class: type = SingleRecordResponse,
+        lazy: bool = False,
+        ):
         """
 
         Parameters
@@ -134,7 +329,14 @@ class SearchResponse:
         response : dict
             A dictionary which is the json response of Inspirehep when
             the request is for searching
-            
+
+        record_class : type
+            (Default value = SingleRecordResponse)
+            The data model used to decode each hit.
+
+        lazy : bool
+            (Default value = False)
+            If True, the hits will be decoded only when they are accessed.
 
         Returns
         -------
@@ -142,8 +344,12 @@ class SearchResponse:
 
         """
         links = response.get("links", None)
-        hits = Hits.from_response(response.get("hits", None))
-        return SearchResponse(
+        hits = Hits.from_dict(
+            response.get("hits", None),
+            record_class=record_class,
+            lazy=lazy,
+            )
+        return cls(
             links=links,
             hits=hits,
-            )
\ No newline at end of file
+            )
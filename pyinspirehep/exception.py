@@ -1,7 +1,36 @@
 """
 Exceptions to be raised when specific error occures.
 """
-class InspirehepPIDDoesNotExistError(Exception):
+class InspirehepError(Exception):
+    """Base class of the errors of requests to Inspirehep API.
+
+    Parameters
+    ----------
+    message : str
+        The message of the error.
+
+    status_code : int
+        (Default value = None)
+        The http status code of the response if there was a response.
+
+    retry_after : float
+        (Default value = None)
+        The seconds to wait before retrying if the API asked for it.
+
+    """
+
+    def __init__(
+        self,
+        message: str = "",
+        status_code: int = None,
+        retry_after: float = None,
+        ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class InspirehepPIDDoesNotExistError(InspirehepError):
     """Error to be raised when object does not exists.
 
     When trying to get some object with a unique identifier, if the object
@@ -12,11 +41,63 @@ class InspirehepPIDDoesNotExistError(Exception):
     """
     pass
 
-class InspirehepTooManyRequestsError(Exception):
+class InspirehepTooManyRequestsError(InspirehepError):
     """Error to be raised in case of Too Many requests.
 
     This Error must be raised when http response have status code
     of 429. The status code could be sent because of the request
     limitations of Inspirehep API.
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class InspirehepConnectionError(InspirehepError):
+    """Error to be raised when no response was received.
+
+    The connection to Inspirehep could not be established or it was
+    closed before a response was received, e.g. because of network
+    problems.
+    """
+    pass
+
+
+class InspirehepTimeoutError(InspirehepConnectionError):
+    """Error to be raised when a request timed out.
+
+    Either connecting to Inspirehep or reading the response took longer
+    than the timeout of the client.
+    """
+    pass
+
+
+class InspirehepServerError(InspirehepError):
+    """Error to be raised when the response has a 5xx status code.
+
+    The error is on the side of Inspirehep, e.g. an outage or a
+    maintenance, and the body of the response is usually not json.
+    """
+    pass
+
+
+class InspirehepResponseDecodeError(InspirehepError):
+    """Error to be raised when the body of a response is not valid json.
+
+    """
+    pass
+
+
+class InspirehepUnexpectedStatusError(InspirehepError):
+    """Error to be raised for status codes without a specific error.
+
+    For example 400 (Bad Request) when the query is invalid.
+    """
+    pass
+
+
+class InspirehepCircuitOpenError(InspirehepError):
+    """Error to be raised when requests are not sent because of failures.
+
+    After many consecutive failures the circuit breaker of the client
+    stops sending requests for a while to let Inspirehep recover.
+    """
+    pass
@@ -0,0 +1,136 @@
+"""
+Module for experiments repsone of Inspirehep
+
+The module provides a data class with several get methods
+to make it easy to get experiments information from the response of
+a request to Inspire hep API for experiment record.
+
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import List
+from pyinspirehep.utils import (
+    convert_to_bool,
+    convert_to_date,
+)
+from .data_models import (
+    MetadataDecoder,
+    RecordMetadata,
+    SingleRecordResponse,
+)
+
+
+@dataclass
+class ExperimentMetadata(RecordMetadata):
+    """Experiment Metadata according to Inspirehep API.
+    """
+    legacy_name: str = None
+    long_name: str = None
+    name_variants: List[str] = None
+    project_type: List[str] = None
+    accelerator: dict = None
+    experiment: dict = None
+    institutions: List[dict] = None
+    collaboration: dict = None
+    date_proposed: str = None
+    date_approved: str = None
+    date_started: str = None
+    date_completed: str = None
+    date_cancelled: str = None
+    description: str = None
+    inspire_classification: List[str] = None
+    inspire_categories: List[dict] = None
+    related_records: List[dict] = None
+    urls: List[dict] = None
+    number_of_papers: int = 0
+    core: bool = None
+    deleted: bool = None
+    schema: str = None
+    control_number: int = None
+    legacy_creation_date: datetime.date = None
+
+    DECODER = MetadataDecoder((
+        ("legacy_name", "legacy_name", None, None),
+        ("long_name", "long_name", None, None),
+        ("name_variants", "name_variants", None, None),
+        ("project_type", "project_type", None, None),
+        ("accelerator", "accelerator", None, None),
+        ("experiment", "experiment", None, None),
+        ("institutions", "institutions", None, None),
+        ("collaboration", "collaboration", None, None),
+        ("date_proposed", "date_proposed", None, None),
+        ("date_approved", "date_approved", None, None),
+        ("date_started", "date_started", None, None),
+        ("date_completed", "date_completed", None, None),
+        ("date_cancelled", "date_cancelled", None, None),
+        ("description", "description", None, None),
+        ("inspire_classification", "inspire_classification", None, None),
+        ("inspire_categories", "inspire_categories", None, None),
+        ("related_records", "related_records", None, None),
+        ("urls", "urls", None, None),
+        ("number_of_papers", "number_of_papers", None, 0),
+        ("core", "core", convert_to_bool, False),
+        ("deleted", "deleted", convert_to_bool, False),
+        ("schema", "$schema", None, None),
+        ("control_number", "control_number", int, None),
+        ("legacy_creation_date", "legacy_creation_date", convert_to_date, None),
+    ))
+
+
+@dataclass
+class Experiment(SingleRecordResponse):
+    """Class to contain Inspirehep API single record response for Experiment.
+
+    Attribtes
+    ---------
+    id : str
+        The unique identifier of the object.
+
+    created : datetime.datetime
+        The UTC timestamp when object was created.
+
+    updated : datetime.datetime
+        The UTC timestamp when object was las updated.
+
+    links : dict
+        List of related links to current object.
+
+    metadata : ExperimentMetadata
+        Information about the Experiment which is an instance ExperimentMetadata object.
+
+    """
+    id: str
+    created: datetime.datetime = None
+    updated: datetime.datetime = None
+    links: dict = None
+    metadata: ExperimentMetadata = None
+
+    METADATA_CLASS = ExperimentMetadata
+
+    @property
+    def control_number(self):
+        """Returns the `control_number` of `self.metadata`
+
+        """
+        return self.metadata.control_number
+
+    def get_id(self, as_int=False):
+        """Returns the experiment id in INSPIRE HEP
+
+        """
+        return self.control_number if as_int else str(self.control_number)
+
+    def get_name(self):
+        """Returns the legacy name of the experiment.
+
+        """
+        return self.metadata.legacy_name
+
+    def get_collaboration(self):
+        """Returns the name of the collaboration of the experiment.
+
+        """
+        if self.metadata.collaboration:
+            return self.metadata.collaboration.get("value", None)
+        return None
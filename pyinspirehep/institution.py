@@ -0,0 +1,128 @@
+"""
+Module for institutions repsone of Inspirehep
+
+The module provides a data class with several get methods
+to make it easy to get institutions information from the response of
+a request to Inspire hep API for institution record.
+
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import List
+from pyinspirehep.utils import (
+    convert_to_bool,
+    convert_to_date,
+)
+from .data_models import (
+    MetadataDecoder,
+    RecordMetadata,
+    SingleRecordResponse,
+)
+
+
+@dataclass
+class InstitutionMetadata(RecordMetadata):
+    """Institution Metadata according to Inspirehep API.
+    """
+    legacy_ICN: str = None
+    ICN: List[str] = None
+    institution_hierarchy: List[dict] = None
+    institution_type: List[str] = None
+    name_variants: List[dict] = None
+    addresses: List[dict] = None
+    urls: List[dict] = None
+    inspire_categories: List[dict] = None
+    related_records: List[dict] = None
+    public_notes: List[dict] = None
+    historical_data: List[str] = None
+    external_system_identifiers: List[dict] = None
+    core: bool = None
+    number_of_papers: int = 0
+    deleted: bool = None
+    schema: str = None
+    control_number: int = None
+    legacy_creation_date: datetime.date = None
+
+    DECODER = MetadataDecoder((
+        ("legacy_ICN", "legacy_ICN", None, None),
+        ("ICN", "ICN", None, None),
+        ("institution_hierarchy", "institution_hierarchy", None, None),
+        ("institution_type", "institution_type", None, None),
+        ("name_variants", "name_variants", None, None),
+        ("addresses", "addresses", None, None),
+        ("urls", "urls", None, None),
+        ("inspire_categories", "inspire_categories", None, None),
+        ("related_records", "related_records", None, None),
+        ("public_notes", "public_notes", None, None),
+        ("historical_data", "historical_data", None, None),
+        ("external_system_identifiers", "external_system_identifiers", None, None),
+        ("core", "core", convert_to_bool, False),
+        ("number_of_papers", "number_of_papers", None, 0),
+        ("deleted", "deleted", convert_to_bool, False),
+        ("schema", "$schema", None, None),
+        ("control_number", "control_number", int, None),
+        ("legacy_creation_date", "legacy_creation_date", convert_to_date, None),
+    ))
+
+
+@dataclass
+class Institution(SingleRecordResponse):
+    """Class to contain Inspirehep API single record response for Institution.
+
+    Attribtes
+    ---------
+    id : str
+        The unique identifier of the object.
+
+    created : datetime.datetime
+        The UTC timestamp when object was created.
+
+    updated : datetime.datetime
+        The UTC timestamp when object was las updated.
+
+    links : dict
+        List of related links to current object.
+
+    metadata : InstitutionMetadata
+        Information about the Institution which is an instance InstitutionMetadata object.
+
+    """
+    id: str
+    created: datetime.datetime = None
+    updated: datetime.datetime = None
+    links: dict = None
+    metadata: InstitutionMetadata = None
+
+    METADATA_CLASS = InstitutionMetadata
+
+    @property
+    def control_number(self):
+        """Returns the `control_number` of `self.metadata`
+
+        """
+        return self.metadata.control_number
+
+    def get_id(self, as_int=False):
+        """Returns the institution id in INSPIRE HEP
+
+        """
+        return self.control_number if as_int else str(self.control_number)
+
+    def get_name(self):
+        """Returns the legacy name of the institution (legacy ICN).
+
+        """
+        return self.metadata.legacy_ICN
+
+    def get_names(self):
+        """Returns list of the names of the institution (ICN).
+
+        """
+        return self.metadata.ICN
+
+    def get_number_of_papers(self):
+        """Returns number of papers of the institution.
+
+        """
+        return self.metadata.number_of_papers
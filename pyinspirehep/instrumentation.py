@@ -0,0 +1,290 @@
+"""
+Instrumentation of the requests sent by the `Client`.
+
+Observers can be added to a `Client` to be notified before each request,
+after each response and on each error. The `MetricsCollector` is an
+observer which collects latency histograms, bytes downloaded, status
+codes and cache statistics and can export them in Prometheus text format.
+"""
+
+import bisect
+import threading
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+
+@dataclass
+class RequestEvent:
+    """Information about a request sent by the client.
+
+    Attribtes
+    ---------
+    url : str
+        The URL of the request.
+
+    params : dict
+        The query parameters of the request.
+
+    identifier_type : str
+        The type of the requested record, e.g. 'literature' or 'authors'.
+
+    started : float
+        The `time.perf_counter` when the request was started.
+
+    elapsed : float
+        The duration of the request in seconds.
+
+    status_code : int
+        The http status code of the response.
+
+    bytes_received : int
+        The size of the body of the response as received, i.e. before it
+        is decompressed when the server sends its 'Content-Length'.
+
+    error : Exception
+        The error raised for the request.
+
+    from_cache : bool
+        If the response was served from a cache.
+
+    attempt : int
+        The number of the attempt of the request, 0 for the first one.
+
+    retry_delay : float
+        The seconds waited before the next attempt of a retried request.
+
+    """
+    url: str
+    params: dict = None
+    identifier_type: str = None
+    started: float = field(default_factory=time.perf_counter)
+    elapsed: float = None
+    status_code: int = None
+    bytes_received: int = 0
+    error: Exception = None
+    from_cache: bool = False
+    attempt: int = 0
+    retry_delay: float = None
+
+    def finish(self) -> None:
+        """Sets `elapsed` from `started` until now.
+
+        """
+        self.elapsed = time.perf_counter() - self.started
+
+
+class RequestObserver:
+    """Base class of observers of requests of the `Client`.
+
+    Subclasses override the hooks they need. All of the hooks are called
+    in the thread which sends the request.
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        """Called before the request is sent.
+
+        """
+
+    def after_response(self, event: RequestEvent) -> None:
+        """Called after a response was received.
+
+        """
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when the request failed with `event.error`.
+
+        """
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Called when a failed request will be sent again.
+
+        The event has the `error` of the failed attempt, its `attempt`
+        and the `retry_delay` before the next attempt.
+        """
+
+    def on_cache_miss(self, event: RequestEvent) -> None:
+        """Called once when a response is not found in the cache.
+
+        """
+
+
+class MetricsCollector(RequestObserver):
+    """Observer which collects metrics of requests.
+
+    Parameters
+    ----------
+    buckets : Tuple[float]
+        The upper bounds in seconds of the buckets of latency histograms.
+
+    >>> metrics = MetricsCollector()
+    >>> event = RequestEvent('https://inspirehep.net/api/literature/1', identifier_type='literature')
+    >>> event.elapsed, event.status_code, event.bytes_received = 0.2, 200, 100
+    >>> metrics.after_response(event)
+    >>> metrics.requests['literature'], metrics.bytes_received
+    (1, 100)
+    """
+
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets: Tuple[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears all of the collected metrics.
+
+        """
+        with self._lock:
+            self.requests: Dict[str, int] = {}
+            self.latency_buckets: Dict[str, List[int]] = {}
+            self.latency_sum: Dict[str, float] = {}
+            self.status_codes: Dict[int, int] = {}
+            self.errors: Dict[str, int] = {}
+            self.bytes_received = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.retries: Dict[str, int] = {}
+
+    def _observe_latency(self, identifier_type: str, elapsed: float) -> None:
+        """Adds `elapsed` to the latency histogram of `identifier_type`.
+
+        """
+        if identifier_type not in self.latency_buckets:
+            self.latency_buckets[identifier_type] = [0] * (len(self.buckets) + 1)
+            self.latency_sum[identifier_type] = 0.0
+            self.requests[identifier_type] = 0
+        index = bisect.bisect_left(self.buckets, elapsed)
+        self.latency_buckets[identifier_type][index] += 1
+        self.latency_sum[identifier_type] += elapsed
+        self.requests[identifier_type] += 1
+
+    def after_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            if event.from_cache:
+                self.cache_hits += 1
+            else:
+                self._observe_latency(
+                    event.identifier_type or '',
+                    event.elapsed or 0.0,
+                    )
+                self.bytes_received += event.bytes_received
+            if event.status_code is not None:
+                self.status_codes[event.status_code] = (
+                    self.status_codes.get(event.status_code, 0) + 1
+                )
+
+    def on_error(self, event: RequestEvent) -> None:
+        name = type(event.error).__name__
+        with self._lock:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def on_retry(self, event: RequestEvent) -> None:
+        name = type(event.error).__name__
+        with self._lock:
+            self.retries[name] = self.retries.get(name, 0) + 1
+
+    def on_cache_miss(self, event: RequestEvent) -> None:
+        with self._lock:
+            self.cache_misses += 1
+
+    @property
+    def too_many_requests(self) -> int:
+        """Returns number of responses with 429 status code.
+
+        """
+        return self.status_codes.get(429, 0)
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Returns ratio of requests which were served from cache.
+
+        """
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+    def summary(self) -> dict:
+        """Returns the collected metrics as a dict.
+
+        """
+        with self._lock:
+            return {
+                'requests': dict(self.requests),
+                'latency_mean': {
+                    identifier_type: self.latency_sum[identifier_type] / count
+                    for identifier_type, count in self.requests.items()
+                    if count
+                    },
+                'status_codes': dict(self.status_codes),
+                'errors': dict(self.errors),
+                'retries': dict(self.retries),
+                'bytes_received': self.bytes_received,
+                'too_many_requests': self.too_many_requests,
+                'cache_hit_ratio': self.cache_hit_ratio,
+            }
+
+    def to_prometheus(self, prefix: str = 'pyinspirehep') -> str:
+        """Returns the collected metrics in Prometheus text format.
+
+        Parameters
+        ----------
+        prefix : str
+            (Default value = 'pyinspirehep')
+            The prefix of the names of the metrics.
+
+        Returns
+        -------
+        str
+
+        """
+        lines = []
+        name = f'{prefix}_request_duration_seconds'
+        lines.append(f'# HELP {name} Latency of requests to Inspirehep API.')
+        lines.append(f'# TYPE {name} histogram')
+        with self._lock:
+            for identifier_type, counts in sorted(self.latency_buckets.items()):
+                label = f'identifier_type="{identifier_type}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(
+                        f'{name}_bucket{{{label},le="{bound}"}} {cumulative}'
+                    )
+                cumulative += counts[-1]
+                lines.append(f'{name}_bucket{{{label},le="+Inf"}} {cumulative}')
+                lines.append(
+                    f'{name}_sum{{{label}}} {self.latency_sum[identifier_type]}'
+                )
+                lines.append(f'{name}_count{{{label}}} {cumulative}')
+            name = f'{prefix}_responses_total'
+            lines.append(f'# HELP {name} Responses by http status code.')
+            lines.append(f'# TYPE {name} counter')
+            for status_code, count in sorted(self.status_codes.items()):
+                lines.append(f'{name}{{status_code="{status_code}"}} {count}')
+            name = f'{prefix}_errors_total'
+            lines.append(f'# HELP {name} Failed requests by error type.')
+            lines.append(f'# TYPE {name} counter')
+            for error, count in sorted(self.errors.items()):
+                lines.append(f'{name}{{error="{error}"}} {count}')
+            name = f'{prefix}_retries_total'
+            lines.append(f'# HELP {name} Retried requests by error type.')
+            lines.append(f'# TYPE {name} counter')
+            for error, count in sorted(self.retries.items()):
+                lines.append(f'{name}{{error="{error}"}} {count}')
+            for metric, help_text, value in (
+                ('received_bytes_total', 'Bytes downloaded.', self.bytes_received),
+                ('cache_hits_total', 'Requests served from cache.', self.cache_hits),
+                ('cache_misses_total', 'Cache lookups which missed.', self.cache_misses),
+                ):
+                lines.append(f'# HELP {prefix}_{metric} {help_text}')
+                lines.append(f'# TYPE {prefix}_{metric} counter')
+                lines.append(f'{prefix}_{metric} {value}')
+        return "\n".join(lines) + "\n"
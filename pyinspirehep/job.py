@@ -0,0 +1,125 @@
+"""
+Module for jobs repsone of Inspirehep
+
+The module provides a data class with several get methods
+to make it easy to get jobs information from the response of
+a request to Inspire hep API for job record.
+
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import List
+from pyinspirehep.utils import (
+    convert_to_bool,
+    convert_to_date,
+)
+from .data_models import (
+    MetadataDecoder,
+    RecordMetadata,
+    SingleRecordResponse,
+)
+
+
+@dataclass
+class JobMetadata(RecordMetadata):
+    """Job Metadata according to Inspirehep API.
+    """
+    position: str = None
+    institutions: List[dict] = None
+    ranks: List[str] = None
+    regions: List[str] = None
+    arxiv_categories: List[str] = None
+    accelerator_experiments: List[dict] = None
+    contact_details: List[dict] = None
+    deadline_date: datetime.date = None
+    description: str = None
+    external_job_identifier: str = None
+    reference_letters: dict = None
+    status: str = None
+    urls: List[dict] = None
+    deleted: bool = None
+    schema: str = None
+    control_number: int = None
+    legacy_creation_date: datetime.date = None
+
+    DECODER = MetadataDecoder((
+        ("position", "position", None, None),
+        ("institutions", "institutions", None, None),
+        ("ranks", "ranks", None, None),
+        ("regions", "regions", None, None),
+        ("arxiv_categories", "arxiv_categories", None, None),
+        ("accelerator_experiments", "accelerator_experiments", None, None),
+        ("contact_details", "contact_details", None, None),
+        ("deadline_date", "deadline_date", convert_to_date, None),
+        ("description", "description", None, None),
+        ("external_job_identifier", "external_job_identifier", None, None),
+        ("reference_letters", "reference_letters", None, None),
+        ("status", "status", None, None),
+        ("urls", "urls", None, None),
+        ("deleted", "deleted", convert_to_bool, False),
+        ("schema", "$schema", None, None),
+        ("control_number", "control_number", int, None),
+        ("legacy_creation_date", "legacy_creation_date", convert_to_date, None),
+    ))
+
+
+@dataclass
+class Job(SingleRecordResponse):
+    """Class to contain Inspirehep API single record response for Job.
+
+    Attribtes
+    ---------
+    id : str
+        The unique identifier of the object.
+
+    created : datetime.datetime
+        The UTC timestamp when object was created.
+
+    updated : datetime.datetime
+        The UTC timestamp when object was las updated.
+
+    links : dict
+        List of related links to current object.
+
+    metadata : JobMetadata
+        Information about the Job which is an instance JobMetadata object.
+
+    """
+    id: str
+    created: datetime.datetime = None
+    updated: datetime.datetime = None
+    links: dict = None
+    metadata: JobMetadata = None
+
+    METADATA_CLASS = JobMetadata
+
+    @property
+    def control_number(self):
+        """Returns the `control_number` of `self.metadata`
+
+        """
+        return self.metadata.control_number
+
+    def get_id(self, as_int=False):
+        """Returns the job id in INSPIRE HEP
+
+        """
+        return self.control_number if as_int else str(self.control_number)
+
+    def get_position(self):
+        """Returns the title of the job position.
+
+        """
+        return self.metadata.position
+
+    def get_institutions(self):
+        """Returns name of institutions of the job.
+
+        """
+        if self.metadata.institutions:
+            return [
+                institution.get("value", None)
+                for institution in self.metadata.institutions
+                ]
+        return None
@@ -0,0 +1,114 @@
+"""
+Module for journals repsone of Inspirehep
+
+The module provides a data class with several get methods
+to make it easy to get journals information from the response of
+a request to Inspire hep API for journal record.
+
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import List
+from pyinspirehep.utils import (
+    convert_to_bool,
+    convert_to_date,
+)
+from .data_models import (
+    MetadataDecoder,
+    RecordMetadata,
+    SingleRecordResponse,
+)
+
+
+@dataclass
+class JournalMetadata(RecordMetadata):
+    """Journal Metadata according to Inspirehep API.
+    """
+    journal_title: dict = None
+    short_title: str = None
+    title_variants: List[str] = None
+    publisher: List[str] = None
+    proceedings: bool = None
+    refereed: bool = None
+    public_notes: List[dict] = None
+    urls: List[dict] = None
+    inspire_categories: List[dict] = None
+    deleted: bool = None
+    schema: str = None
+    control_number: int = None
+    legacy_creation_date: datetime.date = None
+
+    DECODER = MetadataDecoder((
+        ("journal_title", "journal_title", None, None),
+        ("short_title", "short_title", None, None),
+        ("title_variants", "title_variants", None, None),
+        ("publisher", "publisher", None, None),
+        ("proceedings", "proceedings", convert_to_bool, False),
+        ("refereed", "refereed", convert_to_bool, False),
+        ("public_notes", "public_notes", None, None),
+        ("urls", "urls", None, None),
+        ("inspire_categories", "inspire_categories", None, None),
+        ("deleted", "deleted", convert_to_bool, False),
+        ("schema", "$schema", None, None),
+        ("control_number", "control_number", int, None),
+        ("legacy_creation_date", "legacy_creation_date", convert_to_date, None),
+    ))
+
+
+@dataclass
+class Journal(SingleRecordResponse):
+    """Class to contain Inspirehep API single record response for Journal.
+
+    Attribtes
+    ---------
+    id : str
+        The unique identifier of the object.
+
+    created : datetime.datetime
+        The UTC timestamp when object was created.
+
+    updated : datetime.datetime
+        The UTC timestamp when object was las updated.
+
+    links : dict
+        List of related links to current object.
+
+    metadata : JournalMetadata
+        Information about the Journal which is an instance JournalMetadata object.
+
+    """
+    id: str
+    created: datetime.datetime = None
+    updated: datetime.datetime = None
+    links: dict = None
+    metadata: JournalMetadata = None
+
+    METADATA_CLASS = JournalMetadata
+
+    @property
+    def control_number(self):
+        """Returns the `control_number` of `self.metadata`
+
+        """
+        return self.metadata.control_number
+
+    def get_id(self, as_int=False):
+        """Returns the journal id in INSPIRE HEP
+
+        """
+        return self.control_number if as_int else str(self.control_number)
+
+    def get_title(self):
+        """Returns the full title of the journal if exists.
+
+        """
+        if self.metadata.journal_title:
+            return self.metadata.journal_title.get("title", None)
+        return None
+
+    def get_short_title(self):
+        """Returns the short title of the journal.
+
+        """
+        return self.metadata.short_title
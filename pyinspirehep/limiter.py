@@ -0,0 +1,83 @@
+"""
+Rate limiting of requests shared between threads.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket rate limiter which can be shared between threads.
+
+    Each call of `acquire` takes a token and blocks until a token is
+    available. Tokens are added with the rate of `rate` tokens per second
+    up to `burst` tokens.
+
+    Parameters
+    ----------
+    rate : float
+        The number of requests per second.
+
+    burst : int
+        (Default value = 1)
+        The maximum number of requests which can be sent at once.
+
+    >>> limiter = RateLimiter(rate=1000, burst=2)
+    >>> limiter.acquire()
+    >>> limiter.acquire()
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._updated) * self.rate,
+            )
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Takes a token if available without blocking.
+
+        Returns
+        -------
+        bool
+            True if a token was taken.
+
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def delay(self) -> float:
+        """Returns the seconds until a token is available.
+
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1 - self._tokens) / self.rate)
+
+    def acquire(self) -> None:
+        """Takes a token and blocks until a token is available.
+
+        """
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
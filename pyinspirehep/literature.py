@@ -12,18 +12,26 @@ import datetime
 import logging
 from dataclasses import dataclass
 from datetime import date
-from typing import List
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+)
 from pyinspirehep.utils import (
-    convert_json_timestamp,
     convert_to_bool,
     convert_to_date,
 )
-from .data_models import SingleRecordResponse
+from .data_models import (
+    MetadataDecoder,
+    RecordMetadata,
+    SingleRecordResponse,
+)
 
 
 @dataclass
-class LiteratureMetadata:
-    control_number: str
+class LiteratureMetadata(RecordMetadata):
+    control_number: str = None
     abstracts: List[dict] = None
     arxiv_eprints: List[dict] = None
     authors: List[dict] = None
@@ -59,57 +67,121 @@ class LiteratureMetadata:
     texkeys: List[str] = None
     titles: List[dict] = None
 
-    @classmethod
-    def from_dict(cls, metadata: dict = None):
-        if metadata is None:
-            return LiteratureMetadata()
-        legacy_creation_date = convert_to_date(
-            metadata.get("legacy_creation_date", None),
-        )
-        earliest_date = convert_to_date(
-            metadata.get("earliest_date", None)
-        )
-        preprint_date = convert_to_date(
-            metadata.get("preprint_date", None)
-        )
-        return LiteratureMetadata(
-            control_number=metadata["control_number"],
-            abstracts=metadata.get("abstracts", None),
-            arxiv_eprints=metadata.get("arxiv_eprints", None),
-            authors=metadata.get("authors", None),
-            author_count=metadata.get("author_count", None),
-            earliest_date=earliest_date,
-            citation_count=int(metadata.get("citation_count", 0)),
-            citation_count_without_self_citations=metadata.get(
-                "citation_count_without_self_citations", 0),
-            citeable=convert_to_bool(metadata.get("citeable", None)),
-            copyright=metadata.get("copyright", None),
-            core=convert_to_bool(metadata.get("core", None)),
-            curated=convert_to_bool(metadata.get("curated", None)),
-            documents=metadata.get("documents", None),
-            document_type=metadata.get("document_type", None),
-            dois=metadata.get("dois", None),
-            facet_author_name=metadata.get("facet_author_name", None),
-            figures=metadata.get("figures", None),
-            first_author=metadata.get("first_author", None),
-            imprints=metadata.get("imprints", None),
-            inspire_categories=metadata.get("inspire_categories", None),
-            keywords=metadata.get("keywords", None),
-            legacy_version=metadata.get("legacy_version", None),
-            legacy_creation_date=legacy_creation_date,
-            license=metadata.get("license", None),
-            number_of_pages=metadata.get("number_of_pages", 0),
-            preprint_date=preprint_date,
-            primary_arxiv_category=metadata.get("primary_arxiv_category", 0),
-            public_notes=metadata.get("public_notes", 0),
-            publication_info=metadata.get("publication_info", 0),
-            referenced_authors_bais=metadata.get("referenced_authors_bais", 0),
-            references=metadata.get("references", 0),
-            refereed=convert_to_bool(metadata.get("refereed", None)),
-            schema=metadata.get("$schema", None),
-            texkeys=metadata.get("texkeys", 0),
-            titles=metadata.get("titles", 0),
-        )
+    DECODER = MetadataDecoder((
+        ("control_number", "control_number", None, None),
+        ("abstracts", "abstracts", None, None),
+        ("arxiv_eprints", "arxiv_eprints", None, None),
+        ("authors", "authors", None, None),
+        ("author_count", "author_count", None, None),
+        ("earliest_date", "earliest_date", convert_to_date, None),
+        ("citation_count", "citation_count", int, 0),
+        ("citation_count_without_self_citations",
+            "citation_count_without_self_citations", None, 0),
+        ("citeable", "citeable", convert_to_bool, False),
+        ("copyright", "copyright", None, None),
+        ("core", "core", convert_to_bool, False),
+        ("curated", "curated", convert_to_bool, False),
+        ("documents", "documents", None, None),
+        ("document_type", "document_type", None, None),
+        ("dois", "dois", None, None),
+        ("facet_author_name", "facet_author_name", None, None),
+        ("figures", "figures", None, None),
+        ("first_author", "first_author", None, None),
+        ("imprints", "imprints", None, None),
+        ("inspire_categories", "inspire_categories", None, None),
+        ("keywords", "keywords", None, None),
+        ("legacy_version", "legacy_version", None, None),
+        ("legacy_creation_date", "legacy_creation_date", convert_to_date, None),
+        ("license", "license", None, None),
+        ("number_of_pages", "number_of_pages", None, 0),
+        ("preprint_date", "preprint_date", convert_to_date, None),
+        ("primary_arxiv_category", "primary_arxiv_category", None, 0),
+        ("public_notes", "public_notes", None, 0),
+        ("publication_info", "publication_info", None, 0),
+        ("referenced_authors_bais", "referenced_authors_bais", None, 0),
+        ("references", "references", None, 0),
+        ("refereed", "refereed", convert_to_bool, False),
+        ("schema", "$schema", None, None),
+        ("texkeys", "texkeys", None, 0),
+        ("titles", "titles", None, 0),
+    ))
+
+
+@dataclass
+class ReferenceStats:
+    """Counters of resolved and unresolved references of literature.
+
+    References without a record in Inspirehep are counted instead of
+    being logged one by one. If `log_every` is positive, a warning with
+    the counters is logged once every `log_every` unresolved references.
+
+    Attribtes
+    ---------
+    papers : int
+        The number of literature records whose references were counted.
+
+    references : int
+        The total number of references.
+
+    unresolved : int
+        The number of references with no record in Inspirehep.
+
+    papers_with_unresolved : int
+        The number of literature records with unresolved references.
+
+    log_every : int
+        (Default value = 0)
+        The number of unresolved references per logged warning. No
+        warning is logged when it is 0.
+
+    """
+    papers: int = 0
+    references: int = 0
+    unresolved: int = 0
+    papers_with_unresolved: int = 0
+    log_every: int = 0
+
+    @property
+    def resolved(self) -> int:
+        return self.references - self.unresolved
+
+    def add(self, control_number, references: int, unresolved: int) -> None:
+        """Adds the counts of references of a literature record.
+
+        """
+        previous = self.unresolved
+        self.papers += 1
+        self.references += references
+        if not unresolved:
+            return
+        self.unresolved += unresolved
+        self.papers_with_unresolved += 1
+        if self.log_every > 0 and (
+            self.unresolved // self.log_every > previous // self.log_every
+        ):
+            logging.warning(
+                "%d of %d references of %d literature records have no "
+                "record in Inspirehep (last one with control_number = %s)",
+                self.unresolved,
+                self.references,
+                self.papers,
+                control_number,
+            )
+
+
+def _get_references_ids(references: List[dict]) -> Tuple[List[str], int]:
+    """Returns ids of references and the number of unresolved ones.
+
+    """
+    ids = []
+    append = ids.append
+    for item in references:
+        record = item.get('record')
+        if record is not None:
+            ref = record.get('$ref')
+            if ref is not None:
+                append(ref.rpartition("/")[2])
+    return ids, len(references) - len(ids)
 
 
 @dataclass
@@ -140,55 +212,77 @@ class Literature(SingleRecordResponse):
     links: dict = None
     metadata: LiteratureMetadata = None
 
-    @classmethod
-    def from_response(cls, respone: dict):
-        """
+    METADATA_CLASS = LiteratureMetadata
+
+    def get_control_number(self):
+        return self.metadata.control_number
+
+    def get_citation_count(self):
+        return self.metadata.citation_count
+
+    def get_references_ids(self, stats: ReferenceStats = None) -> List[str]:
+        """Returns control numbers of the references with a record.
 
         Parameters
         ----------
-        respone : dict
-            
+        stats : ReferenceStats
+            (Default value = None)
+            If given, the references without a record in Inspirehep are
+            counted in it.
 
         Returns
         -------
-        SingleRecordResponse
+        List[str]
 
         """
-        id = respone.get("id", None)
-        created = convert_json_timestamp(
-            respone.get("created", None),
-        )
-        updated = convert_json_timestamp(
-            respone.get("updated", None),
-        )
-        links = respone.get("links", {})
-        metadata = respone.get("metadata", {})
-        metadata = LiteratureMetadata.from_dict(metadata)
-        return Literature(
-            id=id,
-            created=created,
-            updated=updated,
-            links=links,
-            metadata=metadata,
-        )
+        references = self.metadata.references
+        if not references:
+            return []
+        ids, unresolved = _get_references_ids(references)
+        if stats is not None:
+            stats.add(self.get_control_number(), len(references), unresolved)
+        return ids
 
-    def get_control_number(self):
-        return self.metadata.control_number
 
-    def get_citation_count(self):
-        return self.metadata.citation_count
+def get_literatures_references_ids(
+    literatures: Iterable[Literature],
+    stats: ReferenceStats = None,
+    ) -> Dict[str, list]:
+    """Returns ids of references of many literature records as columns.
 
-    def get_references_ids(self):
-        ids = []
-        if self.metadata.references:
-            for item in self.metadata.references:
-                try:
-                    ids.append(item['record']['$ref'].split("/")[-1])
-                except KeyError:
-                    logging.warning(
-                        f"A Reference with no record in Inspirehep for "
-                        f"literature with "
-                        f"control_number = {self.get_control_number()}"
-                    )
-        return ids
+    It is the batch version of `Literature.get_references_ids`, which
+    skips the method calls per record and counts the unresolved
+    references of all records in `stats`.
+
+    Parameters
+    ----------
+    literatures : Iterable[Literature]
+
+    stats : ReferenceStats
+        (Default value = None)
+        If given, the references of all records are counted in it.
+
+    Returns
+    -------
+    Dict[str, list]
+        A dict with 'control_number' and 'references_ids' keys. Each
+        value is a list with one item per literature, and the items of
+        'references_ids' are lists of ids.
+
+    """
+    control_numbers = []
+    references_ids = []
+    add = stats.add if stats is not None else None
+    for literature in literatures:
+        metadata = literature.metadata
+        references = metadata.references or ()
+        ids, unresolved = _get_references_ids(references)
+        if add is not None and references:
+            add(metadata.control_number, len(references), unresolved)
+        control_numbers.append(metadata.control_number)
+        references_ids.append(ids)
+    return {
+        'control_number': control_numbers,
+        'references_ids': references_ids,
+        }
 
@@ -0,0 +1,357 @@
+"""
+Builder of search queries of Inspirehep API.
+
+Queries are built from terms, ranges and groups and are compiled to
+compact query strings which can be passed as `q` to the search methods
+of the `Client`:
+
+>>> query = Term('t', 'dark matter') & Range('citation_count', 100, 500)
+>>> query.compile()
+'t:"dark matter" and citation_count:100->500'
+>>> (RefersTo(451647) | Term('control_number', 451647)).compile()
+'refersto:recid:451647 or control_number:451647'
+
+Long OR-lists can be split into several queries which fit the URL and
+result limits of the API:
+
+>>> [q.compile() for q in Or.of('control_number', [1, 2, 3]).split(max_terms=2)]
+['control_number:1 or control_number:2', 'control_number:3']
+"""
+
+import datetime
+from typing import (
+    Iterable,
+    List,
+)
+from urllib.parse import quote
+
+
+# Characters which need the value of a term to be quoted.
+_SPECIAL_CHARACTERS = frozenset(' ():"')
+
+# The maximum length of a URL encoded query accepted by Inspirehep.
+MAX_QUERY_LENGTH = 4000
+
+
+def _format_value(value, quoted: bool = None) -> str:
+    """Returns the value of a term as it is written in a query.
+
+    When `quoted` is None, the value is quoted only if it has spaces or
+    special characters.
+
+    >>> _format_value('Maldacena, Juan')
+    '"Maldacena, Juan"'
+    >>> _format_value('Maldacena, Juan', quoted=False)
+    'Maldacena, Juan'
+    >>> _format_value(datetime.date(2020, 1, 31))
+    '2020-01-31'
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    value = str(value)
+    if quoted is None:
+        quoted = any(character in _SPECIAL_CHARACTERS for character in value)
+    if quoted:
+        return '"' + value.replace('"', '\\"') + '"'
+    return value
+
+
+class Query:
+    """Base class of search queries.
+
+    Queries can be combined with `&` (and), `|` (or) and `~` (not).
+    """
+
+    # The precedence of the query in a compiled string. Operands with a
+    # lower precedence than their group are wrapped in parentheses.
+    PRECEDENCE = 3
+
+    def compile(self) -> str:
+        """Returns the query string.
+
+        """
+        raise NotImplementedError
+
+    def __str__(self) -> str:
+        return self.compile()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.compile()!r})"
+
+    def __and__(self, other: "Query") -> "Query":
+        return And(self, other)
+
+    def __or__(self, other: "Query") -> "Query":
+        return Or(self, other)
+
+    def __invert__(self) -> "Query":
+        return Not(self)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Query) and self.compile() == other.compile()
+
+    def __hash__(self) -> int:
+        return hash(self.compile())
+
+    def url_length(self) -> int:
+        """Returns the length of the query when it is encoded in a URL.
+
+        """
+        return len(quote(self.compile(), safe=''))
+
+
+class Raw(Query):
+    """Query string which is used as it is.
+
+    >>> Raw('a E.Witten.1').compile()
+    'a E.Witten.1'
+    """
+
+    PRECEDENCE = 0
+
+    def __init__(self, query: str) -> None:
+        self.query = query
+
+    def compile(self) -> str:
+        return self.query
+
+
+class Term(Query):
+    """Query of a field with a value.
+
+    Parameters
+    ----------
+    field : str
+        The field, e.g. 'control_number', 't' (title) or 'a' (author).
+    value :
+        The value of the field. Values with spaces or special characters
+        are quoted.
+    nested_key : str
+        (Default value = None)
+        The key of the value in the field, e.g. 'value' for 'name.value'.
+    quoted : bool
+        (Default value = None)
+        If the value must be quoted. When it is None the value is quoted
+        only if it has spaces or special characters.
+
+    >>> Term('name', 'Ebadi, Javad', 'value').compile()
+    'name.value:"Ebadi, Javad"'
+    """
+
+    def __init__(
+        self,
+        field: str,
+        value,
+        nested_key: str = None,
+        quoted: bool = None,
+        ) -> None:
+        self.field = field if nested_key is None else f"{field}.{nested_key}"
+        self.value = value
+        self.quoted = quoted
+
+    def compile(self) -> str:
+        return f"{self.field}:{_format_value(self.value, self.quoted)}"
+
+
+class Range(Query):
+    """Query of a field with values in a range.
+
+    Parameters
+    ----------
+    field : str
+    start :
+        The first value of the range.
+    end :
+        The last value of the range.
+
+    >>> Range('control_number', 1, 1000).compile()
+    'control_number:1->1000'
+    """
+
+    def __init__(self, field: str, start, end) -> None:
+        self.field = field
+        self.start = start
+        self.end = end
+
+    def compile(self) -> str:
+        return (
+            f"{self.field}:{_format_value(self.start)}"
+            f"->{_format_value(self.end)}"
+        )
+
+    def split(self, step: int) -> List["Range"]:
+        """Returns consecutive ranges of integers with at most `step` values.
+
+        It can be used to split a range with too many results for the
+        pagination limit of the API.
+
+        >>> [r.compile() for r in Range('control_number', 1, 25).split(10)]
+        ['control_number:1->10', 'control_number:11->20', 'control_number:21->25']
+        """
+        return [
+            self.__class__(self.field, start, min(start + step - 1, self.end))
+            for start in range(self.start, self.end + 1, step)
+            ]
+
+
+class DateRange(Range):
+    """Query of a date field with values between two dates.
+
+    >>> DateRange('de', datetime.date(2020, 1, 1), datetime.date(2020, 12, 31)).compile()
+    'de:2020-01-01->2020-12-31'
+    """
+
+    def split(self, step: int) -> List["DateRange"]:
+        """Returns consecutive date ranges of at most `step` days.
+
+        >>> [r.compile() for r in DateRange('de', datetime.date(2020, 1, 1), datetime.date(2020, 1, 10)).split(5)]
+        ['de:2020-01-01->2020-01-05', 'de:2020-01-06->2020-01-10']
+        """
+        ranges = []
+        start = self.start
+        while start <= self.end:
+            end = min(start + datetime.timedelta(days=step - 1), self.end)
+            ranges.append(self.__class__(self.field, start, end))
+            start = end + datetime.timedelta(days=1)
+        return ranges
+
+
+class RefersTo(Query):
+    """Query of the records which cite a literature record.
+
+    >>> RefersTo('1785369').compile()
+    'refersto:recid:1785369'
+    """
+
+    def __init__(self, literature_id) -> None:
+        self.literature_id = literature_id
+
+    def compile(self) -> str:
+        return f"refersto:recid:{self.literature_id}"
+
+
+class _Group(Query):
+    """Base class of groups of queries joined by an operator.
+
+    """
+
+    OPERATOR = None
+
+    def __init__(self, *queries: Query) -> None:
+        flat = []
+        for query in queries:
+            if isinstance(query, str):
+                query = Raw(query)
+            # Nested groups of the same operator are flattened.
+            if type(query) is type(self):
+                flat.extend(query.queries)
+            else:
+                flat.append(query)
+        self.queries = flat
+
+    def _compile_operand(self, query: Query) -> str:
+        compiled = query.compile()
+        if query.PRECEDENCE < self.PRECEDENCE:
+            return f"({compiled})"
+        return compiled
+
+    def compile(self) -> str:
+        return f" {self.OPERATOR} ".join(
+            self._compile_operand(query) for query in self.queries
+            )
+
+
+class And(_Group):
+    """Query of the records which match all of the queries.
+
+    >>> And(Term('t', 'higgs'), Term('a', 'E.Witten.1') | Term('a', 'J.M.Maldacena.1')).compile()
+    't:higgs and (a:E.Witten.1 or a:J.M.Maldacena.1)'
+    """
+
+    OPERATOR = "and"
+    PRECEDENCE = 2
+
+
+class Or(_Group):
+    """Query of the records which match any of the queries.
+
+    """
+
+    OPERATOR = "or"
+    PRECEDENCE = 1
+
+    @classmethod
+    def of(cls, field: str, values: Iterable) -> "Or":
+        """Returns a query of a field with any of the values.
+
+        >>> Or.of('control_number', [1, 2]).compile()
+        'control_number:1 or control_number:2'
+        """
+        return cls(*(Term(field, value) for value in values))
+
+    def split(
+        self,
+        max_length: int = MAX_QUERY_LENGTH,
+        max_terms: int = None,
+        ) -> List["Or"]:
+        """Splits the query to queries which fit the limits.
+
+        The queries of the group are distributed in order over as few
+        queries as possible, so that each one has at most `max_terms`
+        queries and is at most `max_length` characters when it is URL
+        encoded.
+
+        Parameters
+        ----------
+        max_length : int
+            (Default value = MAX_QUERY_LENGTH)
+            The maximum length of each URL encoded query.
+        max_terms : int
+            (Default value = None)
+            The maximum number of queries in each group, e.g. to keep the
+            number of results under the pagination limit.
+
+        Returns
+        -------
+        List[Or]
+
+        """
+        separator = len(quote(f" {self.OPERATOR} ", safe=''))
+        chunks = []
+        chunk = []
+        length = 0
+        for query in self.queries:
+            query_length = len(quote(self._compile_operand(query), safe=''))
+            if query_length > max_length:
+                raise ValueError(
+                    f"The query {query.compile()!r} is longer than {max_length}"
+                )
+            added = query_length + (separator if chunk else 0)
+            full = max_terms is not None and len(chunk) >= max_terms
+            if chunk and (full or length + added > max_length):
+                chunks.append(self.__class__(*chunk))
+                chunk, length, added = [], 0, query_length
+            chunk.append(query)
+            length += added
+        if chunk:
+            chunks.append(self.__class__(*chunk))
+        return chunks
+
+
+class Not(Query):
+    """Query of the records which do not match a query.
+
+    >>> Not(Term('document_type', 'thesis')).compile()
+    'not document_type:thesis'
+    >>> (Term('t', 'higgs') & ~(Term('a', 'x') | Term('a', 'y'))).compile()
+    't:higgs and not (a:x or a:y)'
+    """
+
+    def __init__(self, query: Query) -> None:
+        self.query = query
+
+    def compile(self) -> str:
+        compiled = self.query.compile()
+        if self.query.PRECEDENCE < self.PRECEDENCE:
+            compiled = f"({compiled})"
+        return f"not {compiled}"
@@ -0,0 +1,174 @@
+"""
+Retry policies and circuit breaking of requests of the `Client`.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict
+from pyinspirehep.exception import (
+    InspirehepCircuitOpenError,
+    InspirehepConnectionError,
+    InspirehepServerError,
+    InspirehepTimeoutError,
+    InspirehepTooManyRequestsError,
+)
+
+
+@dataclass
+class RetryPolicy:
+    """Policy to retry a request which failed with a type of error.
+
+    The delay before the n-th retry is `backoff * 2 ** n` seconds, limited
+    to `max_backoff`, with a random jitter of up to `jitter` of it. If the
+    API asked to wait with a Retry-After header, that is used instead
+    (also limited to `max_backoff`).
+
+    Attribtes
+    ---------
+    max_retries : int
+        The maximum number of retries.
+
+    backoff : float
+        The delay before the first retry in seconds.
+
+    max_backoff : float
+        The maximum delay between retries in seconds.
+
+    jitter : float
+        The fraction of the delay which is randomized.
+
+    >>> RetryPolicy(max_retries=3, backoff=1, jitter=0).delay(2)
+    4
+    >>> RetryPolicy(max_retries=3, backoff=1).delay(3) is None
+    True
+    """
+    max_retries: int = 3
+    backoff: float = 1.0
+    max_backoff: float = 60.0
+    jitter: float = 0.1
+
+    def delay(self, attempt: int, retry_after: float = None) -> float:
+        """Returns seconds to wait before retry after `attempt` retries.
+
+        Returns None if no more retries are allowed.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        delay = min(self.backoff * 2 ** attempt, self.max_backoff)
+        if self.jitter:
+            delay += delay * self.jitter * random.random()
+        return delay
+
+
+# Retry policies for each type of error. Errors which are not caused by
+# throttling or outages (e.g. 404 or invalid json) are not retried.
+DEFAULT_RETRY_POLICIES = {
+    InspirehepTooManyRequestsError: RetryPolicy(max_retries=5, backoff=5.0),
+    InspirehepServerError: RetryPolicy(max_retries=3, backoff=2.0),
+    InspirehepTimeoutError: RetryPolicy(max_retries=2, backoff=1.0),
+    InspirehepConnectionError: RetryPolicy(max_retries=3, backoff=1.0),
+}
+
+
+def get_retry_policy(
+    policies: Dict[type, RetryPolicy],
+    error: Exception,
+    ) -> RetryPolicy:
+    """Returns the policy of the most specific class of `error`.
+
+    >>> get_retry_policy(DEFAULT_RETRY_POLICIES, InspirehepTimeoutError()).max_retries
+    2
+    >>> get_retry_policy(DEFAULT_RETRY_POLICIES, ValueError()) is None
+    True
+    """
+    for error_class in type(error).__mro__:
+        if error_class in policies:
+            return policies[error_class]
+    return None
+
+
+class CircuitBreaker:
+    """Stops sending requests after consecutive failures.
+
+    When `failure_threshold` consecutive requests fail because of outages
+    (connection errors, timeouts and 5xx responses) the circuit opens and
+    requests fail with `InspirehepCircuitOpenError` without being sent.
+    After `recovery_time` seconds one request is let through; if it
+    succeeds the circuit closes, otherwise it opens again.
+
+    Parameters
+    ----------
+    failure_threshold : int
+        (Default value = 5)
+
+    recovery_time : float
+        (Default value = 30.0)
+
+    """
+
+    FAILURES = (
+        InspirehepConnectionError,
+        InspirehepServerError,
+        )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def before_request(self) -> None:
+        """Raises `InspirehepCircuitOpenError` if the request must not be sent.
+
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.recovery_time - time.monotonic()
+            if remaining > 0 or self._trial:
+                raise InspirehepCircuitOpenError(
+                    f"{self.failures} consecutive failures, requests are "
+                    f"stopped for {max(remaining, 0):.1f} seconds",
+                    retry_after=max(remaining, 0),
+                )
+            self._trial = True
+
+    def release(self) -> None:
+        """Ends the trial request of `before_request` without a result.
+
+        It is called after every request, so a trial which failed with an
+        unexpected error, e.g. `KeyboardInterrupt`, does not keep the
+        circuit open forever. The circuit stays open and the next request
+        after `recovery_time` is a trial again.
+        """
+        with self._lock:
+            self._trial = False
+
+    def record(self, error: Exception = None) -> None:
+        """Records result of a request which failed with `error` or succeeded.
+
+        """
+        with self._lock:
+            self._trial = False
+            if isinstance(error, self.FAILURES):
+                self.failures += 1
+                if self.failures >= self.failure_threshold:
+                    self.opened_at = time.monotonic()
+            else:
+                # The API responded, so it is available again.
+                self.failures = 0
+                self.opened_at = None
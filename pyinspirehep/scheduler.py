@@ -0,0 +1,170 @@
+"""
+Scheduling of requests of different priorities under a shared rate limit.
+"""
+
+import threading
+from collections import deque
+from typing import Dict
+from pyinspirehep.limiter import RateLimiter
+
+
+# Priority of requests of a user who waits for the result, e.g. lookups.
+INTERACTIVE = 'interactive'
+
+# Priority of background requests, e.g. pages of a clone.
+BULK = 'bulk'
+
+# The share of the rate limit of each priority when all of them wait.
+DEFAULT_WEIGHTS = {
+    INTERACTIVE: 8,
+    BULK: 1,
+    }
+
+
+def check_weights(weights: Dict[str, float] = None) -> Dict[str, float]:
+    """Returns a copy of the weights of priorities or raises ValueError.
+
+    `DEFAULT_WEIGHTS` is returned when `weights` is None.
+    """
+    weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+    if not weights or any(weight <= 0 for weight in weights.values()):
+        raise ValueError("weights must be positive")
+    return weights
+
+
+def default_priority(weights: Dict[str, float]) -> str:
+    """Returns the priority of requests which do not set one.
+
+    It is `INTERACTIVE` if it is one of the priorities, otherwise the
+    priority with the largest weight.
+
+    >>> default_priority({'urgent': 4, 'batch': 1})
+    'urgent'
+    """
+    if INTERACTIVE in weights:
+        return INTERACTIVE
+    return max(weights, key=weights.get)
+
+
+def bulk_priority(weights: Dict[str, float]) -> str:
+    """Returns the priority of background requests like clone pages.
+
+    It is `BULK` if it is one of the priorities, otherwise the priority
+    with the smallest weight.
+
+    >>> bulk_priority({'urgent': 4, 'batch': 1})
+    'batch'
+    """
+    if BULK in weights:
+        return BULK
+    return min(weights, key=weights.get)
+
+
+class RequestScheduler:
+    """Fair queue of requests of priority classes sharing a rate limiter.
+
+    Requests of each priority wait in their own FIFO queue and the tokens
+    of the rate limiter are given to the queues by weighted fair queuing:
+    when all priorities have waiting requests, each one gets a share of
+    the rate proportional to its weight, and a priority which has no
+    waiting requests leaves its share to the others. A request of a
+    priority which has been idle is sent before the waiting requests of
+    the other priorities, so interactive requests jump ahead of bulk
+    paging without stopping it.
+
+    Parameters
+    ----------
+    limiter : RateLimiter
+        The rate limiter shared by all priorities.
+
+    weights : Dict[str, float]
+        (Default value = None)
+        The weight of each priority. When it is None `DEFAULT_WEIGHTS`
+        is used.
+
+    >>> scheduler = RequestScheduler(RateLimiter(rate=1000))
+    >>> scheduler.acquire(BULK)
+    >>> scheduler.granted[BULK]
+    1
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        weights: Dict[str, float] = None,
+        ) -> None:
+        weights = check_weights(weights)
+        self.limiter = limiter
+        self.weights = weights
+        self.granted = {priority: 0 for priority in weights}
+        self._queues = {priority: deque() for priority in weights}
+        # Virtual time at which the last request of each priority ends.
+        self._finish = {priority: 0.0 for priority in weights}
+        self._clock = 0.0
+        # Ties are given to the priorities with larger weights.
+        self._order = sorted(weights, key=weights.get, reverse=True)
+        self._condition = threading.Condition()
+
+    def _start(self, priority: str) -> float:
+        return max(self._finish[priority], self._clock)
+
+    def _select(self) -> str:
+        """Returns the priority whose waiting request is sent next.
+
+        """
+        selected = None
+        for priority in self._order:
+            if self._queues[priority] and (
+                selected is None
+                or self._start(priority) < self._start(selected)
+            ):
+                selected = priority
+        return selected
+
+    def acquire(self, priority: str = None) -> None:
+        """Blocks until a request of `priority` can be sent.
+
+        Parameters
+        ----------
+        priority : str
+            (Default value = None)
+            One of the priorities in `weights`. When it is None the
+            `default_priority` of the weights is used.
+
+        """
+        if priority is None:
+            priority = default_priority(self.weights)
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority '{priority}'")
+        queue = self._queues[priority]
+        ticket = object()
+        with self._condition:
+            queue.append(ticket)
+            try:
+                while True:
+                    if self._select() == priority and queue[0] is ticket:
+                        if self.limiter.try_acquire():
+                            break
+                        self._condition.wait(self.limiter.delay())
+                    else:
+                        self._condition.wait()
+            except BaseException:
+                queue.remove(ticket)
+                self._condition.notify_all()
+                raise
+            queue.popleft()
+            start = self._start(priority)
+            self._clock = start
+            self._finish[priority] = start + 1 / self.weights[priority]
+            self.granted[priority] += 1
+            self._condition.notify_all()
+
+    def waiting(self) -> Dict[str, int]:
+        """Returns the number of waiting requests of each priority.
+
+        """
+        with self._condition:
+            return {
+                priority: len(queue)
+                for priority, queue in self._queues.items()
+                }
@@ -0,0 +1,133 @@
+"""
+Module for seminars repsone of Inspirehep
+
+The module provides a data class with several get methods
+to make it easy to get seminars information from the response of
+a request to Inspire hep API for seminar record.
+
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import List
+from pyinspirehep.utils import (
+    convert_to_bool,
+    convert_to_date,
+)
+from .data_models import (
+    MetadataDecoder,
+    RecordMetadata,
+    SingleRecordResponse,
+)
+
+
+@dataclass
+class SeminarMetadata(RecordMetadata):
+    """Seminar Metadata according to Inspirehep API.
+    """
+    title: dict = None
+    speakers: List[dict] = None
+    address: dict = None
+    start_datetime: str = None
+    end_datetime: str = None
+    timezone: str = None
+    abstract: dict = None
+    inspire_categories: List[dict] = None
+    join_urls: List[dict] = None
+    material_urls: List[dict] = None
+    series: List[dict] = None
+    contact_details: List[dict] = None
+    literature_records: List[dict] = None
+    keywords: List[dict] = None
+    website: str = None
+    captioned: bool = None
+    deleted: bool = None
+    schema: str = None
+    control_number: int = None
+    legacy_creation_date: datetime.date = None
+
+    DECODER = MetadataDecoder((
+        ("title", "title", None, None),
+        ("speakers", "speakers", None, None),
+        ("address", "address", None, None),
+        ("start_datetime", "start_datetime", None, None),
+        ("end_datetime", "end_datetime", None, None),
+        ("timezone", "timezone", None, None),
+        ("abstract", "abstract", None, None),
+        ("inspire_categories", "inspire_categories", None, None),
+        ("join_urls", "join_urls", None, None),
+        ("material_urls", "material_urls", None, None),
+        ("series", "series", None, None),
+        ("contact_details", "contact_details", None, None),
+        ("literature_records", "literature_records", None, None),
+        ("keywords", "keywords", None, None),
+        ("website", "website", None, None),
+        ("captioned", "captioned", convert_to_bool, False),
+        ("deleted", "deleted", convert_to_bool, False),
+        ("schema", "$schema", None, None),
+        ("control_number", "control_number", int, None),
+        ("legacy_creation_date", "legacy_creation_date", convert_to_date, None),
+    ))
+
+
+@dataclass
+class Seminar(SingleRecordResponse):
+    """Class to contain Inspirehep API single record response for Seminar.
+
+    Attribtes
+    ---------
+    id : str
+        The unique identifier of the object.
+
+    created : datetime.datetime
+        The UTC timestamp when object was created.
+
+    updated : datetime.datetime
+        The UTC timestamp when object was las updated.
+
+    links : dict
+        List of related links to current object.
+
+    metadata : SeminarMetadata
+        Information about the Seminar which is an instance SeminarMetadata object.
+
+    """
+    id: str
+    created: datetime.datetime = None
+    updated: datetime.datetime = None
+    links: dict = None
+    metadata: SeminarMetadata = None
+
+    METADATA_CLASS = SeminarMetadata
+
+    @property
+    def control_number(self):
+        """Returns the `control_number` of `self.metadata`
+
+        """
+        return self.metadata.control_number
+
+    def get_id(self, as_int=False):
+        """Returns the seminar id in INSPIRE HEP
+
+        """
+        return self.control_number if as_int else str(self.control_number)
+
+    def get_title(self):
+        """Returns the title of the seminar if exists.
+
+        """
+        if self.metadata.title:
+            return self.metadata.title.get("title", None)
+        return None
+
+    def get_speakers(self):
+        """Returns names of the speakers of the seminar.
+
+        """
+        if self.metadata.speakers:
+            return [
+                speaker.get("name", None)
+                for speaker in self.metadata.speakers
+                ]
+        return None
@@ -0,0 +1,81 @@
+"""
+Coalescing of concurrent identical calls.
+"""
+
+import threading
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+)
+
+
+class _Call:
+    """A call in flight whose result is shared by all of its callers.
+
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Runs only one of the concurrent calls with the same key.
+
+    When a call with a key is in flight, other threads calling `do` with
+    the same key wait for it and get its result (or its error) instead of
+    running the function again. Calls are not cached after they finish.
+
+    >>> flight = SingleFlight()
+    >>> flight.do('literature/1', lambda: {'id': '1'})
+    {'id': '1'}
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs):
+        """Returns result of `func(*args, **kwargs)` shared by key.
+
+        Parameters
+        ----------
+        key : Hashable
+            Calls with equal keys are coalesced.
+
+        func : Callable
+            The function to call.
+
+        Raises
+        ------
+        Exception
+            The error raised by the call is raised in all of its callers.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,88 @@
+"""
+HTTP/2 transport of the `Client`.
+
+The `HTTP2Session` has the interface of `requests.Session` which is used
+by the `Client`, but sends requests with `httpx` over HTTP/2, so many
+concurrent requests are multiplexed over a few connections. The `httpx`
+package is an optional dependency and can be installed with:
+
+    pip install pyinspirehep[http2]
+"""
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class HTTP2Session:
+    """Session which sends requests with `httpx` over HTTP/2.
+
+    Errors of `httpx` are raised as the related errors of `requests` and
+    `timeout` can be given as a `(connect, read)` tuple like in `requests`.
+    The session can be shared between threads.
+
+    Parameters
+    ----------
+    max_connections : int
+        (Default value = 10)
+        The maximum number of connections. With HTTP/2 each connection
+        carries many requests at the same time.
+
+    headers : dict
+        (Default value = None)
+        Headers sent with each request.
+
+    """
+
+    def __init__(self, max_connections: int = 10, headers: dict = None) -> None:
+        if httpx is None:
+            raise ImportError(
+                "The http2 transport requires httpx, install it using "
+                "'pip install pyinspirehep[http2]'"
+            )
+        self.client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                ),
+            headers=headers,
+            )
+
+    @property
+    def headers(self):
+        return self.client.headers
+
+    @staticmethod
+    def _create_timeout(timeout):
+        """Returns `httpx.Timeout` from a timeout of `requests`.
+
+        """
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def get(self, url: str, params: dict = None, timeout=None, **kwargs):
+        """Sends a GET request and returns the `httpx.Response`.
+
+        The response has `status_code`, `content`, `headers` and `json()`
+        like `requests.Response`.
+        """
+        try:
+            return self.client.get(
+                url,
+                params=params,
+                timeout=self._create_timeout(timeout),
+                **kwargs,
+                )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+
+    def close(self) -> None:
+        self.client.close()
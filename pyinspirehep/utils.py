@@ -63,6 +63,12 @@ def convert_json_timestamp(
     if timestamp_str is None:
         return None
     if formats is None:
+        # Inspirehep timestamps are ISO 8601 strings, parsing them with
+        # `fromisoformat` is much faster than trying formats one by one.
+        try:
+            return datetime.datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            pass
         formats = [
             '%Y-%m-%dT%H:%M:%S%z',
             '%Y-%m-%dT%H:%M:%S.%f%z',
@@ -83,11 +89,21 @@ def convert_json_timestamp(
 
 
 def convert_to_date(date_str: str, formats: list = None):
+    """Converts a date string to `datetime.date`.
+
+    Dates of Inspirehep may be partial, e.g. '1975' or '2019-01', and
+    are converted to the first day of their year or month.
+
+    >>> convert_to_date('2019-01')
+    datetime.date(2019, 1, 1)
+    """
     if date_str is None:
         return None
     if formats is None:
         formats = [
             '%Y-%m-%d',
+            '%Y-%m',
+            '%Y',
             ]
     for format in formats:
         try:
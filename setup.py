@@ -15,6 +15,15 @@ setup(
     packages=find_packages(include=["pyinspirehep", "pyinspirehep.*"]),
     version="1.1.1",
     install_requires=['requests'],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'zstd': ['zstandard'],
+        'graph': ['scipy'],
+        'arrow': ['pyarrow'],
+    },
+    entry_points={
+        'console_scripts': ['pyinspirehep = pyinspirehep.cli:main'],
+    },
     python_requires='>=3.7',
     license='MIT',
     url='https://github.com/javadebadi/pyinspirehep',
@@ -0,0 +1,66 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+
+directory = Path(__file__).parent
+with open(os.path.join(directory, 'literature.json'), 'r') as f:
+    METADATA_SAMPLE = json.load(f)
+
+
+def fake_response(status_code=200, data=None, content=b'{}', headers=None):
+    """Returns a mock of a response of `requests`.
+
+    If `data` is an exception it is raised by `json()`.
+    """
+    response = MagicMock()
+    response.status_code = status_code
+    if isinstance(data, Exception):
+        response.json.side_effect = data
+    else:
+        response.json.return_value = data if data is not None else {}
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+def write_clone(directory, files):
+    """Writes json files of records with the given metadata like a clone.
+
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name, records in files.items():
+        with open(os.path.join(directory, name), 'w') as f:
+            json.dump([{'metadata': metadata} for metadata in records], f)
+
+
+def run(*argv):
+    """Runs the command line and returns its code, stdout and stderr.
+
+    """
+    # Imported here, so the tests which only need the other helpers do
+    # not import the command line and its dependencies.
+    from pyinspirehep.cli import main
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        code = main([str(arg) for arg in argv])
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+class TemporaryDirectoryTestCase(TestCase):
+    """Test case with a temporary directory `self.tmp` for each test.
+
+    """
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+        return super().tearDown()
@@ -1,6 +1,6 @@
 import datetime
 from unittest import TestCase
-from pyinspirehep.author import Author, AuthorMetadata
+from pyinspirehep.author import Author, AuthorMetadata, get_authors_ids
 
 
 class AuthorTest(TestCase):
@@ -184,6 +184,19 @@ class AuthorTest(TestCase):
             ['906446', '904894'],
         )
 
+    def test_getters_return_copies(self):
+        self.author.get_institutions().append('Changed')
+        self.author.get_institutions_ids().clear()
+        self.author.get_project_memberships().append('Changed')
+        self.author.get_project_memberships_ids().clear()
+        self.assertEqual(
+            self.author.get_institutions(),
+            ['IPM, Tehran', 'Sharif U. of Tech.'],
+        )
+        self.assertEqual(self.author.get_institutions_ids(), ['906446', '904894'])
+        self.assertEqual(self.author.get_project_memberships(), ['CERN-LHC-cMS'])
+        self.assertEqual(self.author.get_project_memberships_ids(), ['1108642'])
+
     def test_get_positions(self):
         self.assertEqual(
             self.author.get_positions(),
@@ -205,5 +218,20 @@ class AuthorTest(TestCase):
             ]
         )
 
-        
-        
+    def test_get_id_by_schema(self):
+        self.assertEqual(
+            self.author.get_id_by_schema('inspire bai'),
+            'J.Ebadi.1',
+        )
+        self.assertIsNone(self.author.get_id_by_schema('WIKIPEDIA'))
+
+    def test_get_authors_ids(self):
+        other = Author(id=1, metadata=AuthorMetadata(control_number=1))
+        self.assertEqual(
+            get_authors_ids([self.author, other], schemas=['ORCID', 'CERN']),
+            {
+                'control_number': [1679997, 1],
+                'ORCID': ['0000-0002-4600-8310', None],
+                'CERN': ['CERN-838837', None],
+            },
+        )
@@ -0,0 +1,153 @@
+import re
+from unittest import TestCase
+from pyinspirehep.client import Client
+from pyinspirehep.contrib.author_metrics import (
+    AuthorMetricsCollector,
+    h_index,
+)
+
+
+PAPERS = [
+    {'control_number': 1, 'citation_count': 10,
+     'citation_count_without_self_citations': 8,
+     'authors': [{'bai': 'J.Ebadi.1'}, {'bai': 'S.Khatibi.1'}]},
+    {'control_number': 2, 'citation_count': 3,
+     'citation_count_without_self_citations': 3,
+     'authors': [{'bai': 'J.Ebadi.1'}]},
+    {'control_number': 3, 'citation_count': 1,
+     'citation_count_without_self_citations': 0,
+     'authors': [{'bai': 'S.Khatibi.1'}]},
+    ]
+
+
+class FakeClient(Client):
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def search_literature(self, *args, sorting=None, size=1, page=1, q=None):
+        self.calls.append((args, size, page, q))
+        hits = PAPERS[(page - 1) * size:page * size]
+        return {
+            'hits': {
+                'total': len(PAPERS),
+                'hits': [{'metadata': paper} for paper in hits],
+                },
+            }
+
+
+class QueryClient(Client):
+    """Fake client which filters papers by the authors and dates of queries.
+
+    """
+
+    PAGINATION_LIMIT = 4
+
+    def __init__(self, papers) -> None:
+        self.papers = papers
+        self.queries = []
+
+    def search_literature(self, *args, sorting=None, size=1, page=1, q=None):
+        q = str(q)
+        self.queries.append(q)
+        bais = set(re.findall(r'a (\S+?)\)?(?: |$)', q))
+        dates = re.search(r'de:(\S+)->(\S+)', q)
+        papers = [
+            paper for paper in self.papers
+            if bais.intersection(author['bai'] for author in paper['authors'])
+            and (
+                dates is None
+                or 'date' in paper
+                and dates.group(1) <= paper['date'] <= dates.group(2)
+            )
+            ]
+        return {
+            'hits': {
+                'total': len(papers),
+                'hits': [
+                    {'metadata': paper}
+                    for paper in papers[(page - 1) * size:page * size]
+                    ],
+                },
+            }
+
+
+def paper(citations, *bais, date='2020-01-01'):
+    metadata = {
+        'citation_count': citations,
+        'citation_count_without_self_citations': citations,
+        'authors': [{'bai': bai} for bai in bais],
+        }
+    if date is not None:
+        metadata['date'] = date
+    return metadata
+
+
+class AuthorMetricsCollectorTest(TestCase):
+
+    def test_h_index(self):
+        self.assertEqual(h_index([10, 8, 5, 4, 3]), 4)
+        self.assertEqual(h_index([25, 8, 5, 3, 3]), 3)
+        self.assertEqual(h_index([0, 0]), 0)
+
+    def test_collect(self):
+        client = FakeClient()
+        collector = AuthorMetricsCollector(client, batch_size=10, page_size=2)
+        metrics = collector.collect(['J.Ebadi.1', 'S.Khatibi.1'])
+        self.assertEqual(len(client.calls), 2)
+        self.assertEqual(client.calls[0][0], AuthorMetricsCollector.FIELDS)
+        self.assertEqual(client.calls[0][3], 'a J.Ebadi.1 or a S.Khatibi.1')
+        self.assertEqual(metrics['J.Ebadi.1'].paper_count, 2)
+        self.assertEqual(metrics['J.Ebadi.1'].citation_count, 13)
+        self.assertEqual(
+            metrics['J.Ebadi.1'].citation_count_without_self_citations,
+            11,
+        )
+        self.assertEqual(metrics['J.Ebadi.1'].h_index, 2)
+        self.assertEqual(metrics['S.Khatibi.1'].citation_count, 11)
+        self.assertEqual(metrics['S.Khatibi.1'].h_index, 1)
+
+    def test_split_batch(self):
+        papers = (
+            [paper(1, 'A.1')] * 3
+            + [paper(2, 'B.1')] * 2
+            + [paper(5, 'A.1', 'B.1', 'C.1')]
+            + [paper(3, 'C.1')]
+            )
+        client = QueryClient(papers)
+        collector = AuthorMetricsCollector(client, batch_size=3, page_size=2)
+        metrics = collector.collect(['A.1', 'B.1', 'C.1'])
+        self.assertEqual(metrics['A.1'].paper_count, 4)
+        self.assertEqual(metrics['B.1'].paper_count, 3)
+        self.assertEqual(metrics['C.1'].citation_count, 8)
+        self.assertEqual(collector.unmatched, 0)
+
+    def test_split_dates(self):
+        papers = [
+            paper(i, 'A.1', date=f"{2000 + i}-06-01")
+            for i in range(9)
+            ]
+        client = QueryClient(papers)
+        collector = AuthorMetricsCollector(client, page_size=2)
+        metrics = collector.collect(['A.1'])
+        self.assertEqual(metrics['A.1'].paper_count, 9)
+        self.assertEqual(metrics['A.1'].citation_count, sum(range(9)))
+        self.assertTrue(any('de:' in query for query in client.queries))
+
+    def test_papers_without_date(self):
+        papers = [paper(1, 'A.1')] * 3 + [paper(1, 'A.1', date=None)] * 2
+        collector = AuthorMetricsCollector(QueryClient(papers), page_size=2)
+        with self.assertLogs(level='WARNING') as logs:
+            metrics = collector.collect(['A.1'])
+        self.assertEqual(metrics['A.1'].paper_count, 3)
+        self.assertIn('2 of 5 papers', logs.output[0])
+
+    def test_unmatched(self):
+        client = QueryClient([])
+        client.search_literature = lambda *args, **kwargs: {
+            'hits': {'total': 1, 'hits': [{'metadata': paper(7, 'X.1')}]},
+            }
+        collector = AuthorMetricsCollector(client)
+        metrics = collector.collect(['A.1'])
+        self.assertEqual(metrics['A.1'].paper_count, 0)
+        self.assertEqual(collector.unmatched, 1)
@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from pyinspirehep.author import Author
+from pyinspirehep.contrib.authors import (
+    AuthorIndex,
+    initials_key,
+    name_key,
+)
+
+
+def author_record(control_number, name, orcid=None, bai=None, **name_fields):
+    ids = []
+    if orcid:
+        ids.append({'schema': 'ORCID', 'value': orcid})
+    if bai:
+        ids.append({'schema': 'INSPIRE BAI', 'value': bai})
+    return {
+        'id': str(control_number),
+        'metadata': {
+            'control_number': control_number,
+            'name': dict(value=name, **name_fields),
+            'ids': ids,
+            },
+        }
+
+
+RECORDS = [
+    author_record(
+        1010819, 'Ellis, John', orcid='0000-0002-7399-0813',
+        bai='J.R.Ellis.1', preferred_name='John Ellis',
+        ),
+    author_record(1000001, 'Ellis, Jonathan', bai='J.Ellis.2'),
+    author_record(
+        1000002, 'Zhang, Wei', native_names=['张伟'], name_variants=['Zhang, W.'],
+        ),
+    author_record(1000003, 'Müller, Jörg'),
+    ]
+
+
+class AuthorIndexTest(TestCase):
+
+    def setUp(self) -> None:
+        self.index = AuthorIndex()
+        self.index.add_authors(Author.from_response(record) for record in RECORDS)
+        return super().setUp()
+
+    def test_keys(self):
+        self.assertEqual(name_key('Müller, Jörg'), name_key('jorg MULLER'))
+        self.assertEqual(initials_key('Ellis, J.R.'), 'ellis j')
+        self.assertIsNone(initials_key('Ellis'))
+
+    def test_ids(self):
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.get_by_orcid('0000-0002-7399-0813'), 1010819)
+        self.assertEqual(self.index.get_by_bai('j.r.ellis.1'), 1010819)
+        self.assertIsNone(self.index.get_by_orcid('0000-0000-0000-0000'))
+
+    def test_names(self):
+        self.assertEqual(self.index.get_by_name('John Ellis'), [1010819])
+        self.assertEqual(self.index.get_by_name('Ellis, Jonathan'), [1000001])
+        self.assertEqual(sorted(self.index.get_by_name('Ellis, J.')), [1000001, 1010819])
+        self.assertEqual(self.index.get_by_name('Ellis, J.', initials=False), [])
+        self.assertEqual(self.index.get_by_name('Muller, Jorg'), [1000003])
+        self.assertEqual(self.index.get_by_name('张伟'), [1000002])
+        self.assertEqual(self.index.get_by_name('W. Zhang'), [1000002])
+
+    def test_resolve(self):
+        self.assertEqual(
+            self.index.resolve_many([
+                '0000-0002-7399-0813', 'J.Ellis.2', 'Zhang, Wei', 'Nobody, A.',
+                ]),
+            {
+                '0000-0002-7399-0813': [1010819],
+                'J.Ellis.2': [1000001],
+                'Zhang, Wei': [1000002],
+                'Nobody, A.': [],
+                },
+            )
+
+    def test_resolve_literature_authors(self):
+        authors = [
+            {'full_name': 'Doe, J.', 'record': {'$ref': 'https://inspirehep.net/api/authors/7'}},
+            {'full_name': 'Ellis, J.', 'ids': [{'schema': 'INSPIRE BAI', 'value': 'J.R.Ellis.1'}]},
+            {'full_name': 'Zhang, W.'},
+            {'full_name': 'Ellis, J.'},
+            ]
+        self.assertEqual(
+            self.index.resolve_literature_authors(authors),
+            [7, 1010819, 1000002, None],
+            )
+
+    def test_resolve_malformed_ref(self):
+        authors = [
+            {'full_name': 'Doe, J.', 'record': {'$ref': 'https://inspirehep.net/api/authors/'}},
+            {'full_name': 'Roe, R.', 'record': {'$ref': 'not a reference'}},
+            {'full_name': 'Doe, J.', 'record': {'$ref': 'https://inspirehep.net/api/authors/7'}},
+            ]
+        self.assertEqual(
+            self.index.resolve_literature_authors(authors),
+            [None, None, 7],
+            )
+
+    def test_from_clone(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, '10.json'), 'w') as f:
+                json.dump(RECORDS, f)
+            index = AuthorIndex.from_clone(directory, processes=1)
+        self.assertEqual(index.names, self.index.names)
+        self.assertEqual(index.bais, self.index.bais)
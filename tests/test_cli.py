@@ -0,0 +1,114 @@
+import datetime
+import io
+import json
+import os
+from benchmarks.mock_server import (
+    MockInspireServer,
+    default_payloads,
+)
+from pyinspirehep.cli import (
+    STATE_FILENAME,
+    ThroughputMonitor,
+)
+from pyinspirehep.client import Client
+from pyinspirehep.compression import load_json_file
+from tests.helpers import (
+    TemporaryDirectoryTestCase,
+    run,
+)
+
+
+class CliTest(TemporaryDirectoryTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = os.path.join(self.tmp.name, 'literature')
+
+    def clone(self, server, *argv):
+        return run(
+            'clone', self.directory, '--max', 25, '--page-size', 5,
+            '--batch', 10, '--concurrency', 3, '--api-url', server.url,
+            '--interval', 0.05, *argv,
+            )
+
+    def test_clone_and_resume(self):
+        with MockInspireServer() as server:
+            code, _, stderr = self.clone(server, '--compression', 'gzip')
+            self.assertEqual(code, 0)
+            self.assertIn('total: 25 records', stderr)
+            self.assertEqual(
+                sorted(os.listdir(self.directory)),
+                [STATE_FILENAME, '10.json.gz', '20.json.gz', '25.json.gz'],
+                )
+            records = load_json_file(os.path.join(self.directory, '20.json.gz'))
+            self.assertEqual(
+                [record['metadata']['control_number'] for record in records],
+                list(range(10, 20)),
+                )
+            os.remove(os.path.join(self.directory, '20.json.gz'))
+            requests = server.requests
+            code, stdout, stderr = self.clone(server, '--resume', '--compression', 'gzip')
+            self.assertEqual(server.requests - requests, 2)
+            self.assertIn('Skipping saved json file number = 10', stdout)
+            self.assertIn('total: 10 records', stderr)
+
+    def test_resume_further(self):
+        with MockInspireServer() as server:
+            self.clone(server, '--quiet')
+            code, _, _ = run(
+                'clone', self.directory, '--max', 35, '--page-size', 5,
+                '--batch', 10, '--api-url', server.url, '--resume', '--quiet',
+                )
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            sorted([STATE_FILENAME, '10.json', '20.json', '30.json', '35.json']),
+            )
+        records = load_json_file(os.path.join(self.directory, '30.json'))
+        self.assertEqual(
+            [record['metadata']['control_number'] for record in records],
+            list(range(20, 30)),
+            )
+
+    def test_sync(self):
+        with MockInspireServer() as server:
+            self.clone(server, '--quiet')
+        payloads = default_payloads()
+        payloads['literature'] = dict(payloads['literature'], titles=[{'title': 'New'}])
+        with MockInspireServer(payloads=payloads, updated=[3, 12, 500]) as server:
+            code, _, stderr = run(
+                'sync', self.directory, '-q', '--api-url', server.url,
+                '--since', '2020-01-01', '--step-days', 100000,
+                )
+        self.assertEqual(code, 0)
+        records = load_json_file(os.path.join(self.directory, '10.json'))
+        titles = {
+            record['metadata']['control_number']: record['metadata']['titles'][0]['title']
+            for record in records
+            }
+        self.assertEqual(titles[3], 'New')
+        self.assertNotEqual(titles[4], 'New')
+        self.assertEqual(len(records), 10)
+        with open(os.path.join(self.directory, STATE_FILENAME)) as f:
+            state = json.load(f)
+        self.assertEqual(state['last_sync'], datetime.date.today().isoformat())
+        self.assertEqual(state['page_size'], 5)
+
+    def test_lookup(self):
+        with MockInspireServer() as server:
+            code, stdout, _ = run(
+                'lookup', '1', '2', 'x', '-q', '--api-url', server.url,
+                '--fields', 'titles',
+                )
+        self.assertEqual(code, 1)
+        lines = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual(sorted(line['id'] for line in lines), ['1', '2'])
+
+    def test_throughput_monitor(self):
+        client = Client()
+        stream = io.StringIO()
+        with ThroughputMonitor(client, lambda: 10, interval=10, stream=stream):
+            self.assertEqual(len(client.observers), 1)
+        self.assertEqual(client.observers, [])
+        self.assertIn('10 records', stream.getvalue())
+        self.assertIn('0 429s', stream.getvalue())
@@ -0,0 +1,253 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+import requests
+from pyinspirehep.client import Client
+from pyinspirehep.exception import (
+    InspirehepCircuitOpenError,
+    InspirehepConnectionError,
+    InspirehepPIDDoesNotExistError,
+    InspirehepResponseDecodeError,
+    InspirehepServerError,
+    InspirehepTimeoutError,
+    InspirehepTooManyRequestsError,
+    InspirehepUnexpectedStatusError,
+)
+from pyinspirehep.limiter import RateLimiter
+from pyinspirehep.retry import (
+    CircuitBreaker,
+    RetryPolicy,
+)
+from tests.helpers import fake_response
+
+
+def fake_get(url, *args, **kwargs):
+    identifier = url.rstrip("/").split("/")[-1]
+    if identifier.startswith("missing"):
+        return fake_response(404, {'message': 'PID does not exist'})
+    return fake_response(200, {'id': identifier})
+
+
+class ClientMapTest(TestCase):
+
+    @patch('requests.Session.get', side_effect=fake_get)
+    def test_map(self, get):
+        client = Client()
+        not_found = []
+        ids = ['1', 'missing-1', '2', '3', 'missing-2'] + [str(i) for i in range(4, 40)]
+        results = dict(client.map(
+            client.get_literature,
+            ids,
+            max_workers=4,
+            not_found=not_found,
+            ))
+        self.assertEqual(len(results), 39)
+        self.assertEqual(results['2'], {'id': '2'})
+        self.assertEqual(sorted(not_found), ['missing-1', 'missing-2'])
+
+    @patch('requests.Session.get', side_effect=fake_get)
+    def test_map_method_name(self, get):
+        client = Client()
+        results = dict(client.map('get_author', ['1', '2']))
+        self.assertEqual(results, {'1': {'id': '1'}, '2': {'id': '2'}})
+
+    @patch('requests.Session.get', side_effect=fake_get)
+    def test_record_fields(self, get):
+        client = Client()
+        client.get_literature('1', 'titles', 'citation_count')
+        self.assertEqual(
+            get.call_args.kwargs['params'],
+            {'fields': 'titles,citation_count'},
+            )
+        client.get_literature('1')
+        self.assertNotIn('params', get.call_args.kwargs)
+
+    def test_shared_session_from_threads(self):
+        client = Client(max_connections=4)
+        sessions = set()
+
+        def use_client():
+            sessions.add(id(client.session))
+
+        threads = [threading.Thread(target=use_client) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(sessions), 1)
+        adapter = client.session.get_adapter('https://inspirehep.net/api/')
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+
+class RateLimiterTest(TestCase):
+
+    def test_acquire_waits(self):
+        limiter = RateLimiter(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_try_acquire(self):
+        limiter = RateLimiter(rate=0.001, burst=2)
+        self.assertTrue(limiter.try_acquire())
+        self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+
+
+class ClientErrorsTest(TestCase):
+
+    def assert_raises_for(self, error_class, response=None, side_effect=None):
+        client = Client()
+        with patch.object(client.session, 'get') as get:
+            get.return_value = response
+            get.side_effect = side_effect
+            with self.assertRaises(error_class) as context:
+                client.get_literature('1')
+        self.assertEqual(get.call_args.kwargs['timeout'], Client.DEFAULT_TIMEOUT)
+        return context.exception
+
+    def test_not_found(self):
+        error = self.assert_raises_for(
+            InspirehepPIDDoesNotExistError,
+            fake_response(404, {'message': 'PID does not exist'}),
+            )
+        self.assertEqual(str(error), 'PID does not exist')
+
+    def test_too_many_requests(self):
+        error = self.assert_raises_for(
+            InspirehepTooManyRequestsError,
+            fake_response(429, ValueError(), headers={'Retry-After': '3'}),
+            )
+        self.assertEqual(error.retry_after, 3.0)
+
+    def test_server_error_with_html(self):
+        error = self.assert_raises_for(
+            InspirehepServerError,
+            fake_response(502, ValueError('Expecting value')),
+            )
+        self.assertEqual(error.status_code, 502)
+
+    def test_decode_error(self):
+        self.assert_raises_for(
+            InspirehepResponseDecodeError,
+            fake_response(200, ValueError('Expecting value')),
+            )
+
+    def test_unexpected_status(self):
+        self.assert_raises_for(
+            InspirehepUnexpectedStatusError,
+            fake_response(400, {'message': 'Bad query'}),
+            )
+
+    def test_timeout(self):
+        self.assert_raises_for(
+            InspirehepTimeoutError,
+            side_effect=requests.exceptions.ReadTimeout('read timed out'),
+            )
+
+    def test_connection_error(self):
+        error = self.assert_raises_for(
+            InspirehepConnectionError,
+            side_effect=requests.exceptions.ConnectionError('reset'),
+            )
+        self.assertNotIsInstance(error, InspirehepTooManyRequestsError)
+
+    def test_retry_policies(self):
+        client = Client(retry_policies={
+            InspirehepServerError: RetryPolicy(max_retries=2, backoff=0),
+            })
+        with patch.object(client.session, 'get') as get:
+            get.side_effect = [
+                fake_response(503, ValueError()),
+                fake_response(503, ValueError()),
+                fake_response(200, {'id': '1'}),
+                ]
+            self.assertEqual(client.get_literature('1'), {'id': '1'})
+            self.assertEqual(get.call_count, 3)
+            get.side_effect = [fake_response(404, {})]
+            with self.assertRaises(InspirehepPIDDoesNotExistError):
+                client.get_literature('2')
+            self.assertEqual(get.call_count, 4)
+
+    def test_circuit_breaker(self):
+        client = Client(
+            circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_time=0.05),
+            )
+        with patch.object(client.session, 'get') as get:
+            get.return_value = fake_response(500, ValueError())
+            for _ in range(2):
+                with self.assertRaises(InspirehepServerError):
+                    client.get_literature('1')
+            with self.assertRaises(InspirehepCircuitOpenError):
+                client.get_literature('1')
+            self.assertEqual(get.call_count, 2)
+            time.sleep(0.06)
+            get.return_value = fake_response(200, {'id': '1'})
+            self.assertEqual(client.get_literature('1'), {'id': '1'})
+            self.assertFalse(client.circuit_breaker.is_open)
+
+    def test_circuit_breaker_unexpected_error_in_trial(self):
+        client = Client(
+            circuit_breaker=CircuitBreaker(failure_threshold=1, recovery_time=0.05),
+            )
+        with patch.object(client.session, 'get') as get:
+            get.return_value = fake_response(500, ValueError())
+            with self.assertRaises(InspirehepServerError):
+                client.get_literature('1')
+            time.sleep(0.06)
+            get.side_effect = RuntimeError('unexpected')
+            with self.assertRaises(RuntimeError):
+                client.get_literature('1')
+            self.assertTrue(client.circuit_breaker.is_open)
+            get.side_effect = None
+            get.return_value = fake_response(200, {'id': '1'})
+            self.assertEqual(client.get_literature('1'), {'id': '1'})
+            self.assertFalse(client.circuit_breaker.is_open)
+
+
+class ClientCoalesceTest(TestCase):
+
+    def test_coalesce_requests(self):
+        client = Client(coalesce_requests=True)
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_get(url, *args, **kwargs):
+            started.set()
+            release.wait(1)
+            return fake_response(200, {'id': url.split('/')[-1]})
+
+        with patch.object(client.session, 'get', side_effect=slow_get) as get:
+            results = []
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(client.get_literature('1')),
+                    )
+                for _ in range(5)
+                ]
+            threads[0].start()
+            started.wait(1)
+            for thread in threads[1:]:
+                thread.start()
+            while client.single_flight.coalesced < 4:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(get.call_count, 1)
+            self.assertEqual(results, [{'id': '1'}] * 5)
+            client.get_literature('2')
+            self.assertEqual(get.call_count, 2)
+
+    def test_coalesced_error(self):
+        client = Client(coalesce_requests=True)
+        with patch.object(client.session, 'get') as get:
+            get.return_value = fake_response(404, {'message': 'missing'})
+            with self.assertRaises(InspirehepPIDDoesNotExistError):
+                client.get_literature('1')
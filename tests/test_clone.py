@@ -0,0 +1,71 @@
+import datetime
+import re
+from pyinspirehep.client import Client
+from pyinspirehep.contrib.clone import LiteratureClone
+from tests.helpers import TemporaryDirectoryTestCase
+
+
+class UpdatedClient(Client):
+    """Fake client which finds the records updated in the dates of queries.
+
+    """
+
+    PAGINATION_LIMIT = 4
+    MAX_RECORDS_PER_PAGE = 2
+    MAX_PAGES = 2
+
+    def __init__(self, updated) -> None:
+        super().__init__()
+        self.updated = updated
+        self.queries = []
+
+    def search_literature(self, *args, sorting=None, size=1, page=1, q=None):
+        q = str(q)
+        self.queries.append(q)
+        start, end = re.search(r'du:(\S+)->(\S+)', q).groups()
+        found = [
+            control_number
+            for control_number, date in sorted(self.updated.items())
+            if start <= date <= end
+            ]
+        return {
+            'hits': {
+                'total': len(found),
+                'hits': [
+                    {'metadata': {'control_number': control_number}}
+                    for control_number in found[(page - 1) * size:page * size]
+                    ],
+                },
+            }
+
+
+class LiteratureCloneTest(TemporaryDirectoryTestCase):
+
+    def test_fields_with_control_number(self):
+        cloner = LiteratureClone(self.tmp.name, fields=['titles'])
+        self.assertEqual(cloner.fields, ['titles', 'control_number'])
+        cloner = LiteratureClone(self.tmp.name)
+        self.assertEqual(cloner.fields, [])
+
+    def test_split_updated_dates(self):
+        updated = {i: f"2020-01-{i:02d}" for i in range(1, 10)}
+        client = UpdatedClient(updated)
+        cloner = LiteratureClone(self.tmp.name, client=client, verbose=0)
+        control_numbers = cloner._get_updated_control_numbers(
+            datetime.date(2020, 1, 1),
+            datetime.date(2020, 1, 31),
+            step_days=31,
+            )
+        self.assertEqual(sorted(control_numbers), list(range(1, 10)))
+        self.assertGreater(len(client.queries), 1)
+
+    def test_too_many_updates_in_a_day(self):
+        client = UpdatedClient({i: "2020-01-01" for i in range(6)})
+        cloner = LiteratureClone(self.tmp.name, client=client, verbose=0)
+        with self.assertLogs(level='WARNING') as logs:
+            control_numbers = cloner._get_updated_control_numbers(
+                datetime.date(2020, 1, 1),
+                datetime.date(2020, 1, 1),
+                )
+        self.assertEqual(len(control_numbers), 4)
+        self.assertIn('2020-01-01', logs.output[0])
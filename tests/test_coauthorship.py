@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+from collections import Counter
+from unittest import (
+    TestCase,
+    skipIf,
+)
+from pyinspirehep.contrib.coauthorship import CoauthorshipGraph
+from tests.helpers import METADATA_SAMPLE
+
+try:
+    import scipy
+except ImportError:
+    scipy = None
+
+
+def edges(graph, symmetric=False):
+    rows, cols, data = graph.to_coo(symmetric=symmetric)
+    weights = Counter()
+    for row, col, weight in zip(rows, cols, data):
+        weights[graph.author_ids[row], graph.author_ids[col]] += weight
+    return dict(weights)
+
+
+class CoauthorshipGraphTest(TestCase):
+
+    def test_add_paper(self):
+        graph = CoauthorshipGraph()
+        graph.add_papers([[1, 2, 3], [2, 1, 2], [4]])
+        self.assertEqual(len(graph), 4)
+        self.assertEqual(graph.papers, 2)
+        self.assertEqual(edges(graph), {(1, 2): 2.0, (1, 3): 1.0, (2, 3): 1.0})
+        self.assertEqual(len(edges(graph, symmetric=True)), 6)
+
+    def test_fractional(self):
+        graph = CoauthorshipGraph(fractional=True)
+        graph.add_papers([[1, 2, 3], [1, 2]])
+        self.assertEqual(edges(graph)[1, 2], 1.5)
+
+    def test_large_papers_and_spill(self):
+        papers = [list(range(10)), [0, 1], list(range(5, 15))]
+        expected = edges(self.build(papers))
+        graph = self.build(papers, max_pair_authors=3, max_pending_edges=1)
+        self.assertEqual(len(graph._pending), 0)
+        self.assertEqual(len(graph._group_weights), 2)
+        self.assertEqual(edges(graph), expected)
+        self.assertEqual(expected[5, 9], 2.0)
+
+    @skipIf(scipy is None, "scipy is not installed")
+    def test_compact_spilled_edges(self):
+        papers = [[1, 2], [1, 2], [2, 3]] * 20
+        graph = self.build(papers, max_pending_edges=1)
+        self.assertLessEqual(len(graph._data), 4)
+        self.assertEqual(edges(graph), edges(self.build(papers)))
+        self.assertEqual(edges(graph)[1, 2], 40.0)
+
+    def build(self, papers, **kwargs):
+        graph = CoauthorshipGraph(**kwargs)
+        graph.add_papers(papers)
+        return graph
+
+    def test_from_clone(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, '1000.json'), 'w') as f:
+                json.dump([{'metadata': METADATA_SAMPLE}], f)
+            graph = CoauthorshipGraph.from_clone(directory, processes=1)
+        self.assertEqual(graph.papers, 1)
+        self.assertIn(1679997, graph.index)
+        self.assertIn((1221954, 1679997), edges(graph, symmetric=True))
+
+    @skipIf(scipy is None, "scipy is not installed")
+    def test_to_scipy(self):
+        graph = self.build(
+            [list(range(10)), [0, 1], list(range(5, 15))],
+            max_pair_authors=3,
+            )
+        matrix = graph.to_scipy()
+        self.assertEqual(matrix.shape, (15, 15))
+        self.assertEqual(matrix[0, 1], 2.0)
+        self.assertEqual(matrix[1, 0], 2.0)
+        self.assertEqual(matrix[5, 9], 2.0)
+        self.assertEqual(matrix[3, 3], 0.0)
+        self.assertEqual(matrix.nnz, 2 * len(edges(graph)))
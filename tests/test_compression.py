@@ -0,0 +1,98 @@
+import json
+import os
+from unittest import skipUnless
+from unittest.mock import patch
+from pyinspirehep.cache import ResponseCache
+from pyinspirehep.client import Client
+from pyinspirehep.compression import (
+    GzipCodec,
+    ZstdCodec,
+    dump_json_file,
+    load_json_file,
+    train_dictionary,
+    zstandard,
+)
+from pyinspirehep.contrib.clone import LiteratureClone
+from pyinspirehep.contrib.loader import CloneLoader
+from pyinspirehep.instrumentation import MetricsCollector
+from tests.helpers import (
+    METADATA_SAMPLE,
+    TemporaryDirectoryTestCase,
+    fake_response,
+)
+
+
+class CompressionTest(TemporaryDirectoryTestCase):
+
+    def test_accept_encoding(self):
+        client = Client()
+        self.assertIn('gzip', client.session.headers['Accept-Encoding'])
+
+    def test_dump_and_load_gzip(self):
+        path = dump_json_file(
+            [METADATA_SAMPLE],
+            os.path.join(self.tmp.name, '500.json'),
+            GzipCodec(),
+            )
+        self.assertTrue(path.endswith('500.json.gz'))
+        self.assertLess(os.path.getsize(path), len(json.dumps(METADATA_SAMPLE)))
+        self.assertEqual(load_json_file(path), [METADATA_SAMPLE])
+
+    @skipUnless(zstandard is not None, "zstandard is not installed")
+    def test_clone_with_zstd_dictionary(self):
+        samples = [
+            dict(METADATA_SAMPLE, control_number=i, citation_count=i)
+            for i in range(200)
+            ]
+        dictionary = train_dictionary(samples, size=4096)
+        cloner = LiteratureClone(
+            self.tmp.name,
+            verbose=0,
+            compression='zstd',
+            dictionary=dictionary,
+            )
+        cloner.collection = [{'id': '1', 'metadata': METADATA_SAMPLE}]
+        cloner.save('500.json')
+        loader = CloneLoader(self.tmp.name, processes=1)
+        self.assertEqual(
+            [os.path.basename(path) for path in loader.files()],
+            ['500.json.zst'],
+        )
+        records = next(loader.iter_records())
+        self.assertEqual(records[0].get_citation_count(), 26)
+        codec = ZstdCodec(dictionary)
+        self.assertEqual(codec.decompress(codec.compress(b'{}')), b'{}')
+
+    @patch('requests.Session.get')
+    def test_response_cache(self, get):
+        get.return_value = fake_response(200, {'id': '1'})
+        metrics = MetricsCollector()
+        client = Client(cache=ResponseCache(self.tmp.name))
+        client.add_observer(metrics)
+        self.assertEqual(client.get_literature('1'), {'id': '1'})
+        self.assertEqual(client.get_literature('1'), {'id': '1'})
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(metrics.cache_hits, 1)
+        self.assertEqual(metrics.cache_hit_ratio, 0.5)
+        client = Client(cache=ResponseCache(self.tmp.name))
+        self.assertEqual(client.get_literature('1'), {'id': '1'})
+        self.assertEqual(get.call_count, 1)
+
+    def test_response_cache_max_age(self):
+        cache = ResponseCache(self.tmp.name, max_age=60)
+        key = cache.key('https://inspirehep.net/api/literature/1')
+        cache.set(key, {'id': '1'})
+        self.assertEqual(cache.get(key), {'id': '1'})
+        path = cache._path(key)
+        os.utime(path, (os.path.getatime(path), os.path.getmtime(path) - 120))
+        self.assertIsNone(cache.get(key))
+        self.assertNotIn(key, cache)
+        self.assertTrue(cache.delete(key))
+        self.assertFalse(cache.delete(key))
+
+    def test_atomic_write_failure(self):
+        path = os.path.join(self.tmp.name, '500.json')
+        with patch('os.replace', side_effect=OSError):
+            with self.assertRaises(OSError):
+                dump_json_file([], path)
+        self.assertEqual(os.listdir(self.tmp.name), [])
@@ -0,0 +1,150 @@
+import datetime
+from unittest import TestCase
+from pyinspirehep.data_models import (
+    LazyRecordList,
+    MetadataDecoder,
+    SearchResponse,
+    SingleRecordResponse,
+)
+from pyinspirehep.client import Client
+from pyinspirehep.institution import Institution
+from pyinspirehep.job import Job
+from pyinspirehep.literature import Literature
+from tests.helpers import METADATA_SAMPLE
+
+
+class MetadataDecoderTest(TestCase):
+
+    def setUp(self) -> None:
+        self.decoder = MetadataDecoder((
+            ("schema", "$schema", None, None),
+            ("control_number", "control_number", int, None),
+            ("citation_count", "citation_count", int, 0),
+        ))
+        return super().setUp()
+
+    def test_decode(self):
+        self.assertEqual(
+            self.decoder.decode({
+                "$schema": "literature.json",
+                "control_number": "12",
+                "citation_count": 3,
+                }),
+            {'schema': 'literature.json', 'control_number': 12, 'citation_count': 3},
+        )
+
+    def test_decode_defaults(self):
+        self.assertEqual(
+            self.decoder.decode({}),
+            {'schema': None, 'control_number': None, 'citation_count': 0},
+        )
+
+    def test_missing_bools_are_false(self):
+        metadata = Literature.METADATA_CLASS.from_dict({'control_number': 1})
+        self.assertIs(metadata.core, False)
+        self.assertIs(metadata.refereed, False)
+        institution = Institution.from_response({'id': '1', 'metadata': {}})
+        self.assertIs(institution.metadata.deleted, False)
+
+    def test_keys(self):
+        self.assertEqual(
+            self.decoder.keys,
+            ['$schema', 'control_number', 'citation_count'],
+        )
+
+
+class RecordModelsTest(TestCase):
+
+    def test_from_response_institution(self):
+        institution = Institution.from_response({
+            'id': '902725',
+            'created': '2019-05-10T10:48:20.123456+00:00',
+            'metadata': {
+                'control_number': 902725,
+                'legacy_ICN': 'CERN',
+                'ICN': ['CERN'],
+                'core': True,
+                'number_of_papers': 10,
+                },
+            })
+        self.assertEqual(institution.get_id(), '902725')
+        self.assertEqual(institution.get_name(), 'CERN')
+        self.assertEqual(institution.get_number_of_papers(), 10)
+        self.assertTrue(institution.metadata.core)
+        self.assertEqual(
+            institution.created,
+            datetime.datetime(
+                2019, 5, 10, 10, 48, 20, 123456,
+                tzinfo=datetime.timezone.utc,
+                ),
+        )
+
+    def test_from_response_job(self):
+        job = Job.from_response({
+            'id': '1800000',
+            'metadata': {
+                'control_number': 1800000,
+                'position': 'Postdoc',
+                'deadline_date': '2022-01-31',
+                'institutions': [{'value': 'IPM, Tehran'}],
+                },
+            })
+        self.assertEqual(job.get_position(), 'Postdoc')
+        self.assertEqual(job.get_institutions(), ['IPM, Tehran'])
+        self.assertEqual(job.metadata.deadline_date, datetime.date(2022, 1, 31))
+
+    def test_record_classes(self):
+        for identifier_type in Client.IDENTIFIER_TYPES:
+            record_class = Client.RECORD_CLASSES[identifier_type]
+            self.assertTrue(issubclass(record_class, SingleRecordResponse))
+            self.assertIsNotNone(record_class.METADATA_CLASS)
+
+    def test_single_record_response_keeps_metadata(self):
+        record = SingleRecordResponse.from_response(
+            {'id': '1', 'metadata': {'control_number': 1}},
+            )
+        self.assertEqual(record.metadata, {'control_number': 1})
+
+
+class SearchResponseTest(TestCase):
+
+    def setUp(self) -> None:
+        self.response = {
+            'hits': {
+                'total': 3,
+                'hits': [
+                    {'id': str(i), 'metadata': METADATA_SAMPLE}
+                    for i in range(3)
+                    ],
+                },
+            'links': {'self': 'https://inspirehep.net/api/literature'},
+            }
+        return super().setUp()
+
+    def test_from_response(self):
+        search = SearchResponse.from_response(
+            self.response,
+            record_class=Literature,
+            )
+        self.assertEqual(search.hits.total, 3)
+        self.assertEqual(len(search.hits), 3)
+        self.assertIsInstance(search.hits.hits[0], Literature)
+        self.assertEqual(search.hits.hits[2].get_citation_count(), 26)
+
+    def test_from_response_lazy(self):
+        search = SearchResponse.from_response(
+            self.response,
+            record_class=Literature,
+            lazy=True,
+            )
+        self.assertIsInstance(search.hits.hits, LazyRecordList)
+        self.assertEqual(search.hits.hits.decoded_count, 0)
+        self.assertEqual(search.hits.hits[1].id, '1')
+        self.assertEqual(search.hits.hits.decoded_count, 1)
+        self.assertEqual([hit.id for hit in search.hits], ['0', '1', '2'])
+        self.assertEqual(search.hits.hits.decoded_count, 3)
+
+    def test_from_response_empty(self):
+        search = SearchResponse.from_response({'links': {}})
+        self.assertEqual(search.hits.hits, [])
+        self.assertIsNone(search.hits.total)
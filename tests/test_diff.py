@@ -0,0 +1,103 @@
+import io
+import os
+from pathlib import Path
+from pyinspirehep.contrib.diff import (
+    ADDED,
+    CHANGED,
+    REMOVED,
+    Change,
+    CloneSnapshot,
+    diff_snapshots,
+    read_change_log,
+    record_hash,
+    write_change_log,
+)
+from tests.helpers import (
+    TemporaryDirectoryTestCase,
+    run,
+    write_clone,
+)
+
+
+class DiffTest(TemporaryDirectoryTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.old = os.path.join(self.tmp.name, 'old')
+        self.new = os.path.join(self.tmp.name, 'new')
+        write_clone(self.old, {
+            '10.json': [
+                {'control_number': 3, 'titles': ['a']},
+                {'control_number': 1, 'titles': ['b']},
+                {'control_number': 5, 'titles': ['c']},
+                ],
+            '20.json': [{'control_number': 12, 'titles': ['d']}],
+            })
+        write_clone(self.new, {
+            '10.json': [
+                {'titles': ['a'], 'control_number': 3},
+                {'control_number': 5, 'titles': ['C']},
+                {'control_number': 7, 'titles': ['e']},
+                ],
+            '20.json': [],
+            '30.json': [{'control_number': 25, 'titles': ['f']}],
+            })
+
+    def test_record_hash(self):
+        self.assertEqual(
+            record_hash({'a': 1, 'b': {'c': 2, 'd': 3}}),
+            record_hash({'b': {'d': 3, 'c': 2}, 'a': 1}),
+            )
+        self.assertNotEqual(record_hash({'a': 1}), record_hash({'a': 2}))
+
+    def test_iter_hashes(self):
+        hashes = list(CloneSnapshot(self.old, processes=1).iter_hashes())
+        self.assertEqual([cn for cn, _ in hashes], [1, 3, 5, 12])
+
+    def test_repeated_control_numbers(self):
+        write_clone(self.old, {
+            '20.json': [{'control_number': 10}, {'control_number': 12}],
+            '10.json': [
+                {'control_number': 1},
+                {'control_number': 10},
+                {'control_number': 10},
+                ],
+            })
+        hashes = list(CloneSnapshot(self.old, processes=1).iter_hashes())
+        self.assertEqual([cn for cn, _ in hashes], [1, 10, 12])
+        self.assertEqual(list(diff_snapshots(self.old, Path(self.old))), [])
+
+    def test_unordered_files(self):
+        write_clone(self.old, {'30.json': [{'control_number': 2}]})
+        with self.assertRaises(ValueError):
+            list(CloneSnapshot(self.old, processes=1).iter_hashes())
+
+    def test_diff(self):
+        changes = list(diff_snapshots(self.old, self.new))
+        self.assertEqual(
+            [(change.operation, change.control_number) for change in changes],
+            [(REMOVED, 1), (CHANGED, 5), (ADDED, 7), (REMOVED, 12), (ADDED, 25)],
+            )
+        self.assertEqual(
+            changes[1].hash,
+            record_hash({'metadata': {'control_number': 5, 'titles': ['C']}}),
+            )
+        self.assertIsNone(changes[0].hash)
+        self.assertEqual(list(diff_snapshots(self.new, self.new)), [])
+
+    def test_change_log(self):
+        changes = list(diff_snapshots(self.old, self.new))
+        for name in ('changes.tsv', 'changes.tsv.gz'):
+            path = os.path.join(self.tmp.name, name)
+            counts = write_change_log(changes, path)
+            self.assertEqual(counts, {ADDED: 2, CHANGED: 1, REMOVED: 2})
+            self.assertEqual(list(read_change_log(path)), changes)
+        stream = io.StringIO()
+        write_change_log([Change(REMOVED, 1), Change(ADDED, 2, 'ab')], stream)
+        self.assertEqual(stream.getvalue(), "D\t1\nA\t2\tab\n")
+
+    def test_cli(self):
+        code, stdout, stderr = run('diff', self.old, self.new, '--processes', 1)
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout.splitlines()[0], "D\t1")
+        self.assertIn("2 added, 1 changed, 2 removed", stderr)
@@ -0,0 +1,95 @@
+import datetime
+import json
+import os
+from unittest import skipIf
+from tests.helpers import (
+    METADATA_SAMPLE,
+    TemporaryDirectoryTestCase,
+)
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    from pyinspirehep.contrib.export import (
+        ArrowExporter,
+        arrow_schema,
+        records_to_table,
+    )
+except ImportError:
+    pyarrow = None
+
+
+@skipIf(pyarrow is None, "pyarrow is not installed")
+class ArrowExportTest(TemporaryDirectoryTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clone = os.path.join(self.tmp.name, 'clone')
+        os.makedirs(self.clone)
+        for number in (500, 1000):
+            collection = [
+                {'metadata': dict(METADATA_SAMPLE, control_number=i)}
+                for i in range(number - 2, number)
+                ]
+            with open(os.path.join(self.clone, f'{number}.json'), 'w') as f:
+                json.dump(collection, f)
+
+    def test_schema(self):
+        schema = arrow_schema()
+        self.assertEqual(schema.field('control_number').type, pyarrow.int64())
+        self.assertEqual(schema.field('earliest_date').type, pyarrow.date32())
+        self.assertEqual(
+            schema.field('texkeys').type,
+            pyarrow.list_(pyarrow.string()),
+            )
+        self.assertEqual(
+            schema.field('references').type.value_type.field('recid').type,
+            pyarrow.int64(),
+            )
+
+    def test_records_to_table(self):
+        table = records_to_table([{'metadata': METADATA_SAMPLE}, {'metadata': {}}])
+        row, empty = table.to_pylist()
+        self.assertEqual(row['control_number'], 1713040)
+        self.assertEqual(row['earliest_date'], datetime.date(2019, 1, 10))
+        self.assertEqual(row['authors'][0]['recid'], 1679997)
+        self.assertEqual(row['authors'][0]['affiliations'], ['IPM, Tehran'])
+        self.assertEqual(row['references'][0]['recid'], 3438)
+        self.assertEqual(
+            json.loads(row['first_author'][0])['recid'],
+            1679997,
+            )
+        self.assertIsNone(empty['references'])
+        self.assertEqual(empty['citation_count'], 0)
+
+    def test_partial_dates(self):
+        table = records_to_table([
+            {'metadata': dict(METADATA_SAMPLE, earliest_date='1975')},
+            {'metadata': dict(METADATA_SAMPLE, earliest_date='2019-01')},
+            ])
+        self.assertEqual(
+            table.column('earliest_date').to_pylist(),
+            [datetime.date(1975, 1, 1), datetime.date(2019, 1, 1)],
+            )
+
+    def test_export_parquet(self):
+        output = os.path.join(self.tmp.name, 'parquet')
+        paths = ArrowExporter(self.clone, output, processes=1).export()
+        self.assertEqual(
+            [os.path.basename(path) for path in paths],
+            ['500.parquet', '1000.parquet'],
+            )
+        table = pyarrow.parquet.read_table(output)
+        self.assertEqual(
+            sorted(table.column('control_number').to_pylist()),
+            [498, 499, 998, 999],
+            )
+
+    def test_export_arrow(self):
+        output = os.path.join(self.tmp.name, 'arrow')
+        paths = ArrowExporter(self.clone, output, format='arrow', processes=2).export()
+        with pyarrow.memory_map(paths[1]) as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+        self.assertEqual(table.column('control_number').to_pylist(), [998, 999])
+        with self.assertRaises(ValueError):
+            ArrowExporter(self.clone, output, format='csv')
@@ -0,0 +1,90 @@
+import os
+import tempfile
+from unittest import TestCase
+from pyinspirehep.contrib.fulltext import FullTextIndex
+from tests.helpers import write_clone
+
+
+def metadata(control_number, title, abstract='', keywords=()):
+    return {
+        'control_number': control_number,
+        'titles': [{'title': title}],
+        'abstracts': [{'value': abstract}] if abstract else None,
+        'keywords': [{'value': keyword} for keyword in keywords],
+        }
+
+
+class FullTextIndexTest(TestCase):
+
+    def setUp(self) -> None:
+        self.index = FullTextIndex()
+        self.index.add_records([
+            {'metadata': metadata(1, 'Axion dark matter', 'Searches for axions.')},
+            {'metadata': metadata(2, 'Neutrino masses', 'Dark matter is not discussed.')},
+            {'metadata': metadata(3, 'Lattice QCD', keywords=['axion', 'lattice'])},
+            ])
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.index.close()
+        return super().tearDown()
+
+    def test_search(self):
+        self.assertEqual(self.index.search('neutrino'), [2])
+        self.assertEqual(self.index.search('"dark matter"')[0], 1)
+        self.assertEqual(sorted(self.index.search('axion')), [1, 3])
+        self.assertEqual(self.index.search('keywords:lattice AND title:qcd'), [3])
+        self.assertEqual(self.index.search('axion', limit=1), [1])
+        results = self.index.search_with_scores('matter')
+        self.assertEqual(len(results), 2)
+        self.assertLessEqual(results[0][1], results[1][1])
+        self.assertEqual(
+            self.index.search('axion', weights=(0.0, 0.0, 10.0))[0],
+            3,
+            )
+
+    def test_incremental(self):
+        self.assertEqual(len(self.index), 3)
+        count = self.index.add_records([
+            {'metadata': metadata(1, 'Axion dark matter', 'Searches for axions.')},
+            {'metadata': metadata(2, 'Sterile neutrinos')},
+            ])
+        self.assertEqual(count, 1)
+        self.assertEqual(self.index.search('sterile'), [2])
+        self.assertEqual(self.index.search('masses'), [])
+        self.index.remove([1])
+        self.assertEqual(self.index.search('axion'), [3])
+        self.assertEqual(len(self.index), 2)
+
+    def test_duplicates(self):
+        record = {'metadata': metadata(4, 'Muon decays')}
+        index = FullTextIndex()
+        self.assertEqual(index.add_records([record, dict(record)]), 1)
+        self.assertEqual(index.search('muon'), [4])
+
+    def test_unchanged_texts(self):
+        record = {'metadata': metadata(1, 'Axion dark matter', 'Searches for axions.')}
+        record['metadata']['citation_count'] = 100
+        record['updated'] = '2024-01-01T00:00:00+00:00'
+        self.assertEqual(self.index.add_records([record]), 0)
+
+    def test_invalid_query(self):
+        with self.assertRaises(ValueError):
+            self.index.search('dark-matter')
+        self.assertEqual(sorted(self.index.search('"dark-matter"')), [1, 2])
+
+    def test_add_clone(self):
+        with tempfile.TemporaryDirectory() as directory:
+            write_clone(directory, {
+                '10.json': [metadata(5, 'Gravitational waves')],
+                '20.json': [metadata(12, 'Black hole waves')],
+                })
+            path = os.path.join(directory, 'index.sqlite')
+            index = FullTextIndex(path)
+            self.assertEqual(index.add_clone(directory, processes=1), 2)
+            self.assertEqual(index.add_clone(directory, processes=1), 0)
+            index.optimize()
+            index.close()
+            index = FullTextIndex(path)
+            self.assertEqual(sorted(index.search('waves')), [5, 12])
+            index.close()
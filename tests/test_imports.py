@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from unittest import TestCase
+import pyinspirehep
+
+
+class LazyImportTest(TestCase):
+
+    def test_import_is_lazy(self):
+        code = (
+            "import sys, pyinspirehep\n"
+            "print(' '.join(sorted(name for name in sys.modules "
+            "if name.startswith(('requests', 'pyinspirehep.')))))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            ).stdout.strip()
+        self.assertEqual(output, '')
+
+    def test_client_import_is_lazy(self):
+        code = (
+            "import sys, pyinspirehep.client\n"
+            "print(' '.join(sorted(name for name in sys.modules if name in ("
+            "'pyinspirehep.cache', 'pyinspirehep.instrumentation', "
+            "'pyinspirehep.scheduler', 'pyinspirehep.singleflight', "
+            "'pyinspirehep.transport'))))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            ).stdout.strip()
+        self.assertEqual(output, '')
+
+    def test_getattr(self):
+        from pyinspirehep.client import Client
+        self.assertIs(pyinspirehep.Client, Client)
+        self.assertIn('Client', dir(pyinspirehep))
+        with self.assertRaises(AttributeError):
+            pyinspirehep.Unknown
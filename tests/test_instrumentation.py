@@ -0,0 +1,118 @@
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from pyinspirehep.cache import ResponseCache
+from pyinspirehep.client import Client
+from pyinspirehep.exception import (
+    InspirehepPIDDoesNotExistError,
+    InspirehepServerError,
+)
+from pyinspirehep.instrumentation import (
+    MetricsCollector,
+    RequestObserver,
+)
+from pyinspirehep.retry import RetryPolicy
+from tests.helpers import fake_response
+
+
+class RecordingObserver(RequestObserver):
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def before_request(self, event):
+        self.calls.append(('before_request', event.identifier_type))
+
+    def after_response(self, event):
+        self.calls.append(('after_response', event.status_code))
+
+    def on_error(self, event):
+        self.calls.append(('on_error', type(event.error)))
+
+
+class InstrumentationTest(TestCase):
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.metrics = MetricsCollector(buckets=(0.1, 1.0))
+        self.client.add_observer(self.metrics)
+        return super().setUp()
+
+    @patch('requests.Session.get')
+    def test_hooks(self, get):
+        observer = RecordingObserver()
+        self.client.add_observer(observer)
+        get.return_value = fake_response(404, {'message': 'not found'})
+        with self.assertRaises(InspirehepPIDDoesNotExistError):
+            self.client.get_author('0')
+        self.assertEqual(
+            observer.calls,
+            [
+                ('before_request', 'authors'),
+                ('after_response', 404),
+                ('on_error', InspirehepPIDDoesNotExistError),
+            ],
+        )
+
+    @patch('requests.Session.get')
+    def test_metrics(self, get):
+        get.return_value = fake_response(200, {'id': '1'}, b'{"id": "1"}')
+        self.client.get_literature('1')
+        self.client.get_literature('2')
+        get.return_value = fake_response(429, {'message': 'wait'})
+        with self.assertRaises(Exception):
+            self.client.get_author('1')
+        summary = self.metrics.summary()
+        self.assertEqual(summary['requests'], {'literature': 2, 'authors': 1})
+        self.assertEqual(summary['bytes_received'], 2 * 11 + 2)
+        self.assertEqual(summary['too_many_requests'], 1)
+        self.assertEqual(summary['errors'], {'InspirehepTooManyRequestsError': 1})
+        self.assertEqual(summary['cache_hit_ratio'], 0.0)
+        self.assertEqual(self.metrics.cache_misses, 0)
+
+    @patch('requests.Session.get')
+    def test_retries_and_cache_misses(self, get):
+        get.side_effect = [
+            fake_response(500, {'message': 'error'}),
+            fake_response(200, {'id': '1'}),
+            ]
+        with tempfile.TemporaryDirectory() as directory:
+            client = Client(
+                cache=ResponseCache(directory),
+                retry_policies={
+                    InspirehepServerError: RetryPolicy(max_retries=2, backoff=0),
+                    },
+                )
+            client.add_observer(self.metrics)
+            self.assertEqual(client.get_literature('1'), {'id': '1'})
+            self.assertEqual(client.get_literature('1'), {'id': '1'})
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(self.metrics.cache_misses, 1)
+        self.assertEqual(self.metrics.cache_hits, 1)
+        self.assertEqual(self.metrics.cache_hit_ratio, 0.5)
+        self.assertEqual(self.metrics.retries, {'InspirehepServerError': 1})
+        self.assertIn(
+            'pyinspirehep_retries_total{error="InspirehepServerError"} 1',
+            self.metrics.to_prometheus(),
+        )
+
+    @patch('requests.Session.get')
+    def test_bytes_received_by_content_length(self, get):
+        response = fake_response(200, {'id': '1'}, b'{"id": "1"}')
+        response.headers = {'Content-Length': '7'}
+        get.return_value = response
+        self.client.get_literature('1')
+        self.assertEqual(self.metrics.bytes_received, 7)
+
+    @patch('requests.Session.get')
+    def test_to_prometheus(self, get):
+        get.return_value = fake_response(200, {'id': '1'})
+        self.client.get_literature('1')
+        text = self.metrics.to_prometheus()
+        self.assertIn(
+            'pyinspirehep_request_duration_seconds_bucket'
+            '{identifier_type="literature",le="+Inf"} 1',
+            text,
+        )
+        self.assertIn('pyinspirehep_responses_total{status_code="200"} 1', text)
+        self.assertIn('pyinspirehep_received_bytes_total 2', text)
@@ -1,11 +1,13 @@
 import os
 from pathlib import Path
-from datetime import date
 import json
+import logging
 from unittest import TestCase
 from pyinspirehep.literature import (
     Literature,
     LiteratureMetadata,
+    ReferenceStats,
+    get_literatures_references_ids,
     )
 
 
@@ -28,6 +30,13 @@ class LiteratureTest(TestCase):
     def test_get_citation_count(self):
         self.assertEqual(self.literature.get_citation_count(), 26)
 
+    def test_metadata_without_control_number(self):
+        # Records of searches with `fields` may not have a control number.
+        metadata = LiteratureMetadata.from_dict({'citation_count': 3})
+        self.assertIsNone(metadata.control_number)
+        self.assertEqual(metadata.citation_count, 3)
+        self.assertIsNone(LiteratureMetadata.from_dict(None).control_number)
+
     def test_get_references_ids(self):
         self.assertSetEqual(
             set(self.literature.get_references_ids()),
@@ -85,3 +94,57 @@ class LiteratureTest(TestCase):
              '1699055',
              '1468075'])
         )
+
+    def create_literature(self, references, control_number=1):
+        return Literature(
+            id=str(control_number),
+            metadata=LiteratureMetadata.from_dict(dict(
+                METADATA_SAMPLE,
+                control_number=control_number,
+                references=references,
+                )),
+            )
+
+    def test_get_references_ids_stats(self):
+        literature = self.create_literature([
+            {'record': {'$ref': 'https://inspirehep.net/api/literature/3438'}},
+            {'reference': {'arxiv_eprint': 'hep-ph/0011376'}},
+            {'record': None},
+            ])
+        stats = ReferenceStats()
+        # assertNoLogs needs Python 3.10, so a sentinel is logged instead.
+        with self.assertLogs(level='WARNING') as logs:
+            self.assertEqual(literature.get_references_ids(stats), ['3438'])
+            logging.warning('sentinel')
+        self.assertEqual(logs.output, ['WARNING:root:sentinel'])
+        self.assertEqual(stats.references, 3)
+        self.assertEqual(stats.unresolved, 2)
+        self.assertEqual(stats.resolved, 1)
+        self.assertEqual(stats.papers_with_unresolved, 1)
+
+    def test_sampled_log(self):
+        literature = self.create_literature([{'reference': {}}] * 3)
+        stats = ReferenceStats(log_every=4)
+        with self.assertLogs(level='WARNING') as logs:
+            for _ in range(3):
+                literature.get_references_ids(stats)
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn('6 of 6 references', logs.output[0])
+        self.assertIn('9 of 9 references', logs.output[1])
+
+    def test_get_literatures_references_ids(self):
+        literatures = [
+            self.literature,
+            self.create_literature([{'reference': {}}], control_number=2),
+            self.create_literature(None, control_number=3),
+            ]
+        stats = ReferenceStats()
+        columns = get_literatures_references_ids(literatures, stats)
+        self.assertEqual(columns['control_number'], [1713040, 2, 3])
+        self.assertEqual(
+            columns['references_ids'][0],
+            self.literature.get_references_ids(),
+            )
+        self.assertEqual(columns['references_ids'][1:], [[], []])
+        self.assertEqual(stats.papers, 2)
+        self.assertEqual(stats.unresolved, 1)
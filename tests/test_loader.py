@@ -0,0 +1,90 @@
+import datetime
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from pyinspirehep.contrib.loader import CloneLoader
+from pyinspirehep.literature import Literature
+from tests.helpers import (
+    METADATA_SAMPLE,
+    TemporaryDirectoryTestCase,
+)
+
+
+def count_citations(records):
+    return sum(record.get_citation_count() for record in records)
+
+
+class CloneLoaderTest(TemporaryDirectoryTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        for number, size in ((500, 2), (1000, 3), (1500, 1)):
+            collection = [
+                {'id': str(i), 'metadata': dict(METADATA_SAMPLE, control_number=i)}
+                for i in range(number - size, number)
+                ]
+            with open(os.path.join(self.tmp.name, f'{number}.json'), 'w') as f:
+                json.dump(collection, f)
+
+    def test_files(self):
+        loader = CloneLoader(self.tmp.name)
+        self.assertEqual(
+            [os.path.basename(path) for path in loader.files()],
+            ['500.json', '1000.json', '1500.json'],
+        )
+
+    def test_iter_records(self):
+        loader = CloneLoader(self.tmp.name, processes=1)
+        batches = list(loader.iter_records())
+        self.assertEqual([len(batch) for batch in batches], [2, 3, 1])
+        self.assertIsInstance(batches[0][0], Literature)
+
+    def test_iter_records_with_partial_dates(self):
+        with open(os.path.join(self.tmp.name, '2000.json'), 'w') as f:
+            json.dump([{'id': '1999', 'metadata': dict(
+                METADATA_SAMPLE,
+                control_number=1999,
+                earliest_date='1975',
+                )}], f)
+        loader = CloneLoader(self.tmp.name, processes=1)
+        record = list(loader.iter_records())[-1][0]
+        self.assertEqual(record.metadata.earliest_date, datetime.date(1975, 1, 1))
+
+    def test_map_bounds_pending_files(self):
+        submitted = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+
+            def submit(self, func, *args):
+                submitted.append(args[0])
+                return super().submit(func, *args)
+
+        with patch('concurrent.futures.ProcessPoolExecutor', RecordingExecutor):
+            results = CloneLoader(self.tmp.name, processes=2)._map(str, range(20))
+            self.assertEqual(next(results), '0')
+            self.assertEqual(len(submitted), 5)
+            self.assertEqual(list(results), [str(i) for i in range(1, 20)])
+        self.assertEqual(submitted, list(range(20)))
+
+    def test_iter_columns(self):
+        loader = CloneLoader(self.tmp.name, processes=2)
+        batches = list(loader.iter_columns('control_number', 'citation_count'))
+        self.assertEqual(
+            batches[1],
+            {'control_number': [997, 998, 999], 'citation_count': [26, 26, 26]},
+        )
+
+    def test_iter_columns_unknown_field(self):
+        loader = CloneLoader(self.tmp.name)
+        with self.assertRaises(ValueError):
+            loader.iter_columns('not_a_field')
+
+    def test_reduce(self):
+        loader = CloneLoader(self.tmp.name, processes=2)
+        total = loader.reduce(
+            count_citations,
+            lambda total, count: total + count,
+            initial=0,
+            )
+        self.assertEqual(total, 6 * 26)
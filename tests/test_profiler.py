@@ -0,0 +1,31 @@
+import json
+import os
+from pyinspirehep.contrib.profiler import ParseProfiler
+from tests.helpers import (
+    METADATA_SAMPLE,
+    TemporaryDirectoryTestCase,
+)
+
+
+class ParseProfilerTest(TemporaryDirectoryTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        with open(os.path.join(self.tmp.name, '500.json'), 'w') as f:
+            json.dump([{'id': '1', 'metadata': METADATA_SAMPLE}] * 3, f)
+
+    def test_run(self):
+        profiler = ParseProfiler(self.tmp.name)
+        report = {profile.attribute: profile for profile in profiler.run()}
+        self.assertEqual(profiler.records, 3)
+        self.assertEqual(report['references'].present, 3)
+        self.assertEqual(
+            report['references'].payload_bytes,
+            3 * len(json.dumps(METADATA_SAMPLE['references'])),
+        )
+        self.assertGreater(report['references'].memory, report['citation_count'].memory)
+        self.assertGreater(
+            report['references'].parse_time,
+            report['citation_count'].parse_time,
+        )
+        self.assertIn('references', profiler.format_report())
@@ -0,0 +1,62 @@
+import datetime
+from unittest import TestCase
+from pyinspirehep.client import Client
+from pyinspirehep.query import (
+    And,
+    DateRange,
+    Not,
+    Or,
+    Range,
+    RefersTo,
+    Term,
+)
+
+
+class QueryTest(TestCase):
+
+    def test_compile(self):
+        query = And(
+            Term('t', 'dark matter'),
+            Or.of('a', ['E.Witten.1', 'J.M.Maldacena.1']),
+            Not(Term('document_type', 'thesis')),
+            DateRange('de', datetime.date(2020, 1, 1), datetime.date(2020, 12, 31)),
+            )
+        self.assertEqual(
+            query.compile(),
+            't:"dark matter" and (a:E.Witten.1 or a:J.M.Maldacena.1) and '
+            'not document_type:thesis and de:2020-01-01->2020-12-31',
+        )
+
+    def test_flatten(self):
+        query = Term('a', 1) | Term('a', 2) | Term('a', 3)
+        self.assertEqual(len(query.queries), 3)
+
+    def test_split_by_length(self):
+        query = Or.of('control_number', range(1000, 1100))
+        chunks = query.split(max_length=200)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunk.url_length() <= 200 for chunk in chunks))
+        self.assertEqual(
+            [term for chunk in chunks for term in chunk.queries],
+            query.queries,
+        )
+
+    def test_split_too_long(self):
+        with self.assertRaises(ValueError):
+            Or.of('t', ['x' * 100]).split(max_length=50)
+
+    def test_range_split(self):
+        self.assertEqual(
+            Range('control_number', 0, 999).split(500),
+            [Range('control_number', 0, 499), Range('control_number', 500, 999)],
+        )
+
+    def test_client_params(self):
+        self.assertEqual(
+            Client._create_params(q=RefersTo(1785369), size=10),
+            {'size': 10, 'q': 'refersto:recid:1785369'},
+        )
+        self.assertEqual(
+            Client._create_q('name', 'value', 'Ebadi, Javad'),
+            'name.value:Ebadi, Javad',
+        )
@@ -0,0 +1,160 @@
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from pyinspirehep.contrib.references import (
+    ReferenceCache,
+    ReferenceResolver,
+    reference_keys,
+    unresolved_keys,
+)
+from pyinspirehep.literature import Literature
+from tests.helpers import METADATA_SAMPLE
+
+
+# Literature records found by the fake search, by control number.
+INDEX = {
+    10: {'dois': [{'value': '10.1103/PhysRevLett.37.8'}]},
+    11: {'arxiv_eprints': [{'value': 'hep-ph/0011376'}]},
+    }
+
+
+def fake_search(*fields, size=10, page=1, q=None):
+    hits = []
+    for control_number, metadata in INDEX.items():
+        keys = reference_keys({'reference': {
+            'dois': [doi['value'] for doi in metadata.get('dois', ())],
+            'arxiv_eprint': (metadata.get('arxiv_eprints') or [{}])[0].get('value'),
+            }})
+        if any(key.split(':', 1)[1] in str(q) for key in keys):
+            hits.append({'metadata': dict(metadata, control_number=control_number)})
+    return {
+        'hits': {'hits': hits[(page - 1) * size:page * size], 'total': len(hits)},
+        }
+
+
+def paper(references):
+    return {'metadata': dict(METADATA_SAMPLE, references=references)}
+
+
+REFERENCES = [
+    {'record': {'$ref': 'https://inspirehep.net/api/literature/3438'}},
+    {'reference': {'dois': ['10.1103/PhysRevLett.37.8']}},
+    {'reference': {'arxiv_eprint': 'arXiv:hep-ph/0011376'}},
+    {'reference': {'dois': ['10.1000/missing']}},
+    {'reference': {'title': {'title': 'No identifier'}}},
+    ]
+
+
+class ReferenceResolverTest(TestCase):
+
+    def create_resolver(self, cache_path=':memory:'):
+        client = MagicMock()
+        client.search_literature.side_effect = fake_search
+        return ReferenceResolver(client, cache_path=cache_path, batch_size=2)
+
+    def test_unresolved_keys(self):
+        self.assertEqual(
+            unresolved_keys([paper(REFERENCES)]),
+            {
+                'doi:10.1103/physrevlett.37.8',
+                'arxiv:hep-ph/0011376',
+                'doi:10.1000/missing',
+            },
+            )
+
+    def test_resolve_in_batches(self):
+        resolver = self.create_resolver()
+        resolved = resolver.resolve_records([paper(REFERENCES), paper(REFERENCES[1:3])])
+        self.assertEqual(resolved, {
+            'doi:10.1103/physrevlett.37.8': 10,
+            'arxiv:hep-ph/0011376': 11,
+            })
+        self.assertEqual(resolver.client.search_literature.call_count, 2)
+        self.assertEqual(len(resolver.cache), 3)
+        resolver.resolve_records([paper(REFERENCES)])
+        self.assertEqual(resolver.client.search_literature.call_count, 2)
+
+    def test_persistent_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'references.sqlite')
+            resolver = self.create_resolver(path)
+            resolver.resolve_records([paper(REFERENCES)])
+            resolver.cache.close()
+            resolver = self.create_resolver(path)
+            self.assertEqual(
+                resolver.resolve(['doi:10.1103/physrevlett.37.8']),
+                {'doi:10.1103/physrevlett.37.8': 10},
+                )
+            resolver.client.search_literature.assert_not_called()
+            resolver.cache.close()
+
+    def test_resolve_clone(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, '1000.json'), 'w') as f:
+                json.dump([paper(REFERENCES)], f)
+            resolver = self.create_resolver()
+            self.assertEqual(len(resolver.resolve_clone(directory, processes=1)), 2)
+
+    def test_get_references_ids(self):
+        resolver = self.create_resolver()
+        resolver.resolve_records([paper(REFERENCES)])
+        literature = Literature.from_response(dict(paper(REFERENCES), id='1'))
+        self.assertEqual(
+            resolver.get_references_ids(literature),
+            ['3438', '10', '11'],
+            )
+
+    def test_paginate_search(self):
+        resolver = self.create_resolver()
+        hits = [
+            {'metadata': dict(metadata, control_number=control_number)}
+            for control_number, metadata in INDEX.items()
+            ]
+        # One hit per page, like a search whose results exceed a page.
+        resolver.client.search_literature.side_effect = (
+            lambda *fields, size=10, page=1, q=None: {
+                'hits': {'hits': hits[page - 1:page], 'total': len(hits)},
+                }
+            )
+        self.assertEqual(resolver.resolve_records([paper(REFERENCES)]), {
+            'doi:10.1103/physrevlett.37.8': 10,
+            'arxiv:hep-ph/0011376': 11,
+            })
+
+    def test_not_found_ttl(self):
+        resolver = self.create_resolver()
+        resolver.resolve(['doi:10.1000/missing'])
+        resolver.resolve(['doi:10.1000/missing'])
+        self.assertEqual(resolver.client.search_literature.call_count, 1)
+        resolver.cache.not_found_ttl = 0
+        time.sleep(0.01)
+        resolver.resolve(['doi:10.1000/missing'])
+        self.assertEqual(resolver.client.search_literature.call_count, 2)
+        resolver.resolve(['doi:10.1103/physrevlett.37.8'])
+        resolver.resolve(['doi:10.1103/physrevlett.37.8'])
+        self.assertEqual(resolver.client.search_literature.call_count, 3)
+
+    def test_cache_without_checked_column(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'references.sqlite')
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE reference "
+                    "(key TEXT PRIMARY KEY, control_number INTEGER)"
+                )
+                connection.execute(
+                    "INSERT INTO reference VALUES ('doi:10.1000/missing', NULL)")
+            connection.close()
+            cache = ReferenceCache(path, not_found_ttl=60)
+            self.assertEqual(cache.get_many(['doi:10.1000/missing']), {})
+            cache.set_many({'doi:10.1000/missing': None})
+            self.assertEqual(
+                cache.get_many(['doi:10.1000/missing']),
+                {'doi:10.1000/missing': None},
+                )
+            cache.close()
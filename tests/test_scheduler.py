@@ -0,0 +1,132 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+from pyinspirehep.client import Client
+from pyinspirehep.limiter import RateLimiter
+from pyinspirehep.scheduler import (
+    BULK,
+    INTERACTIVE,
+    RequestScheduler,
+)
+from tests.helpers import fake_response
+
+
+class GateLimiter:
+    """Limiter which gives tokens only when it is open.
+
+    The order of the tokens is recorded by thread names.
+    """
+
+    def __init__(self):
+        self.open = False
+        self.order = []
+
+    def try_acquire(self):
+        if self.open:
+            self.order.append(threading.current_thread().name)
+        return self.open
+
+    def delay(self):
+        return 0.005
+
+
+class RequestSchedulerTest(TestCase):
+
+    def queue_requests(self, scheduler, priorities):
+        threads = []
+        for priority in priorities:
+            thread = threading.Thread(
+                target=scheduler.acquire,
+                args=(priority,),
+                name=priority,
+                )
+            thread.start()
+            threads.append(thread)
+            # Requests of each priority are queued in order.
+            while sum(scheduler.waiting().values()) < len(threads):
+                time.sleep(0.001)
+        return threads
+
+    def test_weighted_fair_queuing(self):
+        limiter = GateLimiter()
+        scheduler = RequestScheduler(limiter)
+        threads = self.queue_requests(scheduler, [BULK] * 9 + [INTERACTIVE] * 9)
+        limiter.open = True
+        for thread in threads:
+            thread.join()
+        self.assertEqual(limiter.order[:10].count(INTERACTIVE), 9)
+        self.assertIn(BULK, limiter.order[:2])
+        self.assertEqual(scheduler.granted, {INTERACTIVE: 9, BULK: 9})
+
+    def test_interactive_jumps_ahead(self):
+        limiter = GateLimiter()
+        scheduler = RequestScheduler(limiter)
+        limiter.open = True
+        scheduler.acquire(BULK)
+        limiter.open = False
+        threads = self.queue_requests(scheduler, [BULK] * 5 + [INTERACTIVE])
+        limiter.open = True
+        for thread in threads:
+            thread.join()
+        self.assertEqual(limiter.order[1], INTERACTIVE)
+
+    def test_unknown_priority(self):
+        scheduler = RequestScheduler(RateLimiter(rate=1000))
+        with self.assertRaises(ValueError):
+            scheduler.acquire('urgent')
+        with self.assertRaises(ValueError):
+            RequestScheduler(RateLimiter(rate=1000), {BULK: 0})
+
+    def test_shared_rate_limit(self):
+        scheduler = RequestScheduler(RateLimiter(rate=100, burst=1))
+        start = time.monotonic()
+        threads = [
+            threading.Thread(target=scheduler.acquire, args=(priority,))
+            for priority in [BULK, INTERACTIVE] * 3
+            ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.monotonic() - start, 0.045)
+
+
+class ClientPriorityTest(TestCase):
+
+    def test_priority(self):
+        client = Client(rate_limit=1000)
+        with patch.object(client.session, 'get') as get:
+            get.return_value = fake_response(200, {'id': '1'})
+            client.get_literature('1')
+            with client.priority(BULK):
+                self.assertEqual(client._get_priority(), BULK)
+                client.get_literature('1')
+                list(client.map(client.get_literature, ['1', '2']))
+            self.assertEqual(client._get_priority(), INTERACTIVE)
+        self.assertEqual(client.scheduler.granted, {INTERACTIVE: 1, BULK: 3})
+        with self.assertRaises(ValueError):
+            with client.priority('urgent'):
+                pass
+
+    def test_custom_priorities(self):
+        client = Client(rate_limit=1000, priorities={'urgent': 4, 'batch': 1})
+        self.assertEqual(client.default_priority, 'urgent')
+        self.assertEqual(client.bulk_priority, 'batch')
+        with patch.object(client.session, 'get') as get:
+            get.return_value = fake_response(200, {'id': '1'})
+            client.get_literature('1')
+            with client.priority(client.bulk_priority):
+                client.get_literature('1')
+        self.assertEqual(client.scheduler.granted, {'urgent': 1, 'batch': 1})
+        with self.assertRaises(ValueError):
+            Client(priorities={'urgent': 0})
+
+    def test_priority_without_rate_limit(self):
+        client = Client()
+        self.assertIsNone(client.scheduler)
+        with client.priority(BULK):
+            self.assertEqual(client._get_priority(), BULK)
+        with self.assertRaises(ValueError):
+            with client.priority('urgent'):
+                pass
@@ -0,0 +1,105 @@
+import os
+from pyinspirehep.contrib.diff import (
+    ADDED,
+    CHANGED,
+    diff_snapshots,
+    record_hash,
+)
+from pyinspirehep.contrib.store import RecordStore
+from tests.helpers import (
+    TemporaryDirectoryTestCase,
+    write_clone,
+)
+
+
+def records(*items):
+    return [{'metadata': dict(control_number=cn, titles=[title])} for cn, title in items]
+
+
+class RecordStoreTest(TemporaryDirectoryTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = os.path.join(self.tmp.name, 'store')
+
+    def count_objects(self):
+        return sum(
+            len(files) for _, _, files in os.walk(os.path.join(self.directory, 'objects'))
+            )
+
+    def test_deduplicated_snapshots(self):
+        store = RecordStore(self.directory, compression='gzip')
+        first = store.add_snapshot('1', records((2, 'b'), (1, 'a'), (3, 'c')))
+        self.assertEqual(first, {'records': 3, 'new': 3})
+        second = store.add_snapshot('2', records((1, 'a'), (2, 'B'), (3, 'c'), (4, 'd')))
+        self.assertEqual(second, {'records': 4, 'new': 2})
+        self.assertEqual(self.count_objects(), 5)
+        self.assertEqual(store.snapshots(), ['1', '2'])
+        manifest = list(store.manifest('1'))
+        self.assertEqual([cn for cn, _ in manifest], [1, 2, 3])
+        self.assertEqual(manifest[0][1], record_hash(records((1, 'a'))[0]))
+        self.assertEqual(
+            list(store.snapshot('2').iter_records()),
+            records((1, 'a'), (2, 'B'), (3, 'c'), (4, 'd')),
+            )
+        changes = diff_snapshots(store.snapshot('1'), store.snapshot('2'))
+        self.assertEqual(
+            [(change.operation, change.control_number) for change in changes],
+            [(CHANGED, 2), (ADDED, 4)],
+            )
+
+    def test_reopen_and_collect_garbage(self):
+        RecordStore(self.directory, compression='gzip').add_snapshot(
+            '1', records((1, 'a'), (2, 'b')),
+            )
+        store = RecordStore(self.directory)
+        self.assertEqual(store.compression, 'gzip')
+        store.add_snapshot('2', records((1, 'a')))
+        store.remove_snapshot('1')
+        tmp_path = os.path.join(self.directory, 'objects', 'ab', 'tmpx.tmp')
+        os.makedirs(os.path.dirname(tmp_path), exist_ok=True)
+        open(tmp_path, 'wb').close()
+        self.assertEqual(store.collect_garbage(), 1)
+        self.assertTrue(os.path.isfile(tmp_path))
+        self.assertEqual(list(store.snapshot('2').iter_records()), records((1, 'a')))
+        with self.assertRaises(ValueError):
+            list(store.manifest('1'))
+
+    def test_conflicting_compression(self):
+        RecordStore(self.directory, compression='gzip')
+        self.assertEqual(
+            RecordStore(self.directory, compression='gzip').compression,
+            'gzip',
+            )
+        with self.assertRaises(ValueError):
+            RecordStore(self.directory, compression='zstd')
+
+    def test_add_clone(self):
+        clone = os.path.join(self.tmp.name, 'clone')
+        write_clone(clone, {
+            '10.json': [{'control_number': 5}, {'control_number': 1}],
+            '20.json': [{'control_number': 12}],
+            })
+        store = RecordStore(self.directory)
+        self.assertEqual(
+            store.add_clone('1', clone, processes=1),
+            {'records': 3, 'new': 3},
+            )
+        self.assertEqual(store.add_clone('2', clone, processes=2)['new'], 0)
+        self.assertEqual(list(diff_snapshots(clone, store.snapshot('2'))), [])
+
+    def test_repeated_control_numbers(self):
+        clone = os.path.join(self.tmp.name, 'clone')
+        write_clone(clone, {
+            '20.json': [{'control_number': 10}, {'control_number': 12}],
+            '10.json': [
+                {'control_number': 1},
+                {'control_number': 10},
+                {'control_number': 10},
+                ],
+            })
+        store = RecordStore(self.directory)
+        self.assertEqual(store.add_clone('1', clone, processes=1)['records'], 3)
+        self.assertEqual([cn for cn, _ in store.manifest('1')], [1, 10, 12])
+        self.assertEqual(list(diff_snapshots(clone, store.snapshot('1'))), [])
+        self.assertEqual(list(diff_snapshots(store.snapshot('1'), clone)), [])
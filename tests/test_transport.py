@@ -0,0 +1,46 @@
+from unittest import (
+    TestCase,
+    skipUnless,
+)
+import requests
+from benchmarks.mock_server import MockInspireServer
+from pyinspirehep.client import Client
+from pyinspirehep.exception import (
+    InspirehepConnectionError,
+    InspirehepPIDDoesNotExistError,
+)
+from pyinspirehep.literature import Literature
+from pyinspirehep.transport import (
+    HTTP2Session,
+    httpx,
+)
+
+
+@skipUnless(httpx is not None, "httpx is not installed")
+class HTTP2SessionTest(TestCase):
+
+    def test_create_timeout(self):
+        timeout = HTTP2Session._create_timeout((3, 30))
+        self.assertEqual(timeout.connect, 3)
+        self.assertEqual(timeout.read, 30)
+
+    def test_client_with_http2(self):
+        with MockInspireServer() as server:
+            client = Client(http2=True)
+            client.REST_API_URL = server.url
+            self.assertIsInstance(client.session, HTTP2Session)
+            paper = client.get_literature_object('12')
+            self.assertIsInstance(paper, Literature)
+            self.assertEqual(paper.get_control_number(), 12)
+            with self.assertRaises(InspirehepPIDDoesNotExistError):
+                client.get_literature('not-a-number')
+            client.session.close()
+
+    def test_connection_error(self):
+        session = HTTP2Session()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            session.get('http://127.0.0.1:1/api/literature/1', timeout=1)
+        client = Client(http2=True)
+        client.REST_API_URL = 'http://127.0.0.1:1/api/'
+        with self.assertRaises(InspirehepConnectionError):
+            client.get_literature('1')